@@ -10,21 +10,88 @@ import os
 import re
 import ssl
 import sys
+import gzip
+import hashlib
+import zlib
 import json
+import time
+import random
+import copy
 import base64
 import logging
+import functools
+import threading
+import uuid
+import http.client
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
-from urllib.request import Request, urlopen
+from typing import Optional, Dict, Any, Callable, Iterator, List, Mapping, Tuple, TypeVar, Union
+from urllib.request import Request, getproxies, proxy_bypass
+from urllib.request import urlopen as _urllib_urlopen
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode, urljoin, urlparse, urlunparse
+from urllib.parse import urlencode, urljoin, urlsplit
 
-# Try to use certifi for SSL certificates (more reliable than system certs on macOS)
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Return the SSL context shared by all connections, creating it on first use.
+
+    Importing certifi and loading a CA bundle takes tens of milliseconds, so
+    this is deferred until a request is actually sent instead of being paid
+    by every script invocation at import time.
+    """
+    # Try to use certifi for SSL certificates (more reliable than system certs on macOS)
+    try:
+        import certifi
+        return ssl.create_default_context(cafile=certifi.where())
+    except ImportError:
+        return ssl.create_default_context()
+
+
+def __getattr__(name: str) -> Any:
+    # SSL_CONTEXT used to be built at import; keep it readable as an attribute
+    if name == "SSL_CONTEXT":
+        return _ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Try to use orjson for parsing responses and encoding request bodies (several
+# times faster than json on large result sets). Both loads accept bytes or str
+# and raise ValueError subclasses. orjson only takes 64-bit integers, so
+# _json_encode falls back to json for anything it rejects.
 try:
-    import certifi
-    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_encode(data: Any) -> bytes:
+        """Serialize data compactly, for request bodies."""
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(data).encode()
 except ImportError:
-    SSL_CONTEXT = ssl.create_default_context()
+    _json_loads = json.loads
+
+    def _json_encode(data: Any) -> bytes:
+        """Serialize data compactly, for request bodies."""
+        return json.dumps(data).encode()
+
+
+def _json_dumps(data: Any) -> str:
+    """
+    Serialize data with two-space indentation, for CLI output.
+
+    Always uses json, so the output is the same whether or not orjson is
+    installed: ASCII-escaped, with json's float formatting.
+    """
+    return json.dumps(data, indent=2)
 
 
 # Configure logger for this module
@@ -35,58 +102,185 @@ logger = logging.getLogger(__name__)
 # Error Handling Classes
 # =============================================================================
 
+# Sentinel marking a lazily-computed attribute that has not been computed yet
+_UNSET = object()
+
+
 class ServiceNowError(Exception):
-    """Base exception for ServiceNow API errors."""
+    """
+    Base exception for ServiceNow API errors.
+
+    Each subclass has a stable machine-readable code, included in to_dict(),
+    so callers can branch on the kind of failure without matching messages.
+    """
+
+    code = "api_error"
 
     def __init__(self, message: str, status_code: Optional[int] = None,
-                 response_body: Optional[str] = None):
+                 response_body: Optional[Union[str, bytes]] = None,
+                 headers: Optional[Mapping[str, str]] = None):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
         self.response_body = response_body
+        self.headers = headers if headers is not None else {}
+        self._parsed_body: Any = _UNSET
+
+    @property
+    def response_body(self) -> Optional[str]:
+        """The error response body as text.
+
+        The client passes the raw bytes read from the HTTP error; they are
+        only decoded if something actually looks at the body.
+        """
+        if isinstance(self._response_body, bytes):
+            self._response_body = self._response_body.decode("utf-8", errors="replace")
+        return self._response_body
+
+    @response_body.setter
+    def response_body(self, value: Optional[Union[str, bytes]]) -> None:
+        self._response_body = value
+        self._parsed_body = _UNSET
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds the server asked us to wait (Retry-After header), if any."""
+        return _parse_retry_after(self.headers.get("Retry-After"))
+
+    def _get_details(self) -> Any:
+        """Return the response body parsed as JSON, or raw if it is not JSON.
+
+        The parse happens at most once per exception instance, since the same
+        error is often serialized more than once (logged, then reported).
+        """
+        if self._parsed_body is _UNSET:
+            try:
+                self._parsed_body = _json_loads(self.response_body)
+            except (ValueError, TypeError):
+                self._parsed_body = self.response_body
+        return self._parsed_body
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON serialization."""
-        result = {"error": self.message}
+        result = {"error": self.message, "code": self.code}
         if self.status_code:
             result["status_code"] = self.status_code
         if self.response_body:
-            try:
-                result["details"] = json.loads(self.response_body)
-            except json.JSONDecodeError:
-                result["details"] = self.response_body
+            result["details"] = self._get_details()
         return result
 
 
 class AuthenticationError(ServiceNowError):
     """Raised when authentication fails."""
-    pass
+
+    code = "authentication_failed"
 
 
 class ConfigurationError(ServiceNowError):
     """Raised when required configuration is missing or invalid."""
-    pass
+
+    code = "configuration_error"
 
 
 class NotFoundError(ServiceNowError):
     """Raised when a requested resource is not found."""
-    pass
+
+    code = "not_found"
 
 
 class RateLimitError(ServiceNowError):
     """Raised when API rate limit is exceeded."""
-    pass
+
+    code = "rate_limited"
+
+
+class NetworkError(ServiceNowError):
+    """Raised when the ServiceNow instance cannot be reached."""
+
+    code = "connection_error"
 
 
 class ValidationError(ServiceNowError):
     """Raised when request validation fails."""
-    pass
+
+    code = "validation_error"
+
+
+# HTTP status codes with a dedicated exception class and message. Any other
+# error status is raised as a plain ServiceNowError.
+_HTTP_ERRORS = {
+    400: (ValidationError, "Invalid request"),
+    401: (AuthenticationError, "Authentication failed"),
+    403: (AuthenticationError, "Access forbidden - insufficient permissions"),
+    404: (NotFoundError, "Resource not found"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
+
+
+def _error_for_status(status_code: int, reason: str,
+                      response_body: Optional[Union[str, bytes]] = None,
+                      headers: Optional[Mapping] = None) -> ServiceNowError:
+    """Build the exception matching an HTTP error status."""
+    error_class, message = _HTTP_ERRORS.get(
+        status_code, (ServiceNowError, f"API request failed: {reason}")
+    )
+    return error_class(message, status_code=status_code, response_body=response_body,
+                       headers=headers)
+
+
+# Methods that are safe to resend after a server error or dropped connection.
+# Rate-limited (429) requests are retried for any method, since the server
+# rejected them without processing.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a delay in seconds.
+
+    The header is either a number of seconds or an HTTP date. Returns None
+    if the header is missing or cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 # =============================================================================
 # Environment Loading
 # =============================================================================
 
+# Escape sequences recognised inside quoted env values, keyed by the quote
+# character. Each quote style may escape itself but not the other one.
+_ESCAPE_SEQUENCES = {
+    "\\": "\\",
+    '"': '"',
+    "'": "'",
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+}
+_QUOTED_ESCAPE_PATTERNS = {
+    '"': re.compile(r'\\([\\"ntr])'),
+    "'": re.compile(r"\\([\\'ntr])"),
+}
+
+
+def _replace_escape(match: "re.Match[str]") -> str:
+    """Map a single escape-sequence match to its unescaped character."""
+    return _ESCAPE_SEQUENCES[match.group(1)]
+
+
 def _parse_quoted_value(value: str) -> str:
     """
     Parse a quoted value, handling escaped quotes and common escape sequences.
@@ -109,33 +303,32 @@ def _parse_quoted_value(value: str) -> str:
     if not value:
         return value
 
-    # Check for double-quoted strings
-    if value.startswith('"') and value.endswith('"') and len(value) >= 2:
-        # Remove outer quotes and process escaped characters
-        inner = value[1:-1]
-        # Handle escape sequences (order matters: backslash first, then others)
-        inner = inner.replace('\\\\', '\x00')  # Temporarily replace escaped backslash
-        inner = inner.replace('\\"', '"')
-        inner = inner.replace('\\n', '\n')
-        inner = inner.replace('\\t', '\t')
-        inner = inner.replace('\\r', '\r')
-        inner = inner.replace('\x00', '\\')  # Restore backslash
-        return inner
+    # Fast path: most values are unquoted, so skip the escape machinery
+    quote = value[0]
+    if quote not in _QUOTED_ESCAPE_PATTERNS or len(value) < 2 or value[-1] != quote:
+        return value
 
-    # Check for single-quoted strings
-    if value.startswith("'") and value.endswith("'") and len(value) >= 2:
-        # Remove outer quotes and process escaped characters
-        inner = value[1:-1]
-        # Handle escape sequences (order matters: backslash first, then others)
-        inner = inner.replace('\\\\', '\x00')  # Temporarily replace escaped backslash
-        inner = inner.replace("\\'", "'")
-        inner = inner.replace('\\n', '\n')
-        inner = inner.replace('\\t', '\t')
-        inner = inner.replace('\\r', '\r')
-        inner = inner.replace('\x00', '\\')  # Restore backslash
+    inner = value[1:-1]
+    if "\\" not in inner:
         return inner
 
-    return value
+    # Resolve escapes in a single left-to-right pass, so an escaped
+    # backslash never pairs with the next character
+    return _QUOTED_ESCAPE_PATTERNS[quote].sub(_replace_escape, inner)
+
+
+# One KEY=VALUE assignment per line. The key starts at the first non-blank
+# character, which must not be "#" (comment) or "=" (empty key), and runs up to
+# the first "="; surrounding blanks are not part of the key or the match.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^\s#=][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
+
+
+def _default_env_paths() -> List[Path]:
+    """Return the standard env file locations, in search order."""
+    return [
+        Path.home() / ".claude" / "env",
+        Path.cwd() / ".claude" / "env",
+    ]
 
 
 def load_env_file(env_path: Optional[Path] = None) -> Dict[str, str]:
@@ -153,30 +346,20 @@ def load_env_file(env_path: Optional[Path] = None) -> Dict[str, str]:
 
     if env_path is None:
         # Search in standard locations
-        search_paths = [
-            Path.home() / ".claude" / "env",
-            Path.cwd() / ".claude" / "env",
-        ]
+        search_paths = _default_env_paths()
     else:
         search_paths = [env_path]
 
     for path in search_paths:
         if path.exists():
             with open(path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-                    # Parse KEY=VALUE format
-                    if "=" in line:
-                        key, _, value = line.partition("=")
-                        key = key.strip()
-                        # SNOW-47: Skip lines where the key is empty
-                        if not key:
-                            continue
-                        value = _parse_quoted_value(value)
-                        env_vars[key] = value
+                text = f.read()
+            # Blank lines, comments, lines without "=" and (SNOW-47) lines
+            # with an empty key never match, so they are skipped
+            env_vars = {
+                match.group(1): _parse_quoted_value(match.group(2))
+                for match in _ENV_LINE_RE.finditer(text)
+            }
             break  # Use first found env file
 
     return env_vars
@@ -212,6 +395,68 @@ def _validate_credential(value: Optional[str], name: str) -> Optional[str]:
     return stripped if stripped else None
 
 
+_INVALID_TIMEOUT_WARNING = (
+    "Invalid SERVICENOW_TIMEOUT value '%s': must be an integer. Using default timeout."
+)
+
+
+def _parse_timeout(timeout_str: Optional[str]) -> Optional[int]:
+    """
+    Coerce a SERVICENOW_TIMEOUT value to an integer number of seconds.
+
+    Args:
+        timeout_str: Raw timeout value from the environment or env file.
+
+    Returns:
+        The timeout as an integer, or None if unset or not a valid integer.
+    """
+    if not timeout_str:
+        return None
+    try:
+        # int() is a C builtin and handles signs/whitespace; no regex needed
+        return int(timeout_str)
+    except ValueError:
+        logger.warning(_INVALID_TIMEOUT_WARNING, timeout_str)
+        return None
+
+
+# Credential config keys and the variable each is read from, in validation order
+_CREDENTIAL_ENV_KEYS = (
+    ("instance", "SERVICENOW_INSTANCE"),
+    ("username", "SERVICENOW_USERNAME"),
+    ("password", "SERVICENOW_PASSWORD"),
+    ("client_id", "SERVICENOW_CLIENT_ID"),
+    ("client_secret", "SERVICENOW_CLIENT_SECRET"),
+    ("api_key", "SERVICENOW_API_KEY"),
+)
+
+# Environment variables that feed into get_config()
+_CONFIG_ENV_KEYS = tuple(name for _, name in _CREDENTIAL_ENV_KEYS) + ("SERVICENOW_TIMEOUT",)
+
+# Last successful get_config() result and the inputs it was computed from
+_config_cache: Dict[str, Any] = {}
+
+
+def _config_cache_key() -> Tuple[Any, ...]:
+    """
+    Build a key identifying the inputs get_config() depends on.
+
+    The key covers the relevant environment variables plus the mtime and size
+    of each standard env file, so editing the env file or the environment
+    invalidates the cached configuration.
+    """
+    file_stats = []
+    for path in _default_env_paths():
+        try:
+            stat = path.stat()
+        except OSError:
+            file_stats.append(None)
+        else:
+            file_stats.append((stat.st_mtime_ns, stat.st_size))
+    env_values = tuple(os.environ.get(key) for key in _CONFIG_ENV_KEYS)
+    return env_values, tuple(file_stats)
+
+
 def get_config() -> Dict[str, Optional[str]]:
     """
     Get ServiceNow configuration from environment variables.
@@ -219,6 +464,35 @@ def get_config() -> Dict[str, Optional[str]]:
     Environment variables are first loaded from .claude/env file,
     then overridden by actual environment variables if set.
 
+    The result is cached after the first successful call and reused until
+    the relevant environment variables or env file change. Call
+    clear_config_cache() to force a reload.
+
+    Returns:
+        Dictionary containing ServiceNow configuration.
+
+    Raises:
+        ConfigurationError: If required configuration is missing or invalid.
+    """
+    key = _config_cache_key()
+    if _config_cache.get("key") == key:
+        return dict(_config_cache["config"])
+
+    config = _load_config()
+    _config_cache["key"] = key
+    _config_cache["config"] = config
+    return dict(config)
+
+
+def clear_config_cache() -> None:
+    """Discard the cached get_config() result, so the next call reloads it."""
+    _config_cache.clear()
+
+
+def _load_config() -> Dict[str, Optional[str]]:
+    """
+    Build ServiceNow configuration from the env file and environment.
+
     Returns:
         Dictionary containing ServiceNow configuration.
 
@@ -228,38 +502,17 @@ def get_config() -> Dict[str, Optional[str]]:
     # Load from env file first
     file_vars = load_env_file()
 
-    # Get timeout value with env vars taking precedence
-    timeout_str = os.environ.get("SERVICENOW_TIMEOUT", file_vars.get("SERVICENOW_TIMEOUT"))
-    timeout_value = None
-    if timeout_str:
-        try:
-            timeout_value = int(timeout_str)
-        except ValueError:
-            logger.warning(
-                "Invalid SERVICENOW_TIMEOUT value '%s': must be an integer. Using default timeout.",
-                timeout_str
-            )
+    # Env vars take precedence over the env file
+    values = {name: os.environ.get(name, file_vars.get(name)) for name in _CONFIG_ENV_KEYS}
 
-    # Get raw configuration with env vars taking precedence
-    raw_config = {
-        "instance": os.environ.get("SERVICENOW_INSTANCE", file_vars.get("SERVICENOW_INSTANCE")),
-        "username": os.environ.get("SERVICENOW_USERNAME", file_vars.get("SERVICENOW_USERNAME")),
-        "password": os.environ.get("SERVICENOW_PASSWORD", file_vars.get("SERVICENOW_PASSWORD")),
-        "client_id": os.environ.get("SERVICENOW_CLIENT_ID", file_vars.get("SERVICENOW_CLIENT_ID")),
-        "client_secret": os.environ.get("SERVICENOW_CLIENT_SECRET", file_vars.get("SERVICENOW_CLIENT_SECRET")),
-        "api_key": os.environ.get("SERVICENOW_API_KEY", file_vars.get("SERVICENOW_API_KEY")),
-    }
+    timeout_value = _parse_timeout(values["SERVICENOW_TIMEOUT"])
 
     # Validate and normalize all credential values
     config = {
-        "instance": _validate_credential(raw_config["instance"], "SERVICENOW_INSTANCE"),
-        "username": _validate_credential(raw_config["username"], "SERVICENOW_USERNAME"),
-        "password": _validate_credential(raw_config["password"], "SERVICENOW_PASSWORD"),
-        "client_id": _validate_credential(raw_config["client_id"], "SERVICENOW_CLIENT_ID"),
-        "client_secret": _validate_credential(raw_config["client_secret"], "SERVICENOW_CLIENT_SECRET"),
-        "api_key": _validate_credential(raw_config["api_key"], "SERVICENOW_API_KEY"),
-        "timeout": timeout_value,
+        key: _validate_credential(values[name], name)
+        for key, name in _CREDENTIAL_ENV_KEYS
     }
+    config["timeout"] = timeout_value
 
     # Validate required configuration
     if not config["instance"]:
@@ -286,6 +539,301 @@ def get_config() -> Dict[str, Optional[str]]:
     return config
 
 
+@dataclass(frozen=True)
+class ClientConfig:
+    """
+    Immutable client configuration.
+
+    An alternative to the dictionary returned by get_config() for code that
+    builds configurations itself. Use dataclasses.replace() to derive a
+    variant, e.g. replace(config, timeout=60).
+    """
+
+    instance: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    client_id: Optional[str] = None
+    client_secret: Optional[str] = None
+    api_key: Optional[str] = None
+    timeout: Optional[int] = None
+    retry_max: Optional[int] = None
+    retry_base: Optional[float] = None
+    retry_cap: Optional[float] = None
+
+
+# =============================================================================
+# HTTP Transport
+# =============================================================================
+
+class _PooledResponse:
+    """
+    Fully-read HTTP response returned by the pooled urlopen.
+
+    The body is read eagerly so the underlying connection can go back to the
+    pool straight away. Mirrors the parts of http.client.HTTPResponse the
+    client uses: read(), status, headers and context manager support.
+    """
+
+    def __init__(self, status: int, reason: str, headers: http.client.HTTPMessage,
+                 body: bytes, url: str):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.url = url
+        self._body = BytesIO(body)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt bytes of the body, or all remaining bytes."""
+        return self._body.read(amt)
+
+    def getcode(self) -> int:
+        """Return the HTTP status code."""
+        return self.status
+
+    def close(self) -> None:
+        """Release the buffered body."""
+        self._body.close()
+
+    def __enter__(self) -> "_PooledResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _ConnectionPool:
+    """
+    Per-host pool of persistent HTTP(S) connections.
+
+    urllib.request.urlopen sends "Connection: close" and opens a new TCP and
+    TLS session for every call. Keeping idle connections per
+    (scheme, host, port) lets consecutive requests to the same ServiceNow
+    instance skip the handshake. Connections are checked out for the duration
+    of one request, so the pool is safe to share between threads.
+
+    No cookie jar is kept. ServiceNow serializes requests that share a
+    session cookie, so replaying JSESSIONID would queue concurrent calls
+    behind each other (up to the 300 second session wait limit).
+    """
+
+    # Idle connections kept per host; extra connections are closed on release
+    MAX_IDLE_PER_HOST = 10
+
+    # Redirects followed per request, and the statuses that can be followed;
+    # the same limit urllib's HTTPRedirectHandler applies
+    MAX_REDIRECTIONS = 10
+    _REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+    # Sent unless the request sets its own, as urllib.request.urlopen does
+    USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+    # Errors that mean a reused keep-alive connection was closed by the server
+    _STALE_CONNECTION_ERRORS = (
+        http.client.RemoteDisconnected,
+        ConnectionResetError,
+        BrokenPipeError,
+    )
+
+    def __init__(self) -> None:
+        self._idle: Dict[Tuple[Any, ...], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme: str, host: str, port: Optional[int],
+                        timeout: Optional[float],
+                        context: Optional[ssl.SSLContext]) -> http.client.HTTPConnection:
+        """Open a new connection for the given scheme and host."""
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key: Tuple[Any, ...]) -> Optional[http.client.HTTPConnection]:
+        """Take an idle connection for key out of the pool, if one exists."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        return None
+
+    def _release(self, key: Tuple[Any, ...], conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        """Close and forget every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _send(self, request: Request, timeout: Optional[float],
+              context: Optional[ssl.SSLContext]) -> Tuple[int, str, Any, bytes]:
+        """
+        Send one request over a pooled connection, without following redirects.
+
+        Returns:
+            The status, reason, headers and decompressed body of the response.
+
+        Raises:
+            URLError: If the connection fails or a gzip body cannot be decoded.
+        """
+        parts = urlsplit(request.full_url)
+        scheme, host, port = parts.scheme, parts.hostname, parts.port
+        method = request.get_method()
+
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = dict(request.header_items())
+        headers.setdefault("User-agent", self.USER_AGENT)
+        # JSON compresses several-fold; the body is decompressed below
+        headers.setdefault("Accept-encoding", "gzip")
+        key = (scheme, host, port, context)
+
+        conn = self._acquire(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._new_connection(scheme, host, port, timeout, context)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            sent = False
+            try:
+                conn.request(method, path, body=request.data, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except self._STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                conn = None
+                # The server dropped an idle connection. A request that was
+                # not fully written cannot have been acted on, but once it
+                # was, only idempotent methods are safe to send again.
+                if not reused or (sent and method not in _IDEMPOTENT_METHODS):
+                    raise URLError(e)
+                reused = False
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise URLError(e)
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        if response.msg.get("Content-Encoding", "").lower() == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError, zlib.error) as e:
+                # A truncated or corrupt body is a transport failure
+                raise URLError(e)
+
+        return response.status, response.reason, response.msg, body
+
+    @staticmethod
+    def _redirect(request: Request, status: int, headers: Any) -> Optional[Request]:
+        """
+        Build the request that follows a redirect, as urllib does.
+
+        GET and HEAD follow 301, 302, 303, 307 and 308; POST follows 301,
+        302 and 303 as a GET without a body. Returns None for any other
+        method or status, or when there is no http(s) Location.
+        """
+        method = request.get_method()
+        if not (method in ("GET", "HEAD") or (status in (301, 302, 303) and method == "POST")):
+            return None
+        location = headers.get("Location") or headers.get("URI")
+        if not location:
+            return None
+        url = urljoin(request.full_url, location)
+        if urlsplit(url).scheme not in ("http", "https"):
+            return None
+        redirect_headers = {name: value for name, value in request.headers.items()
+                            if name.lower() not in ("content-length", "content-type")}
+        return Request(url, headers=redirect_headers,
+                       method="HEAD" if method == "HEAD" else "GET")
+
+    def urlopen(self, request: Request, timeout: Optional[float] = None,
+                context: Optional[ssl.SSLContext] = None) -> _PooledResponse:
+        """
+        Send a urllib Request over a pooled connection.
+
+        Redirects are followed the way urllib.request.urlopen follows them
+        (see _redirect), up to MAX_REDIRECTIONS.
+
+        Args:
+            request: The urllib.request.Request to send.
+            timeout: Socket timeout in seconds.
+            context: SSL context for HTTPS connections.
+
+        Returns:
+            The response, with its body already read and, if the server
+            gzip-compressed it, decompressed.
+
+        Raises:
+            HTTPError: For any final response outside 2xx, including a
+                redirect that is not followed.
+            URLError: If the connection fails.
+        """
+        for _ in range(self.MAX_REDIRECTIONS + 1):
+            parts = urlsplit(request.full_url)
+            # Proxied hosts go through urllib, which knows how to tunnel
+            if getproxies().get(parts.scheme) and not proxy_bypass(parts.netloc):
+                return _urllib_urlopen(request, timeout=timeout, context=context)
+
+            status, reason, headers, body = self._send(request, timeout, context)
+            redirect = None
+            if status in self._REDIRECT_STATUSES:
+                redirect = self._redirect(request, status, headers)
+            if redirect is None:
+                break
+            request = redirect
+        else:
+            raise HTTPError(request.full_url, status, f"Too many redirects: {reason}",
+                            headers, BytesIO(body))
+
+        if not 200 <= status < 300:
+            raise HTTPError(request.full_url, status, reason, headers, BytesIO(body))
+        return _PooledResponse(status, reason, headers, body, request.full_url)
+
+
+# Shared by every client so connections survive across ServiceNowClient instances
+_CONNECTION_POOL = _ConnectionPool()
+
+_T = TypeVar("_T")
+
+
+def _query_params(**params: Any) -> Optional[Dict[str, Any]]:
+    """
+    Build a sysparm_* query parameter dict, dropping unset values.
+
+    None and empty-string values are skipped so callers can pass every
+    optional argument straight through. Returns None when nothing is set.
+    """
+    filtered = {key: value for key, value in params.items()
+                if value is not None and value != ""}
+    return filtered or None
+
+
+def urlopen(request: Request, timeout: Optional[float] = None,
+            context: Optional[ssl.SSLContext] = None) -> _PooledResponse:
+    """
+    Keep-alive replacement for urllib.request.urlopen.
+
+    Takes the same arguments and raises the same HTTPError/URLError
+    exceptions, but reuses connections from the module-level pool.
+    """
+    return _CONNECTION_POOL.urlopen(request, timeout=timeout, context=context)
+
+
 # =============================================================================
 # ServiceNow API Client
 # =============================================================================
@@ -296,24 +844,96 @@ class ServiceNowClient:
 
     Supports Basic authentication, OAuth 2.0, and API key authentication.
     Provides methods for common CRUD operations against ServiceNow tables.
+
+    Requests go over keep-alive connections from a module-level pool shared
+    by every client, so repeated calls to one instance reuse the same socket
+    instead of repeating the TCP and TLS handshake.
     """
 
     # Default timeout in seconds for HTTP requests
     DEFAULT_TIMEOUT = 30
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None,
-                 timeout: Optional[int] = None):
+    # Path prefix of the Table API, used by _build_url unless overridden
+    TABLE_API_PATH = "/api/now/table"
+
+    # Headers sent with every REST API request; copied, never mutated
+    _JSON_HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    # sys_ids per sys_idIN query in get_by_sys_ids; with 32-character ids this
+    # keeps the URL around 7 KB, under common 8 KB request-line limits
+    SYS_ID_CHUNK_SIZE = 200
+
+    # Records fetched per request by iter_get
+    PAGE_SIZE = 1000
+
+    # Batch API endpoint used by batch_get, and the headers of each sub-request
+    # in the name/value list form the Batch API expects
+    BATCH_API_PATH = "/api/now/v1/batch"
+    _BATCH_HEADERS = [
+        {"name": "Accept", "value": "application/json"},
+        {"name": "Content-Type", "value": "application/json"},
+    ]
+
+    # OAuth token lifetime assumed when the token response omits expires_in,
+    # and how long before expiry a token is refreshed
+    DEFAULT_TOKEN_LIFETIME = 1800
+    TOKEN_EXPIRY_MARGIN = 30
+
+    # OAuth tokens shared by every client of the same instance and credentials,
+    # as (access_token, token_type, expiry, refresh_token) keyed by
+    # (instance, client_id, SHA-256 of client_secret), so a new client reuses
+    # a live token instead of calling the token endpoint. The secret is part
+    # of the key so a client with a wrong or rotated-out secret still has to
+    # authenticate instead of borrowing another client's token.
+    _token_cache: Dict[Tuple[str, Optional[str], str], Tuple[str, str, float, Optional[str]]] = {}
+    _token_cache_lock = threading.Lock()
+
+    # Worker threads used by get_many; kept within the connection pool's
+    # per-host idle limit so every worker can reuse a connection
+    DEFAULT_MAX_WORKERS = 8
+
+    # Retry policy for rate limits, 5xx errors and network failures:
+    # exponential backoff of RETRY_BACKOFF_BASE * 2**attempt seconds, capped
+    # at RETRY_BACKOFF_CAP, with +/- RETRY_JITTER proportional jitter.
+    # Overridable per client with the retry_max/retry_base/retry_cap config keys.
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_BACKOFF_BASE = 1.0
+    RETRY_BACKOFF_CAP = 30.0
+    RETRY_JITTER = 0.5
+
+    # Seconds a cached get() response stays valid when caching is enabled
+    DEFAULT_CACHE_TTL = 60.0
+
+    def __init__(self, config: Optional[Union[Dict[str, Any], ClientConfig]] = None,
+                 timeout: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 cache_size: int = 0,
+                 cache_ttl: Optional[float] = None):
         """
         Initialize the ServiceNow client.
 
         Args:
-            config: Optional configuration dictionary. If not provided,
-                    configuration is loaded from environment.
+            config: Optional configuration dictionary or ClientConfig. If not
+                    provided, configuration is loaded from environment.
             timeout: Optional timeout in seconds for HTTP requests.
                      Defaults to SERVICENOW_TIMEOUT env var, or DEFAULT_TIMEOUT (30 seconds).
+            max_retries: Optional number of times to retry a failed request.
+                     Defaults to config retry_max, or DEFAULT_MAX_RETRIES;
+                     0 disables retries.
+            cache_size: Number of get() responses to keep in memory. Defaults
+                     to 0, which disables caching so every read goes to the
+                     instance.
+            cache_ttl: Optional seconds a cached response stays valid.
+                     Defaults to DEFAULT_CACHE_TTL.
         """
+        if isinstance(config, ClientConfig):
+            config = asdict(config)
         self.config = config or get_config()
-        self.instance = self.config["instance"]
+        self.instance = self.config["instance"].rstrip("/")
+        self._table_url = f"{self.instance}{self.TABLE_API_PATH}"
         # Priority: explicit timeout param > config timeout (from env) > default
         if timeout is not None:
             self.timeout = timeout
@@ -321,18 +941,42 @@ class ServiceNowClient:
             self.timeout = self.config["timeout"]
         else:
             self.timeout = self.DEFAULT_TIMEOUT
+        # Priority: explicit max_retries param > config retry_max > default
+        if max_retries is not None:
+            self.max_retries = max_retries
+        elif self.config.get("retry_max") is not None:
+            self.max_retries = int(self.config["retry_max"])
+        else:
+            self.max_retries = self.DEFAULT_MAX_RETRIES
+        # An explicit 0 is honored, so only None falls back to the defaults
+        retry_base = self.config.get("retry_base")
+        retry_cap = self.config.get("retry_cap")
+        self.retry_base = float(retry_base if retry_base is not None else self.RETRY_BACKOFF_BASE)
+        self.retry_cap = float(retry_cap if retry_cap is not None else self.RETRY_BACKOFF_CAP)
         self._access_token: Optional[str] = None
         self._token_type: str = "Bearer"
-
-    def _get_auth_header(self) -> Dict[str, str]:
+        self._token_expiry: float = 0.0
+        self._refresh_token: Optional[str] = None
+        # Serializes OAuth token refresh when the client is used from threads
+        self._token_lock = threading.Lock()
+        secret = self.config.get("client_secret") or ""
+        self._token_cache_key = (self.instance, self.config.get("client_id"),
+                                 hashlib.sha256(secret.encode()).hexdigest())
+        self._static_auth_header = self._build_static_auth_header()
+        # LRU cache of get() responses: key -> (expiry, response)
+        self._cache_size = cache_size
+        self._cache_ttl = self.DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self._response_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _build_static_auth_header(self) -> Optional[Dict[str, str]]:
         """
-        Get the appropriate authorization header based on configured auth method.
-
-        Returns:
-            Dictionary containing the Authorization header.
+        Build the Authorization header for credentials that never change.
 
-        Raises:
-            AuthenticationError: If authentication fails.
+        API key and Basic headers depend only on the config, so they are
+        computed once here instead of on every request. Returns None when
+        OAuth is configured (its token is fetched lazily) or when no
+        authentication method is available.
         """
         # API Key authentication
         if self.config.get("api_key"):
@@ -340,9 +984,7 @@ class ServiceNowClient:
 
         # OAuth authentication
         if self.config.get("client_id") and self.config.get("client_secret"):
-            if not self._access_token:
-                self._obtain_oauth_token()
-            return {"Authorization": f"{self._token_type} {self._access_token}"}
+            return None
 
         # Basic authentication
         if self.config.get("username") and self.config.get("password"):
@@ -350,8 +992,71 @@ class ServiceNowClient:
             encoded = base64.b64encode(credentials.encode()).decode()
             return {"Authorization": f"Basic {encoded}"}
 
+        return None
+
+    def _get_auth_header(self) -> Dict[str, str]:
+        """
+        Get the appropriate authorization header based on configured auth method.
+
+        Returns:
+            Dictionary containing the Authorization header. Callers must not
+            mutate it, since API key and Basic headers are shared between calls.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+        """
+        # API key and Basic authentication (precomputed in __init__)
+        if self._static_auth_header is not None:
+            return self._static_auth_header
+
+        # OAuth authentication
+        if self.config.get("client_id") and self.config.get("client_secret"):
+            with self._token_lock:
+                if not self._access_token or time.monotonic() >= self._token_expiry:
+                    if not self._load_shared_token():
+                        self._renew_oauth_token()
+                return {"Authorization": f"{self._token_type} {self._access_token}"}
+
         raise AuthenticationError("No valid authentication method available")
 
+    def _load_shared_token(self) -> bool:
+        """Adopt a live token another client stored in _token_cache, if any."""
+        with self._token_cache_lock:
+            cached = self._token_cache.get(self._token_cache_key)
+        if cached is None or time.monotonic() >= cached[2]:
+            return False
+        (self._access_token, self._token_type, self._token_expiry,
+         self._refresh_token) = cached
+        return True
+
+    def _discard_token(self) -> None:
+        """Forget the current OAuth token, here and in the shared cache."""
+        with self._token_cache_lock:
+            cached = self._token_cache.get(self._token_cache_key)
+            # Leave a token some other client has already refreshed
+            if cached is not None and cached[0] == self._access_token:
+                del self._token_cache[self._token_cache_key]
+        self._access_token = None
+
+    def _renew_oauth_token(self) -> None:
+        """
+        Get a new OAuth token, preferring the refresh_token grant.
+
+        Exchanging a refresh token is cheaper for the instance than a full
+        client credentials authentication; if the exchange is rejected the
+        client falls back to client credentials.
+
+        Raises:
+            AuthenticationError: If token retrieval fails.
+        """
+        if self._refresh_token:
+            try:
+                self._refresh_oauth_token()
+                return
+            except AuthenticationError:
+                self._refresh_token = None
+        self._obtain_oauth_token()
+
     def _obtain_oauth_token(self) -> None:
         """
         Obtain OAuth 2.0 access token using client credentials flow.
@@ -359,10 +1064,38 @@ class ServiceNowClient:
         Raises:
             AuthenticationError: If token retrieval fails.
         """
+        self._request_oauth_token({"grant_type": "client_credentials"})
+
+    def _refresh_oauth_token(self) -> None:
+        """
+        Exchange the stored refresh token for a new access token.
+
+        Raises:
+            AuthenticationError: If the refresh token is rejected.
+        """
+        self._request_oauth_token({
+            "grant_type": "refresh_token",
+            "refresh_token": self._refresh_token,
+        })
+
+    def _request_oauth_token(self, grant: Dict[str, str]) -> None:
+        """
+        POST a token grant to oauth_token.do and store the resulting token.
+
+        Args:
+            grant: Grant-specific form fields; client credentials are added.
+
+        Raises:
+            AuthenticationError: If the grant is rejected or the endpoint
+                cannot be reached.
+            ServiceNowError: A RateLimitError or 5xx error if the token
+                endpoint is throttled or failing; _execute_with_retry retries
+                these like any other request.
+        """
         token_url = f"{self.instance}/oauth_token.do"
 
         data = urlencode({
-            "grant_type": "client_credentials",
+            **grant,
             "client_id": self.config["client_id"],
             "client_secret": self.config["client_secret"],
         }).encode()
@@ -374,16 +1107,34 @@ class ServiceNowClient:
 
         try:
             request = Request(token_url, data=data, headers=headers, method="POST")
-            with urlopen(request, timeout=self.timeout, context=SSL_CONTEXT) as response:
-                result = json.loads(response.read().decode())
+            with urlopen(request, timeout=self.timeout, context=_ssl_context()) as response:
+                result = _json_loads(response.read())
                 self._access_token = result.get("access_token")
                 self._token_type = result.get("token_type", "Bearer")
+                # Not every grant returns a new refresh token; keep the old one
+                self._refresh_token = result.get("refresh_token") or self._refresh_token
 
                 if not self._access_token:
                     raise AuthenticationError("OAuth response did not contain access_token")
 
+                try:
+                    expires_in = float(result.get("expires_in", self.DEFAULT_TOKEN_LIFETIME))
+                except (TypeError, ValueError):
+                    expires_in = self.DEFAULT_TOKEN_LIFETIME
+                self._token_expiry = time.monotonic() + expires_in - self.TOKEN_EXPIRY_MARGIN
+                with self._token_cache_lock:
+                    self._token_cache[self._token_cache_key] = (
+                        self._access_token, self._token_type, self._token_expiry,
+                        self._refresh_token,
+                    )
+
         except HTTPError as e:
-            body = e.read().decode() if e.fp else None
+            body = e.read() if e.fp else None
+            # A throttled or failing token endpoint is transient: raise the
+            # retryable error so _execute_with_retry backs off (honoring
+            # Retry-After) instead of the caller hammering the endpoint
+            if e.code == 429 or e.code >= 500:
+                raise _error_for_status(e.code, e.reason, body, e.headers)
             raise AuthenticationError(
                 f"OAuth authentication failed: {e.reason}",
                 status_code=e.code,
@@ -393,28 +1144,115 @@ class ServiceNowClient:
             raise AuthenticationError(f"Failed to connect for OAuth: {e.reason}")
 
     def _build_url(self, table: str, sys_id: Optional[str] = None,
-                   api_path: str = "/api/now/table") -> str:
+                   api_path: Optional[str] = None) -> str:
         """
         Build the full URL for an API request.
 
         Args:
             table: ServiceNow table name.
             sys_id: Optional sys_id for single record operations.
-            api_path: API path prefix (default: /api/now/table).
+            api_path: API path prefix (default: TABLE_API_PATH).
 
         Returns:
             Full URL string.
         """
+        base = self._table_url if api_path is None else f"{self.instance}{api_path}"
         if sys_id:
-            return f"{self.instance}{api_path}/{table}/{sys_id}"
-        return f"{self.instance}{api_path}/{table}"
+            return f"{base}/{table}/{sys_id}"
+        return f"{base}/{table}"
+
+    @staticmethod
+    def _is_retryable(error: ServiceNowError, idempotent: bool) -> bool:
+        """
+        Decide whether a failed request is worth sending again.
+
+        Rate limits are always retryable. Server errors (5xx) and network
+        failures are retried only for idempotent requests, since the server
+        may already have applied a POST. Other client errors (400, 401, 403,
+        404) fail fast because resending cannot change the outcome.
+        """
+        if isinstance(error, RateLimitError):
+            return True
+        if not idempotent:
+            return False
+        if isinstance(error, NetworkError):
+            return True
+        return error.status_code is not None and error.status_code >= 500
+
+    def _execute_with_retry(self, fn: Callable[[], _T], idempotent: bool = True) -> _T:
+        """
+        Call fn, retrying transient failures with exponential backoff.
+
+        The server's Retry-After header is honored when present; otherwise the
+        delay doubles each attempt (capped at retry_cap) with jitter so
+        concurrent callers do not retry in lockstep.
+
+        Args:
+            fn: Zero-argument callable performing one request.
+            idempotent: Whether fn may be repeated after a server error or
+                network failure (see _is_retryable).
+
+        Returns:
+            The return value of fn.
+
+        Raises:
+            ServiceNowError: The last error, if it is not retryable, retries
+                are exhausted, or Retry-After asks for a longer wait than
+                retry_cap.
+        """
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except ServiceNowError as e:
+                if attempt >= self.max_retries or not self._is_retryable(e, idempotent):
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = min(self.retry_cap, self.retry_base * 2 ** attempt)
+                    delay *= 1 + random.uniform(-self.RETRY_JITTER, self.RETRY_JITTER)
+                elif delay > self.retry_cap:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "ServiceNow request failed (%s); retrying in %.1fs (attempt %d of %d)",
+                    e.message, delay, attempt, self.max_retries
+                )
+                time.sleep(delay)
 
     def _make_request(self, method: str, url: str,
+                      data: Optional[Dict[str, Any]] = None,
+                      params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the ServiceNow API, retrying transient failures.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE).
+            url: Full URL for the request (should be base URL without query params).
+            data: Optional request body data.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            ServiceNowError: On API errors.
+            AuthenticationError: On authentication failures.
+            NotFoundError: When resource is not found.
+            RateLimitError: When rate limit is still exceeded after retrying.
+            NetworkError: When the instance is still unreachable after retrying.
+        """
+        return self._execute_with_retry(
+            lambda: self._send_request(method, url, data, params),
+            idempotent=method in _IDEMPOTENT_METHODS,
+        )
+
+    def _send_request(self, method: str, url: str,
                       data: Optional[Dict[str, Any]] = None,
                       params: Optional[Dict[str, Any]] = None,
                       _retry: bool = False) -> Dict[str, Any]:
         """
-        Make an HTTP request to the ServiceNow API.
+        Send a single HTTP request to the ServiceNow API.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE).
@@ -439,70 +1277,39 @@ class ServiceNowClient:
             final_url = f"{url}?{query_string}"
 
         # Prepare headers
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        headers.update(self._get_auth_header())
+        headers = {**self._JSON_HEADERS, **self._get_auth_header()}
 
         # Prepare request body
-        body = json.dumps(data).encode() if data else None
+        body = _json_encode(data) if data else None
 
         try:
             request = Request(final_url, data=body, headers=headers, method=method)
-            with urlopen(request, timeout=self.timeout, context=SSL_CONTEXT) as response:
-                response_body = response.read().decode()
+            with urlopen(request, timeout=self.timeout, context=_ssl_context()) as response:
+                # Both parsers accept bytes, so skip decoding the whole body
+                # to an intermediate str first
+                response_body = response.read()
                 if response_body:
-                    return json.loads(response_body)
+                    return _json_loads(response_body)
                 return {}
 
         except HTTPError as e:
-            body = e.read().decode() if e.fp else None
+            # Keep the raw bytes; ServiceNowError decodes and parses them lazily
+            body = e.read() if e.fp else None
 
             if e.code == 401:
                 # Clear cached token and retry once for OAuth
                 if self._access_token and not _retry:
-                    self._access_token = None
+                    self._discard_token()
                     # Retry with the base URL (without query params) - params will be re-added
-                    return self._make_request(method, url, data, params, _retry=True)
-                raise AuthenticationError(
-                    "Authentication failed",
-                    status_code=e.code,
-                    response_body=body
-                )
-            elif e.code == 403:
-                raise AuthenticationError(
-                    "Access forbidden - insufficient permissions",
-                    status_code=e.code,
-                    response_body=body
-                )
-            elif e.code == 404:
-                raise NotFoundError(
-                    "Resource not found",
-                    status_code=e.code,
-                    response_body=body
-                )
-            elif e.code == 429:
-                raise RateLimitError(
-                    "Rate limit exceeded",
-                    status_code=e.code,
-                    response_body=body
-                )
-            elif e.code == 400:
-                raise ValidationError(
-                    "Invalid request",
-                    status_code=e.code,
-                    response_body=body
-                )
-            else:
-                raise ServiceNowError(
-                    f"API request failed: {e.reason}",
-                    status_code=e.code,
-                    response_body=body
-                )
+                    return self._send_request(method, url, data, params, _retry=True)
+
+            raise _error_for_status(e.code, e.reason, body, e.headers)
 
         except URLError as e:
-            raise ServiceNowError(f"Failed to connect to ServiceNow: {e.reason}")
+            # A certificate problem will not fix itself, so it is not retried
+            if isinstance(e.reason, ssl.SSLCertVerificationError):
+                raise ServiceNowError(f"Failed to connect to ServiceNow: {e.reason}")
+            raise NetworkError(f"Failed to connect to ServiceNow: {e.reason}")
 
     def get(self, table: str, sys_id: Optional[str] = None,
             query: Optional[str] = None, fields: Optional[str] = None,
@@ -537,17 +1344,50 @@ class ServiceNowClient:
             client.get('incident', fields='number,short_description,state')
         """
         url = self._build_url(table, sys_id)
-
-        params = {}
-        if fields:
-            params["sysparm_fields"] = fields
-        if limit is not None:
-            params["sysparm_limit"] = limit
-        if offset is not None:
-            params["sysparm_offset"] = offset
-        if display_value:
-            params["sysparm_display_value"] = display_value
-
+        params = self._get_params(query, fields, limit, offset, order_by, display_value)
+        if not self._cache_size:
+            return self._make_request("GET", url, params=params)
+
+        key = (table, url, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None and now < cached[0]:
+                self._response_cache.move_to_end(key)
+                # Copies keep callers from mutating the cached response
+                return copy.deepcopy(cached[1])
+        response = self._make_request("GET", url, params=params)
+        with self._cache_lock:
+            self._response_cache[key] = (now + self._cache_ttl, copy.deepcopy(response))
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._cache_size:
+                self._response_cache.popitem(last=False)
+        return response
+
+    def _invalidate_cache(self, table: str) -> None:
+        """Drop cached get() responses for a table after a write to it."""
+        if not self._cache_size:
+            return
+        with self._cache_lock:
+            for key in [key for key in self._response_cache if key[0] == table]:
+                del self._response_cache[key]
+
+    def _make_write_request(self, table: str, method: str, url: str,
+                            data: Optional[Dict[str, Any]] = None,
+                            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a write request, then invalidate cached reads of the table."""
+        try:
+            return self._make_request(method, url, data=data, params=params)
+        finally:
+            # Also on failure, since the write may have been applied anyway
+            self._invalidate_cache(table)
+
+    @staticmethod
+    def _get_params(query: Optional[str] = None, fields: Optional[str] = None,
+                    limit: Optional[int] = None, offset: Optional[int] = None,
+                    order_by: Optional[str] = None,
+                    display_value: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build the sysparm_* query parameters for a get() call."""
         # Build sysparm_query with optional ordering
         # Append ORDERBY/ORDERBYDESC to sysparm_query for reliable sorting
         query_value = query or ""
@@ -560,10 +1400,267 @@ class ServiceNowClient:
                 query_value = f"{query_value}^{order_clause}"
             else:
                 query_value = order_clause
-        if query_value:
-            params["sysparm_query"] = query_value
 
-        return self._make_request("GET", url, params=params if params else None)
+        return _query_params(
+            sysparm_fields=fields,
+            sysparm_limit=limit,
+            sysparm_offset=offset,
+            sysparm_display_value=display_value,
+            sysparm_query=query_value,
+        )
+
+    def iter_get(self, table: str, query: Optional[str] = None,
+                 fields: Optional[str] = None, order_by: Optional[str] = None,
+                 display_value: Optional[str] = None,
+                 page_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every record matching a query, one page of records at a time.
+
+        Unlike a single large get(), only a page or two is held in memory at
+        a time, so peak memory depends on page_size rather than on the size
+        of the result set. While the caller works through one page, the next
+        is already being fetched in the background, hiding its round trip.
+
+        Args:
+            table: ServiceNow table name.
+            query: Optional encoded query string.
+            fields: Optional comma-separated list of fields to return.
+            order_by: Optional field to sort by (prefix with - for descending).
+                A stable order keeps records from shifting between pages.
+            display_value: Optional display value setting ('true', 'false', 'all').
+            page_size: Optional number of records per request.
+                Defaults to PAGE_SIZE.
+
+        Yields:
+            Record dictionaries.
+
+        Example:
+            for incident in client.iter_get('incident', query='active=true',
+                                             order_by='sys_created_on'):
+                ...
+        """
+        size = page_size or self.PAGE_SIZE
+
+        def fetch(offset: int) -> List[Dict[str, Any]]:
+            return self.get(table, query=query, fields=fields, limit=size, offset=offset,
+                            order_by=order_by, display_value=display_value).get("result", [])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            pending = executor.submit(fetch, offset)
+            while True:
+                page = pending.result()
+                # A short page is the last one; otherwise prefetch the next
+                if len(page) < size:
+                    yield from page
+                    return
+                offset += size
+                pending = executor.submit(fetch, offset)
+                yield from page
+
+    def get_many(self, table: str, queries: List[str],
+                 max_workers: Optional[int] = None,
+                 **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Run several GET queries against a table concurrently.
+
+        Requests are spread over a thread pool and reuse the shared
+        keep-alive connections, so wall time is roughly that of the slowest
+        batch rather than the sum of every request.
+
+        Args:
+            table: ServiceNow table name.
+            queries: Encoded query strings, one request per query.
+            max_workers: Optional number of worker threads.
+                Defaults to DEFAULT_MAX_WORKERS.
+            **kwargs: Other get() arguments (fields, limit, order_by, ...)
+                applied to every query.
+
+        Returns:
+            List of responses in the same order as queries.
+
+        Raises:
+            ServiceNowError: The first error raised by any of the requests.
+
+        Example:
+            client.get_many('incident', ['priority=1', 'priority=2'], fields='number')
+        """
+        if not queries:
+            return []
+        workers = min(max_workers or self.DEFAULT_MAX_WORKERS, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda query: self.get(table, query=query, **kwargs), queries
+            ))
+
+    def get_by_sys_ids(self, table: str, sys_ids: List[str],
+                       fields: Optional[str] = None,
+                       chunk_size: Optional[int] = None,
+                       display_value: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch many records by sys_id with one query per chunk of ids.
+
+        Ids are packed into sys_idIN queries of up to chunk_size ids each,
+        and the chunks run concurrently through get_many, so N records cost
+        roughly one round trip instead of N.
+
+        Args:
+            table: ServiceNow table name.
+            sys_ids: sys_ids of the records to fetch.
+            fields: Optional comma-separated list of fields to return.
+                sys_id is always included so results can be matched to ids.
+            chunk_size: Optional number of ids per request.
+                Defaults to SYS_ID_CHUNK_SIZE.
+            display_value: Optional display value setting ('true', 'false', 'all').
+
+        Returns:
+            Records in the order of sys_ids. Ids with no matching record are
+            left out.
+
+        Example:
+            client.get_by_sys_ids('incident', ['abc123', 'def456'], fields='number')
+        """
+        if not sys_ids:
+            return []
+        size = chunk_size or self.SYS_ID_CHUNK_SIZE
+        if fields and "sys_id" not in fields.split(","):
+            fields = f"{fields},sys_id"
+
+        chunks = [sys_ids[i:i + size] for i in range(0, len(sys_ids), size)]
+        responses = self.get_many(
+            table, [f"sys_idIN{','.join(chunk)}" for chunk in chunks],
+            fields=fields, limit=size, display_value=display_value,
+        )
+        records = {}
+        for response in responses:
+            for record in response.get("result", []):
+                sys_id = record.get("sys_id")
+                # With display_value=all, sys_id is a {"value", "display_value"} dict
+                if isinstance(sys_id, dict):
+                    sys_id = sys_id.get("value")
+                records[sys_id] = record
+        return [records[sys_id] for sys_id in sys_ids if sys_id in records]
+
+    def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several Table API requests in a single Batch API round trip.
+
+        The requests are sent as one POST to the Batch API and executed by
+        the instance, so the whole set costs one HTTP round trip. Requests
+        can mix methods and tables.
+
+        Args:
+            requests: One dict per request with keys:
+                - table: ServiceNow table name (required).
+                - method: HTTP method, defaults to 'GET'.
+                - sys_id: Optional record sys_id.
+                - data: Optional request body (for POST, PUT and PATCH).
+                - params: Optional query parameters.
+
+        Returns:
+            List of responses in the same order as requests.
+
+        Raises:
+            ServiceNowError: If the batch call fails, or the error for the
+                first request that did not succeed. The instance runs every
+                request in the batch, so writes other than the failed one
+                may already have been applied.
+
+        Example:
+            client.batch([
+                {'table': 'incident', 'params': {'sysparm_limit': 1}},
+                {'method': 'PATCH', 'table': 'incident', 'sys_id': 'abc123',
+                 'data': {'state': '2'}},
+            ])
+        """
+        if not requests:
+            return []
+
+        rest_requests = []
+        for index, spec in enumerate(requests):
+            # Sub-request URLs are relative to the instance
+            path = self._build_url(spec["table"], spec.get("sys_id"))[len(self.instance):]
+            if spec.get("params"):
+                path = f"{path}?{urlencode(spec['params'])}"
+            rest_request = {
+                "id": str(index),
+                "method": spec.get("method", "GET").upper(),
+                "url": path,
+                "headers": self._BATCH_HEADERS,
+            }
+            if spec.get("data") is not None:
+                rest_request["body"] = base64.b64encode(_json_encode(spec["data"])).decode("ascii")
+            rest_requests.append(rest_request)
+
+        url = f"{self.instance}{self.BATCH_API_PATH}"
+        data = {"batch_request_id": uuid.uuid4().hex, "rest_requests": rest_requests}
+        # The batch is only safe to resend if every sub-request is idempotent
+        idempotent = all(r["method"] in _IDEMPOTENT_METHODS for r in rest_requests)
+        try:
+            envelope = self._execute_with_retry(
+                lambda: self._send_request("POST", url, data), idempotent=idempotent
+            )
+        finally:
+            for spec, rest_request in zip(requests, rest_requests):
+                if rest_request["method"] != "GET":
+                    self._invalidate_cache(spec["table"])
+        return self._unpack_batch(envelope, len(rest_requests))
+
+    def batch_get(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several GET queries in a single Batch API round trip.
+
+        Args:
+            requests: get() arguments for each query, each with a 'table' key
+                (e.g. {'table': 'incident', 'query': 'active=true', 'limit': 5}).
+
+        Returns:
+            List of responses in the same order as requests.
+
+        Raises:
+            ServiceNowError: If the batch call fails, or the error for the
+                first query that did not succeed.
+
+        Example:
+            client.batch_get([
+                {'table': 'incident', 'limit': 1},
+                {'table': 'sys_user', 'fields': 'user_name', 'limit': 1},
+            ])
+        """
+        specs = []
+        for spec in requests:
+            spec = dict(spec)
+            specs.append({
+                "table": spec.pop("table"),
+                "sys_id": spec.pop("sys_id", None),
+                "params": self._get_params(**spec),
+            })
+        return self.batch(specs)
+
+    @staticmethod
+    def _unpack_batch(envelope: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        """
+        Decode the sub-responses of a Batch API response, in request order.
+
+        Raises:
+            ServiceNowError: For the first sub-request that failed or was not
+                serviced, using the same exception classes as single requests.
+        """
+        serviced = {item.get("id"): item for item in envelope.get("serviced_requests", [])}
+        results = []
+        for index in range(count):
+            item = serviced.get(str(index))
+            if item is None:
+                raise ServiceNowError(
+                    f"Batch request {index} was not serviced",
+                    response_body=_json_dumps(envelope),
+                )
+            body = base64.b64decode(item["body"]) if item.get("body") else b""
+            status_code = item.get("status_code", 200)
+            if status_code >= 400:
+                raise _error_for_status(status_code, item.get("status_text", ""), body)
+            results.append(_json_loads(body) if body else {})
+        return results
 
     def post(self, table: str, data: Dict[str, Any],
              display_value: Optional[str] = None) -> Dict[str, Any]:
@@ -579,13 +1676,8 @@ class ServiceNowClient:
             Dictionary containing the created record.
         """
         url = self._build_url(table)
-
-        params = {}
-        if display_value:
-            params["sysparm_display_value"] = display_value
-
-        return self._make_request("POST", url, data=data,
-                                  params=params if params else None)
+        params = _query_params(sysparm_display_value=display_value)
+        return self._make_write_request(table, "POST", url, data=data, params=params)
 
     def put(self, table: str, sys_id: str, data: Dict[str, Any],
             display_value: Optional[str] = None) -> Dict[str, Any]:
@@ -602,13 +1694,8 @@ class ServiceNowClient:
             Dictionary containing the updated record.
         """
         url = self._build_url(table, sys_id)
-
-        params = {}
-        if display_value:
-            params["sysparm_display_value"] = display_value
-
-        return self._make_request("PUT", url, data=data,
-                                  params=params if params else None)
+        params = _query_params(sysparm_display_value=display_value)
+        return self._make_write_request(table, "PUT", url, data=data, params=params)
 
     def patch(self, table: str, sys_id: str, data: Dict[str, Any],
               display_value: Optional[str] = None) -> Dict[str, Any]:
@@ -625,13 +1712,8 @@ class ServiceNowClient:
             Dictionary containing the updated record.
         """
         url = self._build_url(table, sys_id)
-
-        params = {}
-        if display_value:
-            params["sysparm_display_value"] = display_value
-
-        return self._make_request("PATCH", url, data=data,
-                                  params=params if params else None)
+        params = _query_params(sysparm_display_value=display_value)
+        return self._make_write_request(table, "PATCH", url, data=data, params=params)
 
     def delete(self, table: str, sys_id: str) -> Dict[str, Any]:
         """
@@ -645,20 +1727,20 @@ class ServiceNowClient:
             Empty dictionary on success.
         """
         url = self._build_url(table, sys_id)
-        return self._make_request("DELETE", url)
+        return self._make_write_request(table, "DELETE", url)
 
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
-def create_client(config: Optional[Dict[str, Any]] = None,
+def create_client(config: Optional[Union[Dict[str, Any], ClientConfig]] = None,
                   timeout: Optional[int] = None) -> ServiceNowClient:
     """
     Factory function to create a ServiceNow client.
 
     Args:
-        config: Optional configuration dictionary.
+        config: Optional configuration dictionary or ClientConfig.
         timeout: Optional timeout in seconds for HTTP requests.
 
     Returns:
@@ -677,15 +1759,38 @@ def read_json_input() -> Dict[str, Any]:
     Raises:
         ValidationError: If input is not valid JSON.
     """
+    # Read raw bytes when stdin has a binary buffer; both parsers accept
+    # bytes, so the text decoder is skipped
+    stream = getattr(sys.stdin, "buffer", sys.stdin)
+    input_data = stream.read()
+    if not input_data.strip():
+        return {}
     try:
-        input_data = sys.stdin.read()
-        if not input_data.strip():
-            return {}
-        return json.loads(input_data)
-    except json.JSONDecodeError as e:
+        return _json_loads(input_data)
+    except ValueError as e:
+        # JSONDecodeError from either parser, or UnicodeDecodeError on bad bytes
         raise ValidationError(f"Invalid JSON input: {e}")
 
 
+def _write_json(data: Any, stream: Any) -> None:
+    """
+    Write data as formatted JSON plus a newline to a text stream.
+
+    The text is encoded with the stream's own encoding and written to its
+    binary buffer in one call, skipping print()'s separate writes. Since
+    _json_dumps escapes everything to ASCII, the bytes are the same as a
+    text write would produce. Streams without a buffer get a plain write.
+    """
+    text = _json_dumps(data) + "\n"
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(text)
+        return
+    # Keep ordering with anything already written through the text layer
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or "utf-8"))
+
+
 def output_json(data: Any) -> None:
     """
     Output data as formatted JSON to stdout.
@@ -693,7 +1798,7 @@ def output_json(data: Any) -> None:
     Args:
         data: Data to serialize as JSON.
     """
-    print(json.dumps(data, indent=2))
+    _write_json(data, sys.stdout)
 
 
 def output_error(error: Union[ServiceNowError, Exception]) -> None:
@@ -708,7 +1813,7 @@ def output_error(error: Union[ServiceNowError, Exception]) -> None:
     else:
         error_data = {"error": str(error)}
 
-    print(json.dumps(error_data, indent=2), file=sys.stderr)
+    _write_json(error_data, sys.stderr)
     sys.exit(1)
 
 
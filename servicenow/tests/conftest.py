@@ -6,9 +6,14 @@ SNOW-36: Migration to pytest fixtures for cleaner setup/teardown.
 These fixtures provide reusable test configurations and mock objects.
 """
 
+import io
+import os
 import sys
+import logging
+from http import HTTPStatus
 from pathlib import Path
-from unittest.mock import MagicMock, Mock
+from urllib.error import HTTPError
+from unittest.mock import Mock
 
 import pytest
 
@@ -16,81 +21,185 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 
-# Add scripts directory to path for imports
-sys.path.insert(0, str(SCRIPTS_DIR))
+# Add scripts directory to path for imports. This is the single place the
+# test suite touches sys.path; test modules import from scripts/ directly.
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
-from servicenow_api import ServiceNowClient
+from servicenow_api import (
+    ClientConfig, ServiceNowClient, clear_config_cache, create_client, load_env_file,
+)
+
+from tests.helpers import FakeResponse, UrlopenRouter
+
+
+def pytest_configure(config):
+    # Lets CI deselect live tests with -m "not integration", or spread them
+    # over workers with pytest-xdist (-n 4) when it is installed
+    config.addinivalue_line(
+        "markers", "integration: talks to a real ServiceNow instance (needs credentials)"
+    )
 
 
 # =============================================================================
 # Configuration Fixtures
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def _reset_config_cache():
+    """Start every test without a cached get_config() result."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def _basic_auth_config():
+    return ClientConfig(
+        instance="https://test.service-now.com",
+        username="admin",
+        password="secret",
+    )
+
+
+def _api_key_config():
+    return ClientConfig(
+        instance="https://test.service-now.com",
+        api_key="test-api-key-12345",
+    )
+
+
 @pytest.fixture
 def basic_auth_config():
     """Configuration with Basic authentication."""
-    return {
-        "instance": "https://test.service-now.com",
-        "username": "admin",
-        "password": "secret",
-        "client_id": None,
-        "client_secret": None,
-        "api_key": None,
-    }
+    return _basic_auth_config()
 
 
 @pytest.fixture
 def oauth_config():
     """Configuration with OAuth authentication."""
-    return {
-        "instance": "https://test.service-now.com",
-        "username": None,
-        "password": None,
-        "client_id": "test-client-id",
-        "client_secret": "test-client-secret",
-        "api_key": None,
-    }
+    return ClientConfig(
+        instance="https://test.service-now.com",
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+    )
 
 
 @pytest.fixture
 def api_key_config():
     """Configuration with API key authentication."""
-    return {
-        "instance": "https://test.service-now.com",
-        "username": None,
-        "password": None,
-        "client_id": None,
-        "client_secret": None,
-        "api_key": "test-api-key-12345",
-    }
+    return _api_key_config()
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove any SERVICENOW_* variables inherited from the outer environment."""
+    for key in list(os.environ):
+        if key.startswith("SERVICENOW_"):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture
+def config_env(monkeypatch, clean_env):
+    """Install SERVICENOW_* env vars and stub the env file for get_config tests.
+
+    monkeypatch only records the keys it touches, so teardown restores those
+    keys instead of snapshotting and diffing the whole of os.environ.
+    """
+    def _install(env_vars, file_vars=None):
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setattr("servicenow_api.load_env_file", lambda *_: dict(file_vars or {}))
+    return _install
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    """Return a function that replaces sys.stdin with the given text.
+
+    The replacement is backed by a byte buffer like the real sys.stdin, so
+    read_json_input takes its sys.stdin.buffer path.
+    """
+    def _set(data):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data.encode())))
+    return _set
+
+
+@pytest.fixture
+def logger_mock(monkeypatch):
+    """Replace the servicenow_api module logger with a spec'd mock.
+
+    A plain Mock restricted to the Logger interface is cheaper to build than
+    an unspecced MagicMock and rejects typos such as ``logger.warn_once``.
+    Each test gets its own instance; copying a shared prototype would share
+    child mocks and leak recorded calls between tests.
+    """
+    mock_logger = Mock(spec=logging.Logger)
+    monkeypatch.setattr("servicenow_api.logger", mock_logger)
+    return mock_logger
 
 
 # =============================================================================
 # Client Fixtures
 # =============================================================================
 
-@pytest.fixture
-def basic_auth_client(basic_auth_config):
-    """ServiceNow client with Basic authentication."""
-    return ServiceNowClient(basic_auth_config)
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Keep OAuth tokens cached by one test from leaking into the next."""
+    ServiceNowClient._token_cache.clear()
+    yield
+    ServiceNowClient._token_cache.clear()
+
+
+# Basic and API key clients hold no per-request state, and ClientConfig is
+# frozen, so one instance is safely shared by every test in a module. A
+# module-scoped fixture cannot request the function-scoped config fixtures,
+# hence the _basic_auth_config()/_api_key_config() helpers.
+
+@pytest.fixture(scope="module")
+def basic_auth_client():
+    """ServiceNow client with Basic authentication (shared per module)."""
+    return ServiceNowClient(_basic_auth_config())
 
 
 @pytest.fixture
 def oauth_client(oauth_config):
-    """ServiceNow client with OAuth authentication."""
+    """ServiceNow client with OAuth authentication.
+
+    Function-scoped: besides the shared ServiceNowClient._token_cache, which
+    clear_token_cache resets, each client keeps the token it last used on
+    the instance, so every test needs a client that has not fetched one yet.
+    """
     return ServiceNowClient(oauth_config)
 
 
-@pytest.fixture
-def api_key_client(api_key_config):
-    """ServiceNow client with API key authentication."""
-    return ServiceNowClient(api_key_config)
+@pytest.fixture(scope="module")
+def api_key_client():
+    """ServiceNow client with API key authentication (shared per module)."""
+    return ServiceNowClient(_api_key_config())
 
 
-@pytest.fixture
-def client_with_custom_timeout(basic_auth_config):
-    """ServiceNow client with custom timeout."""
-    return ServiceNowClient(basic_auth_config, timeout=120)
+@pytest.fixture(scope="module")
+def client_with_custom_timeout():
+    """ServiceNow client with custom timeout (shared per module)."""
+    return ServiceNowClient(_basic_auth_config(), timeout=120)
+
+
+@pytest.fixture(scope="session")
+def integration_client():
+    """Client for a real ServiceNow instance, shared by all integration tests.
+
+    The environment is checked once per session; tests requesting this
+    fixture are skipped unless an instance and some form of auth are set.
+    """
+    env = os.environ
+    has_auth = (
+        env.get('SERVICENOW_API_KEY')
+        or (env.get('SERVICENOW_USERNAME') and env.get('SERVICENOW_PASSWORD'))
+        or (env.get('SERVICENOW_CLIENT_ID') and env.get('SERVICENOW_CLIENT_SECRET'))
+    )
+    if not (env.get('SERVICENOW_INSTANCE') and has_auth):
+        pytest.skip("ServiceNow credentials not configured - skipping integration tests")
+    return create_client()
 
 
 # =============================================================================
@@ -100,51 +209,64 @@ def client_with_custom_timeout(basic_auth_config):
 @pytest.fixture
 def mock_success_response():
     """Mock successful API response."""
-    response = MagicMock()
-    response.read.return_value = b'{"result": [{"number": "INC0001", "sys_id": "abc123"}]}'
-    response.__enter__ = Mock(return_value=response)
-    response.__exit__ = Mock(return_value=False)
-    return response
+    return FakeResponse(b'{"result": [{"number": "INC0001", "sys_id": "abc123"}]}')
 
 
 @pytest.fixture
 def mock_empty_response():
     """Mock empty API response."""
-    response = MagicMock()
-    response.read.return_value = b'{"result": []}'
-    response.__enter__ = Mock(return_value=response)
-    response.__exit__ = Mock(return_value=False)
-    return response
+    return FakeResponse(b'{"result": []}')
 
 
 @pytest.fixture
 def mock_single_record_response():
     """Mock single record API response."""
-    response = MagicMock()
-    response.read.return_value = b'{"result": {"sys_id": "abc123", "number": "INC0001"}}'
-    response.__enter__ = Mock(return_value=response)
-    response.__exit__ = Mock(return_value=False)
-    return response
+    return FakeResponse(b'{"result": {"sys_id": "abc123", "number": "INC0001"}}')
 
 
 @pytest.fixture
 def mock_oauth_token_response():
     """Mock OAuth token response."""
-    response = MagicMock()
-    response.read.return_value = b'{"access_token": "test-token-123", "token_type": "Bearer"}'
-    response.__enter__ = Mock(return_value=response)
-    response.__exit__ = Mock(return_value=False)
-    return response
+    return FakeResponse(b'{"access_token": "test-token-123", "token_type": "Bearer"}')
 
 
 @pytest.fixture
 def mock_delete_response():
     """Mock successful DELETE response (empty body)."""
-    response = MagicMock()
-    response.read.return_value = b''
-    response.__enter__ = Mock(return_value=response)
-    response.__exit__ = Mock(return_value=False)
-    return response
+    return FakeResponse(b'')
+
+
+@pytest.fixture
+def make_http_error():
+    """Return a factory for the HTTPError urlopen raises on an error status.
+
+    Each call builds a fresh error, since the body stream can only be read once.
+    """
+    def _make(code=401, body=b'{"error": "Invalid credentials"}', headers=None,
+              url="https://test.service-now.com/api/now/table/incident"):
+        return HTTPError(url=url, code=code, msg=HTTPStatus(code).phrase,
+                         hdrs=headers if headers is not None else {}, fp=io.BytesIO(body))
+    return _make
+
+
+# =============================================================================
+# Transport Fixtures
+# =============================================================================
+
+@pytest.fixture
+def urlopen_mock(monkeypatch):
+    """Route servicenow_api.urlopen through a fresh UrlopenRouter."""
+    router = UrlopenRouter()
+    monkeypatch.setattr("servicenow_api.urlopen", router)
+    return router
+
+
+@pytest.fixture
+def sleep_mock(monkeypatch):
+    """Replace time.sleep in servicenow_api so retry backoff does not wait."""
+    mock_sleep = Mock()
+    monkeypatch.setattr("servicenow_api.time.sleep", mock_sleep)
+    return mock_sleep
 
 
 # =============================================================================
@@ -170,28 +292,13 @@ SERVICENOW_API_KEY="quoted-key"
 
 
 @pytest.fixture
-def malformed_env_content():
-    """Env file content with various malformed lines."""
-    return """
-# Valid lines
-SERVICENOW_INSTANCE=https://test.service-now.com
-SERVICENOW_USERNAME=admin
-
-# Malformed lines below
-MALFORMED_LINE_NO_EQUALS
-another bad line
-
-# More valid lines
-SERVICENOW_PASSWORD=secret
-"""
-
-
-@pytest.fixture
-def empty_env_content():
-    """Empty env file content."""
-    return """
-# Only comments
-
-# No actual values
-
-"""
+def env_loader(tmp_path):
+    """Return a function that writes the given content to an env file and loads it.
+
+    Parsing cases live in ENV_FILE_CASES in test_servicenow_api.py.
+    """
+    def _load(content):
+        env_file = tmp_path / "env"
+        env_file.write_text(content)
+        return load_env_file(env_file)
+    return _load
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test Doubles for the ServiceNow API Tests
+
+Plain classes shared by conftest.py fixtures and the test modules. They live
+here rather than in conftest.py so tests can import them directly.
+"""
+
+
+class FakeResponse:
+    """Minimal stand-in for the response returned by urlopen.
+
+    Cheaper than a MagicMock wired up with __enter__/__exit__/read, and
+    read() returns the whole body on every call so one instance can be
+    handed out for several requests.
+    """
+
+    __slots__ = ("body", "status", "headers")
+
+    def __init__(self, body: bytes = b"", status: int = 200, headers=None):
+        self.body = body
+        self.status = status
+        self.headers = headers if headers is not None else {}
+
+    def read(self) -> bytes:
+        return self.body
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+class UrlopenRouter:
+    """Stand-in for servicenow_api.urlopen that answers requests by URL.
+
+    Register responses with add(); each matching request takes the next one,
+    and the last one keeps answering once the others are used up. Exceptions
+    are raised instead of returned. Every call is recorded in calls as a
+    (request, timeout) pair.
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.calls = []
+
+    def add(self, url_fragment, *responses):
+        """Answer requests whose URL contains url_fragment with responses."""
+        self.routes.append((url_fragment, list(responses)))
+
+    def __call__(self, request, timeout=None, context=None):
+        self.calls.append((request, timeout))
+        url = request.get_full_url()
+        for url_fragment, responses in self.routes:
+            if url_fragment in url:
+                response = responses.pop(0) if len(responses) > 1 else responses[0]
+                if isinstance(response, BaseException):
+                    raise response
+                return response
+        raise AssertionError(f"No response registered for {url}")
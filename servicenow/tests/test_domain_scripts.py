@@ -12,7 +12,6 @@ SNOW-17: Verify All Domain Scripts
 - Verify ValidationError is raised for invalid actions
 """
 
-import sys
 import ast
 import unittest
 from pathlib import Path
@@ -22,9 +21,7 @@ from unittest.mock import patch, MagicMock
 # Get the project root directory (parent of tests/)
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
-
-# Add scripts directory to path for imports
-sys.path.insert(0, str(SCRIPTS_DIR))
+# scripts/ is put on sys.path once per session by conftest.py
 
 
 class TestIncidentsScript(unittest.TestCase):
@@ -1138,7 +1135,3 @@ class TestErrorHandling(unittest.TestCase):
                             f"{module_name} error message should mention '{action}' as valid action"
                         )
 
-
-if __name__ == "__main__":
-    # Run tests with verbosity
-    unittest.main(verbosity=2)
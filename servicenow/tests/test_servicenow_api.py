@@ -14,30 +14,33 @@ Configure credentials in ~/.claude/env or set environment variables:
   - SERVICENOW_API_KEY (for API key auth)
 
 Run with: python -m pytest tests/test_servicenow_api.py -v
-Or: python tests/test_servicenow_api.py
 """
 
-import os
-import sys
 import json
 import socket
+import subprocess
+import sys
+import ssl
 import unittest
 import base64
+import gzip
+import http.client
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
-from io import StringIO, BytesIO
-from unittest.mock import patch, MagicMock, Mock
+from types import SimpleNamespace
+from io import BytesIO, StringIO, TextIOWrapper
+from unittest.mock import patch
 from urllib.error import HTTPError, URLError
+from urllib.request import Request
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
-# Get the project root directory (parent of tests/)
-PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-SCRIPTS_DIR = PROJECT_ROOT / "scripts"
-
-# Add scripts directory to path for imports
-sys.path.insert(0, str(SCRIPTS_DIR))
+from tests.helpers import FakeResponse
 
+# scripts/ is put on sys.path once per session by conftest.py
 from servicenow_api import (
+    ClientConfig,
     ServiceNowClient,
     ServiceNowError,
     ValidationError,
@@ -45,14 +48,45 @@ from servicenow_api import (
     NotFoundError,
     ConfigurationError,
     RateLimitError,
+    NetworkError,
     create_client,
     read_json_input,
     output_json,
     output_error,
     load_env_file,
     get_config,
+    clear_config_cache,
     _parse_quoted_value,
     _validate_credential,
+    _ConnectionPool,
+    _query_params,
+)
+
+
+# Response bodies shared by many tests
+RATE_LIMIT_BODY = b'{"error": {"message": "Rate limit exceeded"}}'
+SERVER_ERROR_BODY = b'{"error": {"message": "Server error"}}'
+EMPTY_RESULT_BODY = b'{"result": []}'
+TEST_TOKEN_BODY = b'{"access_token": "test-token-123", "token_type": "Bearer"}'
+OLD_TOKEN_BODY = b'{"access_token": "old-token", "token_type": "Bearer"}'
+NEW_TOKEN_BODY = b'{"access_token": "new-token", "token_type": "Bearer"}'
+
+# Shared by the OAuth tests; ClientConfig is frozen, so no per-test copy
+OAUTH_CONFIG = ClientConfig(
+    instance="https://test.service-now.com",
+    client_id="test-client-id",
+    client_secret="test-client-secret",
+)
+
+# URL fragments requests are routed on by the urlopen_mock fixture
+INCIDENT_PATH = "/api/now/table/incident"
+OAUTH_TOKEN_PATH = "/oauth_token.do"
+
+# URL of client.get("incident", query="state=1", limit=10); sysparm_* params
+# are always encoded in the same order, so requests can be compared exactly
+INCIDENT_QUERY_URL = (
+    "https://test.service-now.com/api/now/table/incident"
+    "?sysparm_limit=10&sysparm_query=state%3D1"
 )
 
 
@@ -60,205 +94,194 @@ from servicenow_api import (
 # Unit Tests - Error Handling Classes
 # =============================================================================
 
-class TestServiceNowErrorClasses(unittest.TestCase):
-    """Test error handling classes."""
-
-    def test_servicenow_error_basic(self):
-        """ServiceNowError should store message and optional fields."""
-        error = ServiceNowError("Test error")
-        self.assertEqual(str(error), "Test error")
-        self.assertEqual(error.message, "Test error")
-        self.assertIsNone(error.status_code)
-        self.assertIsNone(error.response_body)
-
-    def test_servicenow_error_with_status_code(self):
-        """ServiceNowError should store status code."""
-        error = ServiceNowError("Test error", status_code=500)
-        self.assertEqual(error.status_code, 500)
-
-    def test_servicenow_error_with_response_body(self):
-        """ServiceNowError should store response body."""
-        error = ServiceNowError("Test error", response_body='{"detail": "error"}')
-        self.assertEqual(error.response_body, '{"detail": "error"}')
-
-    def test_servicenow_error_to_dict_basic(self):
-        """to_dict should return error message."""
-        error = ServiceNowError("Test error")
-        result = error.to_dict()
-        self.assertEqual(result, {"error": "Test error"})
-
-    def test_servicenow_error_to_dict_with_status(self):
-        """to_dict should include status code when present."""
-        error = ServiceNowError("Test error", status_code=404)
-        result = error.to_dict()
-        self.assertEqual(result["error"], "Test error")
-        self.assertEqual(result["status_code"], 404)
-
-    def test_servicenow_error_to_dict_with_json_body(self):
-        """to_dict should parse JSON response body."""
-        error = ServiceNowError(
-            "Test error",
-            status_code=400,
-            response_body='{"error": {"message": "Validation failed"}}'
-        )
-        result = error.to_dict()
-        self.assertEqual(result["details"], {"error": {"message": "Validation failed"}})
-
-    def test_servicenow_error_to_dict_with_non_json_body(self):
-        """to_dict should include raw body when not JSON."""
-        error = ServiceNowError("Test error", response_body="Not JSON")
-        result = error.to_dict()
-        self.assertEqual(result["details"], "Not JSON")
-
-    def test_authentication_error_inheritance(self):
-        """AuthenticationError should inherit from ServiceNowError."""
-        error = AuthenticationError("Auth failed", status_code=401)
-        self.assertIsInstance(error, ServiceNowError)
-        self.assertEqual(error.status_code, 401)
-
-    def test_configuration_error_inheritance(self):
-        """ConfigurationError should inherit from ServiceNowError."""
-        error = ConfigurationError("Config missing")
-        self.assertIsInstance(error, ServiceNowError)
-
-    def test_not_found_error_inheritance(self):
-        """NotFoundError should inherit from ServiceNowError."""
-        error = NotFoundError("Resource not found", status_code=404)
-        self.assertIsInstance(error, ServiceNowError)
-        self.assertEqual(error.status_code, 404)
-
-    def test_rate_limit_error_inheritance(self):
-        """RateLimitError should inherit from ServiceNowError."""
-        error = RateLimitError("Rate limited", status_code=429)
-        self.assertIsInstance(error, ServiceNowError)
-        self.assertEqual(error.status_code, 429)
-
-    def test_validation_error_inheritance(self):
-        """ValidationError should inherit from ServiceNowError."""
-        error = ValidationError("Invalid input", status_code=400)
-        self.assertIsInstance(error, ServiceNowError)
+def test_servicenow_error_basic():
+    """ServiceNowError should store message and optional fields."""
+    error = ServiceNowError("Test error")
+    assert str(error) == "Test error"
+    assert error.message == "Test error"
+    assert error.status_code is None
+    assert error.response_body is None
 
 
-# =============================================================================
-# Unit Tests - Quote Parsing
-# =============================================================================
+def test_servicenow_error_with_status_code():
+    """ServiceNowError should store status code."""
+    error = ServiceNowError("Test error", status_code=500)
+    assert error.status_code == 500
 
-class TestQuoteParsing(unittest.TestCase):
-    """Test quote parsing for env file values."""
 
-    def test_parse_empty_value(self):
-        """_parse_quoted_value should handle empty string."""
-        self.assertEqual(_parse_quoted_value(""), "")
+def test_servicenow_error_with_response_body():
+    """ServiceNowError should store response body."""
+    error = ServiceNowError("Test error", response_body='{"detail": "error"}')
+    assert error.response_body == '{"detail": "error"}'
 
-    def test_parse_unquoted_value(self):
-        """_parse_quoted_value should return unquoted values unchanged."""
-        self.assertEqual(_parse_quoted_value("simple_value"), "simple_value")
 
-    def test_parse_double_quoted_value(self):
-        """_parse_quoted_value should remove double quotes."""
-        self.assertEqual(_parse_quoted_value('"quoted"'), "quoted")
+def test_servicenow_error_to_dict_basic():
+    """to_dict should return error message."""
+    error = ServiceNowError("Test error")
+    result = error.to_dict()
+    assert result == {"error": "Test error", "code": "api_error"}
 
-    def test_parse_single_quoted_value(self):
-        """_parse_quoted_value should remove single quotes."""
-        self.assertEqual(_parse_quoted_value("'quoted'"), "quoted")
 
-    def test_parse_escaped_double_quote(self):
-        """_parse_quoted_value should handle escaped double quotes."""
-        self.assertEqual(_parse_quoted_value('"value \\"with\\" quotes"'), 'value "with" quotes')
+def test_servicenow_error_to_dict_with_status():
+    """to_dict should include status code when present."""
+    error = ServiceNowError("Test error", status_code=404)
+    result = error.to_dict()
+    assert result["error"] == "Test error"
+    assert result["status_code"] == 404
 
-    def test_parse_escaped_single_quote(self):
-        """_parse_quoted_value should handle escaped single quotes."""
-        self.assertEqual(_parse_quoted_value("'value \\'with\\' quotes'"), "value 'with' quotes")
 
-    def test_parse_escaped_backslash(self):
-        """_parse_quoted_value should handle escaped backslashes."""
-        self.assertEqual(_parse_quoted_value('"value \\\\with\\\\ backslash"'), 'value \\with\\ backslash')
+def test_servicenow_error_to_dict_with_json_body():
+    """to_dict should parse JSON response body."""
+    error = ServiceNowError(
+        "Test error",
+        status_code=400,
+        response_body='{"error": {"message": "Validation failed"}}'
+    )
+    result = error.to_dict()
+    assert result["details"] == {"error": {"message": "Validation failed"}}
 
-    def test_parse_complex_escaped_value(self):
-        """_parse_quoted_value should handle complex escaped strings."""
-        self.assertEqual(_parse_quoted_value('"pass\\"word\\\\123"'), 'pass"word\\123')
 
-    def test_parse_whitespace_handling(self):
-        """_parse_quoted_value should strip surrounding whitespace."""
-        self.assertEqual(_parse_quoted_value('  "quoted"  '), "quoted")
+def test_servicenow_error_to_dict_with_non_json_body():
+    """to_dict should include raw body when not JSON."""
+    error = ServiceNowError("Test error", response_body="Not JSON")
+    result = error.to_dict()
+    assert result["details"] == "Not JSON"
 
-    def test_parse_empty_quoted_string(self):
-        """_parse_quoted_value should handle empty quoted strings."""
-        self.assertEqual(_parse_quoted_value('""'), "")
-        self.assertEqual(_parse_quoted_value("''"), "")
 
-    # SNOW-38: Escape sequence tests
-    def test_parse_newline_escape_double_quotes(self):
-        """_parse_quoted_value should handle \\n in double-quoted strings."""
-        self.assertEqual(_parse_quoted_value('"line1\\nline2"'), "line1\nline2")
+def test_servicenow_error_to_dict_parses_body_once():
+    """to_dict should reuse the parsed body across repeated calls."""
+    error = ServiceNowError("Test error", response_body='{"error": "x"}')
+    with patch('servicenow_api._json_loads', wraps=json.loads) as mock_loads:
+        first = error.to_dict()
+        second = error.to_dict()
+    assert first == second
+    mock_loads.assert_called_once()
 
-    def test_parse_tab_escape_double_quotes(self):
-        """_parse_quoted_value should handle \\t in double-quoted strings."""
-        self.assertEqual(_parse_quoted_value('"col1\\tcol2"'), "col1\tcol2")
 
-    def test_parse_newline_escape_single_quotes(self):
-        """_parse_quoted_value should handle \\n in single-quoted strings."""
-        self.assertEqual(_parse_quoted_value("'line1\\nline2'"), "line1\nline2")
+def test_servicenow_error_decodes_bytes_body_lazily():
+    """A bytes response body should be exposed as text and still parse."""
+    error = ServiceNowError("Test error", status_code=500,
+                            response_body=b'{"detail": "caf\xc3\xa9"}')
+    assert error.response_body == '{"detail": "café"}'
+    assert error.to_dict()["details"] == {"detail": "café"}
 
-    def test_parse_tab_escape_single_quotes(self):
-        """_parse_quoted_value should handle \\t in single-quoted strings."""
-        self.assertEqual(_parse_quoted_value("'col1\\tcol2'"), "col1\tcol2")
 
-    def test_parse_combined_escape_sequences(self):
-        """_parse_quoted_value should handle multiple escape sequences together."""
-        self.assertEqual(
-            _parse_quoted_value('"name\\tvalue\\nkey\\tdata"'),
-            "name\tvalue\nkey\tdata"
-        )
+def test_servicenow_error_undecodable_body_does_not_raise():
+    """Invalid UTF-8 in an error body should not mask the original error."""
+    error = ServiceNowError("Test error", response_body=b"\xff\xfe bad")
+    assert "bad" in error.response_body
 
-    def test_parse_escape_sequences_with_backslash(self):
-        """_parse_quoted_value should handle escape sequences alongside backslashes."""
-        # \\\\n should become \n (literal backslash followed by 'n')
-        self.assertEqual(_parse_quoted_value('"path\\\\nfile"'), 'path\\nfile')
-        # \\\\ followed by \\n should become \ followed by newline
-        self.assertEqual(_parse_quoted_value('"\\\\\\n"'), '\\\n')
-
-    def test_parse_escape_sequences_unquoted_unchanged(self):
-        """_parse_quoted_value should not process escape sequences in unquoted strings."""
-        # Unquoted strings should be returned as-is
-        self.assertEqual(_parse_quoted_value('value\\nwith\\tescapes'), 'value\\nwith\\tescapes')
-
-    # SNOW-48: Carriage return escape sequence tests
-    def test_parse_carriage_return_escape_double_quotes(self):
-        """_parse_quoted_value should handle \\r in double-quoted strings."""
-        self.assertEqual(_parse_quoted_value('"line1\\rline2"'), "line1\rline2")
-
-    def test_parse_carriage_return_escape_single_quotes(self):
-        """_parse_quoted_value should handle \\r in single-quoted strings."""
-        self.assertEqual(_parse_quoted_value("'line1\\rline2'"), "line1\rline2")
-
-    def test_parse_crlf_escape_sequence(self):
-        """_parse_quoted_value should handle \\r\\n (CRLF) in quoted strings."""
-        self.assertEqual(_parse_quoted_value('"line1\\r\\nline2"'), "line1\r\nline2")
-
-    def test_parse_carriage_return_with_other_escapes(self):
-        """_parse_quoted_value should handle \\r combined with other escape sequences."""
-        self.assertEqual(
-            _parse_quoted_value('"col1\\tcol2\\r\\nrow2col1\\trow2col2"'),
-            "col1\tcol2\r\nrow2col1\trow2col2"
-        )
+
+@pytest.mark.parametrize("error_class,code", [
+    (ServiceNowError, "api_error"),
+    (AuthenticationError, "authentication_failed"),
+    (ConfigurationError, "configuration_error"),
+    (NotFoundError, "not_found"),
+    (RateLimitError, "rate_limited"),
+    (NetworkError, "connection_error"),
+    (ValidationError, "validation_error"),
+])
+def test_error_classes_have_stable_codes(error_class, code):
+    """Each error class should expose its code and report it in to_dict."""
+    error = error_class("Something failed")
+    assert error.code == code
+    assert error.to_dict()["code"] == code
+
+
+def test_authentication_error_inheritance():
+    """AuthenticationError should inherit from ServiceNowError."""
+    error = AuthenticationError("Auth failed", status_code=401)
+    assert isinstance(error, ServiceNowError)
+    assert error.status_code == 401
+
+
+def test_configuration_error_inheritance():
+    """ConfigurationError should inherit from ServiceNowError."""
+    error = ConfigurationError("Config missing")
+    assert isinstance(error, ServiceNowError)
+
+
+def test_not_found_error_inheritance():
+    """NotFoundError should inherit from ServiceNowError."""
+    error = NotFoundError("Resource not found", status_code=404)
+    assert isinstance(error, ServiceNowError)
+    assert error.status_code == 404
+
+
+def test_rate_limit_error_inheritance():
+    """RateLimitError should inherit from ServiceNowError."""
+    error = RateLimitError("Rate limited", status_code=429)
+    assert isinstance(error, ServiceNowError)
+    assert error.status_code == 429
+
+
+def test_validation_error_inheritance():
+    """ValidationError should inherit from ServiceNowError."""
+    error = ValidationError("Invalid input", status_code=400)
+    assert isinstance(error, ServiceNowError)
+
+
+# =============================================================================
+# Unit Tests - Quote Parsing
+# =============================================================================
+
+# Each case: (raw env value, expected parsed value)
+QUOTE_CASES = [
+    pytest.param("", "", id="empty_value"),
+    pytest.param("simple_value", "simple_value", id="unquoted_value"),
+    pytest.param('"quoted"', "quoted", id="double_quoted_value"),
+    pytest.param("'quoted'", "quoted", id="single_quoted_value"),
+    pytest.param('"value \\"with\\" quotes"', 'value "with" quotes', id="escaped_double_quote"),
+    pytest.param("'value \\'with\\' quotes'", "value 'with' quotes", id="escaped_single_quote"),
+    pytest.param('"value \\\\with\\\\ backslash"', 'value \\with\\ backslash', id="escaped_backslash"),
+    pytest.param('"pass\\"word\\\\123"', 'pass"word\\123', id="complex_escaped_value"),
+    pytest.param('  "quoted"  ', "quoted", id="whitespace_handling"),
+    pytest.param('""', "", id="empty_double_quoted_string"),
+    pytest.param("''", "", id="empty_single_quoted_string"),
+    # SNOW-38: Escape sequences
+    pytest.param('"line1\\nline2"', "line1\nline2", id="newline_escape_double_quotes"),
+    pytest.param('"col1\\tcol2"', "col1\tcol2", id="tab_escape_double_quotes"),
+    pytest.param("'line1\\nline2'", "line1\nline2", id="newline_escape_single_quotes"),
+    pytest.param("'col1\\tcol2'", "col1\tcol2", id="tab_escape_single_quotes"),
+    pytest.param('"name\\tvalue\\nkey\\tdata"', "name\tvalue\nkey\tdata", id="combined_escape_sequences"),
+    # \\\\n should become \n (literal backslash followed by 'n')
+    pytest.param('"path\\\\nfile"', 'path\\nfile', id="escaped_backslash_before_n"),
+    # \\\\ followed by \\n should become \ followed by newline
+    pytest.param('"\\\\\\n"', '\\\n', id="escaped_backslash_then_newline"),
+    # Unquoted strings should be returned as-is
+    pytest.param('value\\nwith\\tescapes', 'value\\nwith\\tescapes', id="escape_sequences_unquoted_unchanged"),
+    # SNOW-48: Carriage return escape sequences
+    pytest.param('"line1\\rline2"', "line1\rline2", id="carriage_return_escape_double_quotes"),
+    pytest.param("'line1\\rline2'", "line1\rline2", id="carriage_return_escape_single_quotes"),
+    pytest.param('"line1\\r\\nline2"', "line1\r\nline2", id="crlf_escape_sequence"),
+    pytest.param(
+        '"col1\\tcol2\\r\\nrow2col1\\trow2col2"',
+        "col1\tcol2\r\nrow2col1\trow2col2",
+        id="carriage_return_with_other_escapes",
+    ),
+]
+
+
+@pytest.mark.parametrize("raw,expected", QUOTE_CASES)
+def test_parse_quoted_value(raw, expected):
+    """_parse_quoted_value should unquote values and resolve escape sequences."""
+    assert _parse_quoted_value(raw) == expected
 
 
 # =============================================================================
 # Unit Tests - Environment Loading
 # =============================================================================
 
-class TestEnvLoading(unittest.TestCase):
-    """Test environment file loading."""
+def test_load_env_file_nonexistent():
+    """load_env_file should return empty dict for nonexistent file."""
+    result = load_env_file(Path("/nonexistent/path/.claude/env"))
+    assert result == {}
 
-    def test_load_env_file_nonexistent(self):
-        """load_env_file should return empty dict for nonexistent file."""
-        result = load_env_file(Path("/nonexistent/path/.claude/env"))
-        self.assertEqual(result, {})
 
-    def test_load_env_file_with_mock(self):
-        """load_env_file should parse KEY=VALUE format."""
-        env_content = """
+def test_load_env_file_parses_key_value_lines(tmp_path):
+    """load_env_file should parse KEY=VALUE format."""
+    env_file = tmp_path / "env"
+    env_file.write_text("""
 # Comment line
 SERVICENOW_INSTANCE=https://test.service-now.com
 SERVICENOW_USERNAME=admin
@@ -267,159 +290,173 @@ SERVICENOW_PASSWORD=secret
 # Another comment
 SERVICENOW_API_KEY="quoted-key"
 SINGLE_QUOTED='single-quoted-value'
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
-
-                self.assertEqual(result["SERVICENOW_INSTANCE"], "https://test.service-now.com")
-                self.assertEqual(result["SERVICENOW_USERNAME"], "admin")
-                self.assertEqual(result["SERVICENOW_PASSWORD"], "secret")
-                self.assertEqual(result["SERVICENOW_API_KEY"], "quoted-key")
-                self.assertEqual(result["SINGLE_QUOTED"], "single-quoted-value")
-
-    def test_get_config_missing_instance(self):
-        """get_config should raise ConfigurationError if instance is missing."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_INSTANCE", str(context.exception))
-
-    def test_get_config_missing_auth(self):
-        """get_config should raise ConfigurationError if no auth is configured."""
-        with patch.dict(os.environ, {"SERVICENOW_INSTANCE": "https://test.service-now.com"}, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("authentication", str(context.exception).lower())
-
-    def test_get_config_basic_auth(self):
-        """get_config should accept basic auth credentials."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_USERNAME": "admin",
-            "SERVICENOW_PASSWORD": "secret"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["instance"], "https://test.service-now.com")
-                self.assertEqual(config["username"], "admin")
-                self.assertEqual(config["password"], "secret")
-
-    def test_get_config_oauth(self):
-        """get_config should accept OAuth credentials."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_CLIENT_ID": "client123",
-            "SERVICENOW_CLIENT_SECRET": "secret456"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["client_id"], "client123")
-                self.assertEqual(config["client_secret"], "secret456")
-
-    def test_get_config_api_key(self):
-        """get_config should accept API key."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "api-key-123"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["api_key"], "api-key-123")
-
-    def test_get_config_strips_trailing_slash(self):
-        """get_config should strip trailing slash from instance URL."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com/",
-            "SERVICENOW_API_KEY": "key"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["instance"], "https://test.service-now.com")
-
-    # SNOW-38: Timeout environment variable tests
-    def test_get_config_timeout_from_env(self):
-        """get_config should read SERVICENOW_TIMEOUT from environment."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key",
-            "SERVICENOW_TIMEOUT": "60"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["timeout"], 60)
-
-    def test_get_config_timeout_from_env_file(self):
-        """get_config should read SERVICENOW_TIMEOUT from env file."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key"
-        }
-        file_vars = {"SERVICENOW_TIMEOUT": "90"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value=file_vars):
-                config = get_config()
-                self.assertEqual(config["timeout"], 90)
-
-    def test_get_config_timeout_env_overrides_file(self):
-        """Environment variable SERVICENOW_TIMEOUT should override env file."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key",
-            "SERVICENOW_TIMEOUT": "120"
-        }
-        file_vars = {"SERVICENOW_TIMEOUT": "60"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value=file_vars):
-                config = get_config()
-                self.assertEqual(config["timeout"], 120)
-
-    def test_get_config_timeout_invalid_value(self):
-        """get_config should handle invalid SERVICENOW_TIMEOUT gracefully."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key",
-            "SERVICENOW_TIMEOUT": "not-a-number"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertIsNone(config["timeout"])
-
-    # SNOW-48: Timeout warning test
-    def test_get_config_timeout_invalid_value_logs_warning(self):
-        """get_config should log a warning when SERVICENOW_TIMEOUT is invalid."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key",
-            "SERVICENOW_TIMEOUT": "invalid-timeout"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with patch('servicenow_api.logger') as mock_logger:
-                    config = get_config()
-                    mock_logger.warning.assert_called_once()
-                    warning_call = mock_logger.warning.call_args
-                    self.assertIn("invalid-timeout", str(warning_call))
-                    self.assertIsNone(config["timeout"])
-
-    def test_get_config_timeout_not_set(self):
-        """get_config should return None timeout when not configured."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_API_KEY": "key"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertIsNone(config["timeout"])
+""")
+
+    result = load_env_file(env_file)
+
+    assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
+    assert result["SERVICENOW_USERNAME"] == "admin"
+    assert result["SERVICENOW_PASSWORD"] == "secret"
+    assert result["SERVICENOW_API_KEY"] == "quoted-key"
+    assert result["SINGLE_QUOTED"] == "single-quoted-value"
+
+
+def test_get_config_missing_instance(config_env):
+    """get_config should raise ConfigurationError if instance is missing."""
+    config_env({})
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_INSTANCE"):
+        get_config()
+
+
+def test_get_config_missing_auth(config_env):
+    """get_config should raise ConfigurationError if no auth is configured."""
+    config_env({"SERVICENOW_INSTANCE": "https://test.service-now.com"})
+    with pytest.raises(ConfigurationError, match=r"(?i)authentication"):
+        get_config()
+
+
+# SNOW-48: Timeout warning test
+def test_get_config_timeout_invalid_value_logs_warning(config_env, logger_mock):
+    """get_config should log a warning when SERVICENOW_TIMEOUT is invalid."""
+    config_env({
+        "SERVICENOW_INSTANCE": "https://test.service-now.com",
+        "SERVICENOW_API_KEY": "key",
+        "SERVICENOW_TIMEOUT": "invalid-timeout"
+    })
+    config = get_config()
+    logger_mock.warning.assert_called_once()
+    warning_call = logger_mock.warning.call_args
+    assert "invalid-timeout" in str(warning_call)
+    assert config["timeout"] is None
+
+
+# Each case: (environment variables, env file variables, expected config subset)
+GET_CONFIG_CASES = [
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com",
+         "SERVICENOW_USERNAME": "admin", "SERVICENOW_PASSWORD": "secret"},
+        {},
+        {"instance": "https://test.service-now.com", "username": "admin", "password": "secret"},
+        id="basic_auth",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com",
+         "SERVICENOW_CLIENT_ID": "client123", "SERVICENOW_CLIENT_SECRET": "secret456"},
+        {},
+        {"client_id": "client123", "client_secret": "secret456"},
+        id="oauth",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "api-key-123"},
+        {},
+        {"api_key": "api-key-123"},
+        id="api_key",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com/", "SERVICENOW_API_KEY": "key"},
+        {},
+        {"instance": "https://test.service-now.com"},
+        id="strips_trailing_slash",
+    ),
+    # SNOW-38: Timeout environment variable cases
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "key",
+         "SERVICENOW_TIMEOUT": "60"},
+        {},
+        {"timeout": 60},
+        id="timeout_from_env",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "key"},
+        {"SERVICENOW_TIMEOUT": "90"},
+        {"timeout": 90},
+        id="timeout_from_env_file",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "key",
+         "SERVICENOW_TIMEOUT": "120"},
+        {"SERVICENOW_TIMEOUT": "60"},
+        {"timeout": 120},
+        id="timeout_env_overrides_file",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "key",
+         "SERVICENOW_TIMEOUT": "not-a-number"},
+        {},
+        {"timeout": None},
+        id="timeout_invalid_value",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "key"},
+        {},
+        {"timeout": None},
+        id="timeout_not_set",
+    ),
+    # SNOW-61: Leading/trailing whitespace is stripped from valid credentials
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "  https://test.service-now.com  ",
+         "SERVICENOW_API_KEY": "  my-api-key  "},
+        {},
+        {"instance": "https://test.service-now.com", "api_key": "my-api-key"},
+        id="strips_whitespace_from_valid_credentials",
+    ),
+    pytest.param(
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com",
+         "SERVICENOW_USERNAME": "  admin  ", "SERVICENOW_PASSWORD": "  secret123  "},
+        {},
+        {"username": "admin", "password": "secret123"},
+        id="strips_whitespace_from_basic_auth",
+    ),
+]
+
+
+@pytest.mark.parametrize("env_vars,file_vars,expected", GET_CONFIG_CASES)
+def test_get_config(config_env, env_vars, file_vars, expected):
+    """get_config should merge env vars over env file values and normalize them."""
+    config_env(env_vars, file_vars)
+
+    config = get_config()
+
+    for key, value in expected.items():
+        assert config[key] == value
+
+
+def test_get_config_cached_until_environment_changes(clean_env, monkeypatch):
+    """get_config should reuse its result until a relevant env var changes."""
+    monkeypatch.setenv("SERVICENOW_INSTANCE", "https://test.service-now.com")
+    monkeypatch.setenv("SERVICENOW_API_KEY", "key")
+    with patch('servicenow_api.load_env_file', return_value={}) as mock_load:
+        first = get_config()
+        second = get_config()
+        assert mock_load.call_count == 1
+        assert first == second
+
+        monkeypatch.setenv("SERVICENOW_API_KEY", "rotated-key")
+        assert get_config()["api_key"] == "rotated-key"
+        assert mock_load.call_count == 2
+
+
+def test_get_config_reloads_when_env_file_changes(clean_env, monkeypatch, tmp_path):
+    """get_config should pick up an edited env file instead of its cached result."""
+    env_file = tmp_path / "env"
+    monkeypatch.setattr('servicenow_api._default_env_paths', lambda: [env_file])
+    env_file.write_text("SERVICENOW_INSTANCE=https://test.service-now.com\nSERVICENOW_API_KEY=key\n")
+    assert get_config()["api_key"] == "key"
+
+    env_file.write_text("SERVICENOW_INSTANCE=https://test.service-now.com\nSERVICENOW_API_KEY=rotated-key\n")
+
+    assert get_config()["api_key"] == "rotated-key"
+
+
+def test_clear_config_cache_forces_reload(clean_env, monkeypatch):
+    """clear_config_cache should discard the cached configuration."""
+    monkeypatch.setenv("SERVICENOW_INSTANCE", "https://test.service-now.com")
+    monkeypatch.setenv("SERVICENOW_API_KEY", "key")
+    with patch('servicenow_api.load_env_file', return_value={}) as mock_load:
+        get_config()
+        clear_config_cache()
+        get_config()
+    assert mock_load.call_count == 2
 
 
 # =============================================================================
@@ -465,24 +502,18 @@ class TestCredentialValidation(unittest.TestCase):
 
     def test_validate_credential_whitespace_only_raises_error(self):
         """_validate_credential should raise ConfigurationError for whitespace-only value."""
-        with self.assertRaises(ConfigurationError) as context:
+        with pytest.raises(ConfigurationError, match=r"SERVICENOW_API_KEY contains only whitespace"):
             _validate_credential("   ", "SERVICENOW_API_KEY")
-        self.assertIn("SERVICENOW_API_KEY", str(context.exception))
-        self.assertIn("whitespace", str(context.exception).lower())
 
     def test_validate_credential_tabs_only_raises_error(self):
         """_validate_credential should raise ConfigurationError for tabs-only value."""
-        with self.assertRaises(ConfigurationError) as context:
+        with pytest.raises(ConfigurationError, match=r"SERVICENOW_PASSWORD contains only whitespace"):
             _validate_credential("\t\t", "SERVICENOW_PASSWORD")
-        self.assertIn("SERVICENOW_PASSWORD", str(context.exception))
-        self.assertIn("whitespace", str(context.exception).lower())
 
     def test_validate_credential_mixed_whitespace_only_raises_error(self):
         """_validate_credential should raise ConfigurationError for mixed whitespace-only."""
-        with self.assertRaises(ConfigurationError) as context:
+        with pytest.raises(ConfigurationError, match=r"SERVICENOW_CLIENT_SECRET contains only whitespace"):
             _validate_credential(" \t \n ", "SERVICENOW_CLIENT_SECRET")
-        self.assertIn("SERVICENOW_CLIENT_SECRET", str(context.exception))
-        self.assertIn("whitespace", str(context.exception).lower())
 
     def test_validate_credential_preserves_internal_whitespace(self):
         """_validate_credential should preserve internal whitespace in values."""
@@ -538,94 +569,59 @@ class TestCredentialValidation(unittest.TestCase):
         result = _validate_credential(unicode_key, "TEST_CRED")
         self.assertEqual(result, "api-key-αβγ")
 
-    def test_get_config_whitespace_username_raises_error(self):
-        """get_config should raise ConfigurationError for whitespace-only username."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_USERNAME": "   ",
-            "SERVICENOW_PASSWORD": "valid-password"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_USERNAME", str(context.exception))
-
-    def test_get_config_whitespace_password_raises_error(self):
-        """get_config should raise ConfigurationError for whitespace-only password."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_USERNAME": "valid-user",
-            "SERVICENOW_PASSWORD": "   "
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_PASSWORD", str(context.exception))
-
-    def test_get_config_whitespace_client_id_raises_error(self):
-        """get_config should raise ConfigurationError for whitespace-only client_id."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_CLIENT_ID": "   ",
-            "SERVICENOW_CLIENT_SECRET": "valid-secret"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_CLIENT_ID", str(context.exception))
-
-    def test_get_config_whitespace_client_secret_raises_error(self):
-        """get_config should raise ConfigurationError for whitespace-only client_secret."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_CLIENT_ID": "valid-client-id",
-            "SERVICENOW_CLIENT_SECRET": "   "
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_CLIENT_SECRET", str(context.exception))
-
-    def test_get_config_whitespace_instance_raises_error(self):
-        """get_config should raise ConfigurationError for whitespace-only instance."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "   ",
-            "SERVICENOW_API_KEY": "valid-key"
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with self.assertRaises(ConfigurationError) as context:
-                    get_config()
-                self.assertIn("SERVICENOW_INSTANCE", str(context.exception))
-
-    def test_get_config_strips_whitespace_from_valid_credentials(self):
-        """get_config should strip leading/trailing whitespace from valid credentials."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "  https://test.service-now.com  ",
-            "SERVICENOW_API_KEY": "  my-api-key  "
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["instance"], "https://test.service-now.com")
-                self.assertEqual(config["api_key"], "my-api-key")
-
-    def test_get_config_strips_whitespace_from_basic_auth(self):
-        """get_config should strip whitespace from basic auth credentials."""
-        env_vars = {
-            "SERVICENOW_INSTANCE": "https://test.service-now.com",
-            "SERVICENOW_USERNAME": "  admin  ",
-            "SERVICENOW_PASSWORD": "  secret123  "
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                config = get_config()
-                self.assertEqual(config["username"], "admin")
-                self.assertEqual(config["password"], "secret123")
+
+def test_get_config_whitespace_username_raises_error(config_env):
+    """get_config should raise ConfigurationError for whitespace-only username."""
+    config_env({
+        "SERVICENOW_INSTANCE": "https://test.service-now.com",
+        "SERVICENOW_USERNAME": "   ",
+        "SERVICENOW_PASSWORD": "valid-password"
+    })
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_USERNAME"):
+        get_config()
+
+
+def test_get_config_whitespace_password_raises_error(config_env):
+    """get_config should raise ConfigurationError for whitespace-only password."""
+    config_env({
+        "SERVICENOW_INSTANCE": "https://test.service-now.com",
+        "SERVICENOW_USERNAME": "valid-user",
+        "SERVICENOW_PASSWORD": "   "
+    })
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_PASSWORD"):
+        get_config()
+
+
+def test_get_config_whitespace_client_id_raises_error(config_env):
+    """get_config should raise ConfigurationError for whitespace-only client_id."""
+    config_env({
+        "SERVICENOW_INSTANCE": "https://test.service-now.com",
+        "SERVICENOW_CLIENT_ID": "   ",
+        "SERVICENOW_CLIENT_SECRET": "valid-secret"
+    })
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_CLIENT_ID"):
+        get_config()
+
+
+def test_get_config_whitespace_client_secret_raises_error(config_env):
+    """get_config should raise ConfigurationError for whitespace-only client_secret."""
+    config_env({
+        "SERVICENOW_INSTANCE": "https://test.service-now.com",
+        "SERVICENOW_CLIENT_ID": "valid-client-id",
+        "SERVICENOW_CLIENT_SECRET": "   "
+    })
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_CLIENT_SECRET"):
+        get_config()
+
+
+def test_get_config_whitespace_instance_raises_error(config_env):
+    """get_config should raise ConfigurationError for whitespace-only instance."""
+    config_env({
+        "SERVICENOW_INSTANCE": "   ",
+        "SERVICENOW_API_KEY": "valid-key"
+    })
+    with pytest.raises(ConfigurationError, match=r"SERVICENOW_INSTANCE"):
+        get_config()
 
 
 # =============================================================================
@@ -795,10 +791,7 @@ class TestUnicodeAuthorizationHeaders:
     @patch('servicenow_api.urlopen')
     def test_unicode_api_key_in_actual_request(self, mock_urlopen):
         """Unicode API key should be correctly sent in actual HTTP request headers."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": []}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(EMPTY_RESULT_BODY)
         mock_urlopen.return_value = mock_response
 
         config = {
@@ -820,10 +813,7 @@ class TestUnicodeAuthorizationHeaders:
     @patch('servicenow_api.urlopen')
     def test_unicode_basic_auth_in_actual_request(self, mock_urlopen):
         """Unicode basic auth credentials should be correctly encoded in HTTP request."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": []}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(EMPTY_RESULT_BODY)
         mock_urlopen.return_value = mock_response
 
         config = {
@@ -857,17 +847,16 @@ class TestUnicodeAuthorizationHeaders:
 class TestServiceNowClient(unittest.TestCase):
     """Test ServiceNowClient class."""
 
-    def setUp(self):
-        """Create client with mock config."""
-        self.config = {
-            "instance": "https://test.service-now.com",
-            "username": "admin",
-            "password": "secret",
-            "client_id": None,
-            "client_secret": None,
-            "api_key": None,
-        }
-        self.client = ServiceNowClient(self.config)
+    @classmethod
+    def setUpClass(cls):
+        """Create one client for the class; tests needing other config build their own."""
+        # Frozen, so tests derive variants with replace() instead of copying
+        cls.config = ClientConfig(
+            instance="https://test.service-now.com",
+            username="admin",
+            password="secret",
+        )
+        cls.client = ServiceNowClient(cls.config)
 
     def test_client_initialization(self):
         """Client should initialize with provided config."""
@@ -889,18 +878,40 @@ class TestServiceNowClient(unittest.TestCase):
         url = self.client._build_url("cmdb_ci_server", api_path="/api/now/cmdb/instance")
         self.assertEqual(url, "https://test.service-now.com/api/now/cmdb/instance/cmdb_ci_server")
 
+    def test_client_build_url_strips_trailing_slash_from_instance(self):
+        """_build_url should not produce a double slash for a trailing-slash instance."""
+        config = replace(self.config, instance="https://test.service-now.com/")
+        client = ServiceNowClient(config)
+        self.assertEqual(client._build_url("incident"),
+                         "https://test.service-now.com/api/now/table/incident")
+
+    def test_query_params_drops_unset_values(self):
+        """_query_params should skip None and empty values but keep zero."""
+        self.assertEqual(
+            _query_params(sysparm_limit=0, sysparm_fields=None, sysparm_query=""),
+            {"sysparm_limit": 0},
+        )
+        self.assertIsNone(_query_params(sysparm_display_value=None))
+
     def test_client_basic_auth_header(self):
         """_get_auth_header should return Basic auth header."""
         header = self.client._get_auth_header()
         self.assertIn("Authorization", header)
         self.assertTrue(header["Authorization"].startswith("Basic "))
 
+    def test_client_basic_auth_header_computed_once(self):
+        """Basic auth header should be encoded once, not on every request."""
+        with patch('servicenow_api.base64.b64encode', wraps=base64.b64encode) as mock_encode:
+            client = ServiceNowClient(self.config)
+            first = client._get_auth_header()
+            second = client._get_auth_header()
+
+        self.assertEqual(mock_encode.call_count, 1)
+        self.assertEqual(first, second)
+
     def test_client_api_key_auth_header(self):
         """_get_auth_header should return Bearer token for API key."""
-        config = self.config.copy()
-        config["api_key"] = "test-api-key"
-        config["username"] = None
-        config["password"] = None
+        config = replace(self.config, api_key="test-api-key", username=None, password=None)
         client = ServiceNowClient(config)
 
         header = client._get_auth_header()
@@ -923,22 +934,19 @@ class TestServiceNowClient(unittest.TestCase):
     # SNOW-38: Timeout from config tests
     def test_client_timeout_from_config(self):
         """Client should use timeout from config when not explicitly provided."""
-        config = self.config.copy()
-        config["timeout"] = 90
+        config = replace(self.config, timeout=90)
         client = ServiceNowClient(config)
         self.assertEqual(client.timeout, 90)
 
     def test_client_explicit_timeout_overrides_config(self):
         """Explicit timeout parameter should override config timeout."""
-        config = self.config.copy()
-        config["timeout"] = 90
+        config = replace(self.config, timeout=90)
         client = ServiceNowClient(config, timeout=45)
         self.assertEqual(client.timeout, 45)
 
     def test_client_timeout_none_in_config_uses_default(self):
         """Client should use default timeout when config timeout is None."""
-        config = self.config.copy()
-        config["timeout"] = None
+        config = replace(self.config, timeout=None)
         client = ServiceNowClient(config)
         self.assertEqual(client.timeout, 30)
 
@@ -946,25 +954,21 @@ class TestServiceNowClient(unittest.TestCase):
 class TestServiceNowClientRequests(unittest.TestCase):
     """Test ServiceNowClient HTTP request methods."""
 
-    def setUp(self):
-        """Create client with mock config."""
-        self.config = {
-            "instance": "https://test.service-now.com",
-            "username": "admin",
-            "password": "secret",
-            "client_id": None,
-            "client_secret": None,
-            "api_key": None,
-        }
-        self.client = ServiceNowClient(self.config)
+    @classmethod
+    def setUpClass(cls):
+        """Create one client for the class; tests needing other config build their own."""
+        # Frozen, so tests derive variants with replace() instead of copying
+        cls.config = ClientConfig(
+            instance="https://test.service-now.com",
+            username="admin",
+            password="secret",
+        )
+        cls.client = ServiceNowClient(cls.config)
 
     @patch('servicenow_api.urlopen')
     def test_get_request_success(self, mock_urlopen):
         """GET request should return parsed JSON."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": [{"number": "INC0001"}]}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(b'{"result": [{"number": "INC0001"}]}')
         mock_urlopen.return_value = mock_response
 
         result = self.client.get("incident")
@@ -974,10 +978,7 @@ class TestServiceNowClientRequests(unittest.TestCase):
     @patch('servicenow_api.urlopen')
     def test_get_request_with_query_params(self, mock_urlopen):
         """GET request should include query parameters in URL."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": []}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(EMPTY_RESULT_BODY)
         mock_urlopen.return_value = mock_response
 
         self.client.get("incident", query="state=1", limit=10)
@@ -985,128 +986,153 @@ class TestServiceNowClientRequests(unittest.TestCase):
         # Verify URL contains query parameters
         call_args = mock_urlopen.call_args
         request = call_args[0][0]
-        self.assertIn("sysparm_query=state%3D1", request.full_url)
-        self.assertIn("sysparm_limit=10", request.full_url)
+        self.assertEqual(request.full_url, INCIDENT_QUERY_URL)
 
     @patch('servicenow_api.urlopen')
-    def test_get_request_404_raises_not_found(self, mock_urlopen):
-        """GET request returning 404 should raise NotFoundError."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident/invalid",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Record not found"}}')
-        )
-        mock_urlopen.side_effect = mock_error
-
-        with self.assertRaises(NotFoundError) as context:
-            self.client.get("incident", sys_id="invalid")
-
-        self.assertEqual(context.exception.status_code, 404)
-
+    def test_get_request_client_errors_raise_mapped_errors(self, mock_urlopen):
+        """4xx responses should raise the error class mapped to their status."""
+        cases = [
+            (400, "Bad Request", ValidationError),
+            (401, "Unauthorized", AuthenticationError),
+            (403, "Forbidden", AuthenticationError),
+            (404, "Not Found", NotFoundError),
+        ]
+        for code, reason, error_class in cases:
+            with self.subTest(code=code):
+                mock_urlopen.side_effect = HTTPError(
+                    url=f"https://test.service-now.com{INCIDENT_PATH}", code=code, msg=reason, hdrs={},
+                    fp=BytesIO(b'{"error": {"message": "Request failed"}}')
+                )
+
+                with self.assertRaises(error_class) as context:
+                    self.client.get("incident")
+
+                self.assertEqual(context.exception.status_code, code)
+
+    @patch('servicenow_api.time.sleep')
     @patch('servicenow_api.urlopen')
-    def test_get_request_401_raises_auth_error(self, mock_urlopen):
-        """GET request returning 401 should raise AuthenticationError."""
+    def test_get_request_429_raises_rate_limit_error(self, mock_urlopen, mock_sleep):
+        """GET request returning 429 on every retry should raise RateLimitError."""
         mock_error = HTTPError(
             url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
+            code=429,
+            msg="Too Many Requests",
             hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Invalid credentials"}}')
+            fp=BytesIO(b'{"error": {"message": "Rate limit exceeded"}}')
         )
         mock_urlopen.side_effect = mock_error
 
-        with self.assertRaises(AuthenticationError) as context:
+        with self.assertRaises(RateLimitError) as context:
             self.client.get("incident")
 
-        self.assertEqual(context.exception.status_code, 401)
+        self.assertEqual(context.exception.status_code, 429)
+        # Initial attempt plus DEFAULT_MAX_RETRIES retries
+        self.assertEqual(mock_urlopen.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 3)
 
+    @patch('servicenow_api.time.sleep')
     @patch('servicenow_api.urlopen')
-    def test_get_request_403_raises_auth_error(self, mock_urlopen):
-        """GET request returning 403 should raise AuthenticationError."""
+    def test_get_request_500_raises_servicenow_error(self, mock_urlopen, mock_sleep):
+        """GET request returning 500 on every retry should raise ServiceNowError."""
         mock_error = HTTPError(
             url="https://test.service-now.com/api/now/table/incident",
-            code=403,
-            msg="Forbidden",
+            code=500,
+            msg="Internal Server Error",
             hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Access denied"}}')
+            fp=BytesIO(b'{"error": {"message": "Server error"}}')
         )
         mock_urlopen.side_effect = mock_error
 
-        with self.assertRaises(AuthenticationError) as context:
+        with self.assertRaises(ServiceNowError) as context:
             self.client.get("incident")
 
-        self.assertEqual(context.exception.status_code, 403)
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(mock_urlopen.call_count, 4)
 
+    @patch('servicenow_api.time.sleep')
     @patch('servicenow_api.urlopen')
-    def test_get_request_429_raises_rate_limit_error(self, mock_urlopen):
-        """GET request returning 429 should raise RateLimitError."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=429,
-            msg="Too Many Requests",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Rate limit exceeded"}}')
-        )
-        mock_urlopen.side_effect = mock_error
+    def test_get_request_connection_error(self, mock_urlopen, mock_sleep):
+        """GET request with connection error should raise NetworkError after retrying."""
+        mock_urlopen.side_effect = URLError("Connection refused")
 
-        with self.assertRaises(RateLimitError) as context:
+        with self.assertRaises(NetworkError) as context:
             self.client.get("incident")
 
-        self.assertEqual(context.exception.status_code, 429)
+        self.assertEqual(context.exception.code, "connection_error")
+        self.assertEqual(mock_urlopen.call_count, 4)
 
     @patch('servicenow_api.urlopen')
-    def test_get_request_400_raises_validation_error(self, mock_urlopen):
-        """GET request returning 400 should raise ValidationError."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=400,
-            msg="Bad Request",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Invalid query"}}')
-        )
-        mock_urlopen.side_effect = mock_error
+    def test_get_many_returns_results_in_query_order(self, mock_urlopen):
+        """get_many should issue one GET per query and keep the input order."""
+        def respond(request, **kwargs):
+            query = parse_qs(urlsplit(request.full_url).query)["sysparm_query"][0]
+            return FakeResponse(json.dumps({"result": [{"query": query}]}).encode())
+        mock_urlopen.side_effect = respond
 
-        with self.assertRaises(ValidationError) as context:
-            self.client.get("incident")
+        queries = [f"priority={n}" for n in range(1, 6)]
+        results = self.client.get_many("incident", queries, max_workers=3, fields="number")
 
-        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual([r["result"][0]["query"] for r in results], queries)
+        self.assertEqual(mock_urlopen.call_count, 5)
+        for call in mock_urlopen.call_args_list:
+            self.assertIn("sysparm_fields=number", call[0][0].full_url)
 
     @patch('servicenow_api.urlopen')
-    def test_get_request_500_raises_servicenow_error(self, mock_urlopen):
-        """GET request returning 500 should raise ServiceNowError."""
-        mock_error = HTTPError(
+    def test_get_many_propagates_errors(self, mock_urlopen):
+        """get_many should raise if any of the requests fails."""
+        mock_urlopen.side_effect = HTTPError(
             url="https://test.service-now.com/api/now/table/incident",
-            code=500,
-            msg="Internal Server Error",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Server error"}}')
+            code=404, msg="Not Found", hdrs={}, fp=BytesIO(b'{}')
         )
-        mock_urlopen.side_effect = mock_error
 
-        with self.assertRaises(ServiceNowError) as context:
-            self.client.get("incident")
+        with self.assertRaises(NotFoundError):
+            self.client.get_many("incident", ["priority=1", "priority=2"])
 
-        self.assertEqual(context.exception.status_code, 500)
+    def test_get_many_with_no_queries(self):
+        """get_many should return an empty list without making requests."""
+        self.assertEqual(self.client.get_many("incident", []), [])
 
     @patch('servicenow_api.urlopen')
-    def test_get_request_connection_error(self, mock_urlopen):
-        """GET request with connection error should raise ServiceNowError."""
-        mock_urlopen.side_effect = URLError("Connection refused")
+    def test_get_by_sys_ids_packs_ids_into_sys_id_in_queries(self, mock_urlopen):
+        """get_by_sys_ids should send one sys_idIN query per chunk and keep id order."""
+        def respond(request, **kwargs):
+            query = parse_qs(urlsplit(request.full_url).query)["sysparm_query"][0]
+            ids = query[len("sys_idIN"):].split(",")
+            # Records come back in reverse order, one id has no record
+            rows = [{"sys_id": i, "number": f"INC-{i}"} for i in reversed(ids) if i != "id3"]
+            return FakeResponse(json.dumps({"result": rows}).encode())
+        mock_urlopen.side_effect = respond
+
+        sys_ids = [f"id{n}" for n in range(5)]
+        records = self.client.get_by_sys_ids("incident", sys_ids, fields="number", chunk_size=2)
+
+        self.assertEqual([r["sys_id"] for r in records], ["id0", "id1", "id2", "id4"])
+        self.assertEqual(mock_urlopen.call_count, 3)
+        queries = sorted(
+            parse_qs(urlsplit(call[0][0].full_url).query)["sysparm_query"][0]
+            for call in mock_urlopen.call_args_list
+        )
+        self.assertEqual(queries, ["sys_idINid0,id1", "sys_idINid2,id3", "sys_idINid4"])
+        for call in mock_urlopen.call_args_list:
+            params = parse_qs(urlsplit(call[0][0].full_url).query)
+            self.assertEqual(params["sysparm_fields"], ["number,sys_id"])
+            self.assertEqual(params["sysparm_limit"], ["2"])
 
-        with self.assertRaises(ServiceNowError) as context:
-            self.client.get("incident")
+    @patch('servicenow_api.urlopen')
+    def test_get_by_sys_ids_uses_one_request_per_chunk_size(self, mock_urlopen):
+        """Up to SYS_ID_CHUNK_SIZE ids should be fetched in a single request."""
+        mock_urlopen.return_value = FakeResponse(EMPTY_RESULT_BODY)
+
+        sys_ids = [f"{n:032x}" for n in range(ServiceNowClient.SYS_ID_CHUNK_SIZE)]
+        self.assertEqual(self.client.get_by_sys_ids("incident", sys_ids), [])
 
-        self.assertIn("connect", str(context.exception).lower())
+        self.assertEqual(mock_urlopen.call_count, 1)
+        self.assertIn("sys_idIN", mock_urlopen.call_args[0][0].full_url)
 
     @patch('servicenow_api.urlopen')
     def test_post_request_success(self, mock_urlopen):
         """POST request should send data and return result."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": {"sys_id": "new123", "number": "INC0002"}}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(b'{"result": {"sys_id": "new123", "number": "INC0002"}}')
         mock_urlopen.return_value = mock_response
 
         data = {"short_description": "Test incident", "urgency": "2"}
@@ -1122,10 +1148,7 @@ class TestServiceNowClientRequests(unittest.TestCase):
     @patch('servicenow_api.urlopen')
     def test_put_request_success(self, mock_urlopen):
         """PUT request should send data with sys_id."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": {"sys_id": "abc123"}}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(b'{"result": {"sys_id": "abc123"}}')
         mock_urlopen.return_value = mock_response
 
         data = {"short_description": "Updated description"}
@@ -1134,15 +1157,13 @@ class TestServiceNowClientRequests(unittest.TestCase):
         call_args = mock_urlopen.call_args
         request = call_args[0][0]
         self.assertEqual(request.method, "PUT")
-        self.assertIn("/abc123", request.full_url)
+        self.assertEqual(request.full_url,
+                         "https://test.service-now.com/api/now/table/incident/abc123")
 
     @patch('servicenow_api.urlopen')
     def test_patch_request_success(self, mock_urlopen):
         """PATCH request should partially update record."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"result": {"sys_id": "abc123"}}'
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(b'{"result": {"sys_id": "abc123"}}')
         mock_urlopen.return_value = mock_response
 
         data = {"state": "6"}
@@ -1155,10 +1176,7 @@ class TestServiceNowClientRequests(unittest.TestCase):
     @patch('servicenow_api.urlopen')
     def test_delete_request_success(self, mock_urlopen):
         """DELETE request should delete record."""
-        mock_response = MagicMock()
-        mock_response.read.return_value = b''
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
+        mock_response = FakeResponse(b'')
         mock_urlopen.return_value = mock_response
 
         result = self.client.delete("incident", "abc123")
@@ -1254,48 +1272,40 @@ class TestAPIKeyErrorHandling:
     """
 
     @patch('servicenow_api.urlopen')
-    def test_invalid_api_key_returns_401_authentication_error(self, mock_urlopen, api_key_config):
+    def test_invalid_api_key_returns_401_authentication_error(self, mock_urlopen, api_key_client,
+                                                              make_http_error):
         """Invalid API key should return 401 AuthenticationError."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Invalid API key", "detail": "The provided API key is not valid"}}')
+        mock_error = make_http_error(
+            401,
+            b'{"error": {"message": "Invalid API key", "detail": "The provided API key is not valid"}}'
         )
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get("incident")
+            api_key_client.get("incident")
 
         assert exc_info.value.status_code == 401
         assert "Authentication failed" in exc_info.value.message
 
     @patch('servicenow_api.urlopen')
-    def test_expired_api_key_returns_401_authentication_error(self, mock_urlopen, api_key_config):
+    def test_expired_api_key_returns_401_authentication_error(self, mock_urlopen, api_key_client,
+                                                              make_http_error):
         """Expired API key should return 401 AuthenticationError with clear message."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "API key expired", "detail": "The API key has expired"}}')
+        mock_error = make_http_error(
+            401,
+            b'{"error": {"message": "API key expired", "detail": "The API key has expired"}}'
         )
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get("incident")
+            api_key_client.get("incident")
 
         assert exc_info.value.status_code == 401
         # Verify error details are captured in response_body
         assert exc_info.value.response_body is not None
         assert "expired" in exc_info.value.response_body.lower()
 
-    def test_empty_api_key_not_treated_as_valid_auth(self):
+    def test_empty_api_key_not_treated_as_valid_auth(self, config_env):
         """Empty API key string should not be treated as valid authentication."""
         config = {
             "instance": "https://test.service-now.com",
@@ -1311,28 +1321,24 @@ class TestAPIKeyErrorHandling:
         assert not config["api_key"]  # Empty string is falsy
 
         # With no valid auth, client should raise ConfigurationError when created via get_config
-        with patch.dict(os.environ, {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": ""}, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with pytest.raises(ConfigurationError) as exc_info:
-                    get_config()
-                assert "authentication" in str(exc_info.value).lower()
+        config_env({"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": ""})
+        with pytest.raises(ConfigurationError, match=r"(?i)authentication"):
+            get_config()
 
-    def test_whitespace_only_api_key_not_treated_as_valid_auth(self):
+    def test_whitespace_only_api_key_not_treated_as_valid_auth(self, config_env):
         """API key with only whitespace should raise ConfigurationError.
 
         SNOW-61: Updated behavior - whitespace-only credentials are now rejected
         at configuration time with a clear error message, rather than being passed
         through and failing with a 401 at API call time.
         """
-        with patch.dict(os.environ, {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "   "}, clear=True):
-            with patch('servicenow_api.load_env_file', return_value={}):
-                with pytest.raises(ConfigurationError) as exc_info:
-                    get_config()
-                assert "SERVICENOW_API_KEY" in str(exc_info.value)
-                assert "whitespace" in str(exc_info.value).lower()
+        config_env({"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_API_KEY": "   "})
+        with pytest.raises(ConfigurationError, match=r"SERVICENOW_API_KEY contains only whitespace"):
+            get_config()
 
     @patch('servicenow_api.urlopen')
-    def test_api_key_auth_error_message_is_clear(self, mock_urlopen, api_key_config):
+    def test_api_key_auth_error_message_is_clear(self, mock_urlopen, api_key_client,
+                                                 make_http_error):
         """API key authentication errors should have clear error messages."""
         error_response = {
             "error": {
@@ -1340,19 +1346,11 @@ class TestAPIKeyErrorHandling:
                 "detail": "The API key provided is invalid or has been revoked"
             }
         }
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(json.dumps(error_response).encode())
-        )
+        mock_error = make_http_error(401, json.dumps(error_response).encode())
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get("incident")
+            api_key_client.get("incident")
 
         # Verify the error can be converted to dict with meaningful info
         error_dict = exc_info.value.to_dict()
@@ -1363,57 +1361,45 @@ class TestAPIKeyErrorHandling:
         assert error_dict["details"]["error"]["detail"] == "The API key provided is invalid or has been revoked"
 
     @patch('servicenow_api.urlopen')
-    def test_api_key_403_forbidden_raises_auth_error(self, mock_urlopen, api_key_config):
+    def test_api_key_403_forbidden_raises_auth_error(self, mock_urlopen, api_key_client,
+                                                     make_http_error):
         """API key with insufficient permissions should raise AuthenticationError with 403."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=403,
-            msg="Forbidden",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Insufficient permissions", "detail": "API key does not have access to this resource"}}')
+        mock_error = make_http_error(
+            403,
+            b'{"error": {"message": "Insufficient permissions", "detail": "API key does not have access to this resource"}}'
         )
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get("incident")
+            api_key_client.get("incident")
 
         assert exc_info.value.status_code == 403
         assert "forbidden" in exc_info.value.message.lower() or "permission" in exc_info.value.message.lower()
 
     @patch('servicenow_api.urlopen')
-    def test_api_key_no_retry_on_401(self, mock_urlopen, api_key_config):
+    def test_api_key_no_retry_on_401(self, mock_urlopen, api_key_client, make_http_error):
         """API key auth should not retry on 401 (unlike OAuth which clears token and retries)."""
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": {"message": "Invalid API key"}}')
-        )
+        mock_error = make_http_error(401, b'{"error": {"message": "Invalid API key"}}')
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError):
-            client.get("incident")
+            api_key_client.get("incident")
 
         # API key auth should only make one call (no retry like OAuth)
         # OAuth retries because it can refresh the token, but API keys are static
         assert mock_urlopen.call_count == 1
 
-    def test_api_key_auth_header_format(self, api_key_config):
+    def test_api_key_auth_header_format(self, api_key_client):
         """API key should be sent as Bearer token in Authorization header."""
-        client = ServiceNowClient(api_key_config)
-        header = client._get_auth_header()
+        header = api_key_client._get_auth_header()
 
         assert "Authorization" in header
         assert header["Authorization"] == "Bearer test-api-key-12345"
         assert header["Authorization"].startswith("Bearer ")
 
     @patch('servicenow_api.urlopen')
-    def test_api_key_error_response_body_captured(self, mock_urlopen, api_key_config):
+    def test_api_key_error_response_body_captured(self, mock_urlopen, api_key_client,
+                                                  make_http_error):
         """API key auth errors should capture the full response body for debugging."""
         detailed_error = {
             "error": {
@@ -1422,19 +1408,11 @@ class TestAPIKeyErrorHandling:
                 "reference": "KB0012345"
             }
         }
-        mock_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(json.dumps(detailed_error).encode())
-        )
+        mock_error = make_http_error(401, json.dumps(detailed_error).encode())
         mock_urlopen.side_effect = mock_error
 
-        client = ServiceNowClient(api_key_config)
-
         with pytest.raises(AuthenticationError) as exc_info:
-            client.get("incident")
+            api_key_client.get("incident")
 
         # Response body should be captured for debugging
         assert exc_info.value.response_body is not None
@@ -1447,30 +1425,17 @@ class TestServiceNowClientOAuth(unittest.TestCase):
 
     def setUp(self):
         """Create client with OAuth config."""
-        self.config = {
-            "instance": "https://test.service-now.com",
-            "username": None,
-            "password": None,
-            "client_id": "test-client-id",
-            "client_secret": "test-client-secret",
-            "api_key": None,
-        }
-        self.client = ServiceNowClient(self.config)
+        # The config is immutable; only the client (and its token cache) is per test
+        self.client = ServiceNowClient(OAUTH_CONFIG)
 
     @patch('servicenow_api.urlopen')
     def test_oauth_token_request(self, mock_urlopen):
         """OAuth should request access token."""
         # First call - token request
-        token_response = MagicMock()
-        token_response.read.return_value = b'{"access_token": "test-token-123", "token_type": "Bearer"}'
-        token_response.__enter__ = Mock(return_value=token_response)
-        token_response.__exit__ = Mock(return_value=False)
+        token_response = FakeResponse(TEST_TOKEN_BODY)
 
         # Second call - actual API request
-        api_response = MagicMock()
-        api_response.read.return_value = b'{"result": []}'
-        api_response.__enter__ = Mock(return_value=api_response)
-        api_response.__exit__ = Mock(return_value=False)
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
 
         mock_urlopen.side_effect = [token_response, api_response]
 
@@ -1479,20 +1444,113 @@ class TestServiceNowClientOAuth(unittest.TestCase):
         # Verify token endpoint was called
         first_call = mock_urlopen.call_args_list[0]
         request = first_call[0][0]
-        self.assertIn("oauth_token.do", request.full_url)
+        self.assertEqual(request.full_url, "https://test.service-now.com/oauth_token.do")
+
+    @patch('servicenow_api.urlopen')
+    def test_oauth_token_reused_across_requests(self, mock_urlopen):
+        """OAuth token should be fetched once and reused until it expires."""
+        token_response = FakeResponse(b'{"access_token": "test-token-123", "expires_in": 1800}')
+
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
+
+        mock_urlopen.side_effect = [token_response, api_response, api_response]
+
+        self.client.get("incident")
+        self.client.get("incident")
+
+        token_calls = [c for c in mock_urlopen.call_args_list
+                       if "oauth_token.do" in c[0][0].full_url]
+        self.assertEqual(len(token_calls), 1)
+        self.assertEqual(mock_urlopen.call_count, 3)
+
+    @patch('servicenow_api.urlopen')
+    def test_oauth_token_shared_between_clients(self, mock_urlopen):
+        """A second client with the same instance and credentials reuses the cached token."""
+        token_response = FakeResponse(b'{"access_token": "test-token-123", "expires_in": 1800}')
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
+        mock_urlopen.side_effect = [token_response, api_response, api_response]
+
+        self.client.get("incident")
+        other = ServiceNowClient(OAUTH_CONFIG)
+        other.get("incident")
+
+        token_calls = [c for c in mock_urlopen.call_args_list
+                       if "oauth_token.do" in c[0][0].full_url]
+        self.assertEqual(len(token_calls), 1)
+        self.assertEqual(other._access_token, "test-token-123")
+
+    @patch('servicenow_api.urlopen')
+    def test_oauth_token_not_shared_between_different_secrets(self, mock_urlopen):
+        """A client with another client_secret must fetch its own token."""
+        mock_urlopen.side_effect = [
+            FakeResponse(b'{"access_token": "test-token-123", "expires_in": 1800}'),
+            FakeResponse(EMPTY_RESULT_BODY),
+            FakeResponse(b'{"access_token": "other-token", "expires_in": 1800}'),
+            FakeResponse(EMPTY_RESULT_BODY),
+        ]
+
+        self.client.get("incident")
+        other = ServiceNowClient(replace(OAUTH_CONFIG, client_secret="rotated-secret"))
+        other.get("incident")
+
+        token_calls = [c for c in mock_urlopen.call_args_list
+                       if "oauth_token.do" in c[0][0].full_url]
+        self.assertEqual(len(token_calls), 2)
+        self.assertEqual(other._access_token, "other-token")
+        self.assertNotIn("rotated-secret", repr(other._token_cache_key))
+
+    def test_discard_token_keeps_newer_shared_token(self):
+        """Discarding a stale token must not evict one another client refreshed."""
+        key = self.client._token_cache_key
+        ServiceNowClient._token_cache[key] = ("fresh-token", "Bearer", float("inf"), None)
+        self.client._access_token = "stale-token"
+
+        self.client._discard_token()
+
+        self.assertIsNone(self.client._access_token)
+        self.assertEqual(ServiceNowClient._token_cache[key][0], "fresh-token")
+
+    @patch('servicenow_api.time.monotonic')
+    @patch('servicenow_api.urlopen')
+    def test_oauth_token_refreshed_after_expiry(self, mock_urlopen, mock_monotonic):
+        """An expired OAuth token should be replaced before the next request."""
+        def token(value):
+            return FakeResponse(b'{"access_token": "%s", "expires_in": 60}' % value.encode())
+
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
+
+        mock_urlopen.side_effect = [token("first"), api_response, token("second"), api_response]
+
+        mock_monotonic.return_value = 1000.0
+        self.client.get("incident")
+        # 60s lifetime minus the 30s safety margin has elapsed
+        mock_monotonic.return_value = 1030.0
+        self.client.get("incident")
+
+        last_request = mock_urlopen.call_args_list[3][0][0]
+        self.assertEqual(last_request.headers["Authorization"], "Bearer second")
+
+    @patch('servicenow_api.urlopen')
+    def test_oauth_token_fetched_once_across_threads(self, mock_urlopen):
+        """Concurrent requests should share a single OAuth token fetch."""
+        token_response = FakeResponse(b'{"access_token": "test-token-123"}')
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
+        mock_urlopen.side_effect = lambda request, **kwargs: (
+            token_response if "oauth_token.do" in request.full_url else api_response
+        )
+
+        self.client.get_many("incident", [f"priority={n}" for n in range(8)])
+
+        token_calls = [c for c in mock_urlopen.call_args_list
+                       if "oauth_token.do" in c[0][0].full_url]
+        self.assertEqual(len(token_calls), 1)
 
     @patch('servicenow_api.urlopen')
     def test_oauth_uses_bearer_token(self, mock_urlopen):
         """OAuth should use Bearer token for API requests."""
-        token_response = MagicMock()
-        token_response.read.return_value = b'{"access_token": "test-token-123", "token_type": "Bearer"}'
-        token_response.__enter__ = Mock(return_value=token_response)
-        token_response.__exit__ = Mock(return_value=False)
+        token_response = FakeResponse(TEST_TOKEN_BODY)
 
-        api_response = MagicMock()
-        api_response.read.return_value = b'{"result": []}'
-        api_response.__enter__ = Mock(return_value=api_response)
-        api_response.__exit__ = Mock(return_value=False)
+        api_response = FakeResponse(EMPTY_RESULT_BODY)
 
         mock_urlopen.side_effect = [token_response, api_response]
 
@@ -1522,10 +1580,7 @@ class TestServiceNowClientOAuth(unittest.TestCase):
     def test_oauth_401_retry_preserves_query_params(self, mock_urlopen):
         """OAuth 401 retry should preserve query parameters."""
         # First call - get token
-        token_response = MagicMock()
-        token_response.read.return_value = b'{"access_token": "old-token", "token_type": "Bearer"}'
-        token_response.__enter__ = Mock(return_value=token_response)
-        token_response.__exit__ = Mock(return_value=False)
+        token_response = FakeResponse(OLD_TOKEN_BODY)
 
         # Second call - API request fails with 401
         mock_401_error = HTTPError(
@@ -1537,16 +1592,10 @@ class TestServiceNowClientOAuth(unittest.TestCase):
         )
 
         # Third call - get new token
-        new_token_response = MagicMock()
-        new_token_response.read.return_value = b'{"access_token": "new-token", "token_type": "Bearer"}'
-        new_token_response.__enter__ = Mock(return_value=new_token_response)
-        new_token_response.__exit__ = Mock(return_value=False)
+        new_token_response = FakeResponse(NEW_TOKEN_BODY)
 
         # Fourth call - retry API request succeeds
-        api_response = MagicMock()
-        api_response.read.return_value = b'{"result": [{"number": "INC001"}]}'
-        api_response.__enter__ = Mock(return_value=api_response)
-        api_response.__exit__ = Mock(return_value=False)
+        api_response = FakeResponse(b'{"result": [{"number": "INC001"}]}')
 
         mock_urlopen.side_effect = [token_response, mock_401_error, new_token_response, api_response]
 
@@ -1555,8 +1604,7 @@ class TestServiceNowClientOAuth(unittest.TestCase):
         # Verify the query params are in the final retry request
         final_call = mock_urlopen.call_args_list[-1]
         request = final_call[0][0]
-        self.assertIn("sysparm_query=state%3D1", request.full_url)
-        self.assertIn("sysparm_limit=10", request.full_url)
+        self.assertEqual(request.full_url, INCIDENT_QUERY_URL)
         self.assertEqual(result["result"][0]["number"], "INC001")
 
 
@@ -1564,117 +1612,185 @@ class TestServiceNowClientOAuth(unittest.TestCase):
 # Unit Tests - Utility Functions
 # =============================================================================
 
-class TestUtilityFunctions(unittest.TestCase):
-    """Test utility functions."""
+def test_ssl_context_built_once_and_exposed_as_ssl_context():
+    """The lazily built SSL context should be created once and shared."""
+    import servicenow_api
 
-    def test_create_client_with_config(self):
-        """create_client should create client with provided config."""
-        config = {
-            "instance": "https://test.service-now.com",
-            "username": "admin",
-            "password": "secret",
-            "client_id": None,
-            "client_secret": None,
-            "api_key": None,
-        }
-        client = create_client(config)
-        self.assertIsInstance(client, ServiceNowClient)
-        self.assertEqual(client.instance, "https://test.service-now.com")
+    context = servicenow_api._ssl_context()
+    assert isinstance(context, ssl.SSLContext)
+    assert servicenow_api._ssl_context() is context
+    assert servicenow_api.SSL_CONTEXT is context
 
-    def test_create_client_with_timeout(self):
-        """create_client should pass timeout to client."""
-        config = {
-            "instance": "https://test.service-now.com",
-            "username": "admin",
-            "password": "secret",
-            "client_id": None,
-            "client_secret": None,
-            "api_key": None,
-        }
-        client = create_client(config, timeout=120)
-        self.assertEqual(client.timeout, 120)
-
-    def test_read_json_input_empty(self):
-        """read_json_input should return empty dict for empty input."""
-        with patch('sys.stdin', StringIO('')):
-            result = read_json_input()
-            self.assertEqual(result, {})
-
-    def test_read_json_input_whitespace(self):
-        """read_json_input should return empty dict for whitespace input."""
-        with patch('sys.stdin', StringIO('   \n\t  ')):
-            result = read_json_input()
-            self.assertEqual(result, {})
-
-    def test_read_json_input_valid(self):
-        """read_json_input should parse valid JSON."""
-        with patch('sys.stdin', StringIO('{"key": "value", "number": 42}')):
-            result = read_json_input()
-            self.assertEqual(result["key"], "value")
-            self.assertEqual(result["number"], 42)
-
-    def test_read_json_input_invalid(self):
-        """read_json_input should raise ValidationError for invalid JSON."""
-        with patch('sys.stdin', StringIO('not valid json')):
-            with self.assertRaises(ValidationError) as context:
-                read_json_input()
-            self.assertIn("Invalid JSON", str(context.exception))
-
-    def test_output_json(self):
-        """output_json should print formatted JSON to stdout."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            output_json({"key": "value"})
-            output = mock_stdout.getvalue()
-            self.assertIn('"key"', output)
-            self.assertIn('"value"', output)
-
-    def test_output_error_servicenow_error(self):
-        """output_error should output ServiceNowError as JSON."""
-        error = ServiceNowError("Test error", status_code=500)
-        with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-            with self.assertRaises(SystemExit):
-                output_error(error)
-            output = mock_stderr.getvalue()
-            self.assertIn("Test error", output)
-            self.assertIn("500", output)
-
-    def test_output_error_generic_exception(self):
-        """output_error should handle generic exceptions."""
-        error = Exception("Generic error")
-        with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-            with self.assertRaises(SystemExit):
-                output_error(error)
-            output = mock_stderr.getvalue()
-            self.assertIn("Generic error", output)
 
+def test_create_client_with_config(basic_auth_config):
+    """create_client should create client with provided config."""
+    client = create_client(basic_auth_config)
+    assert isinstance(client, ServiceNowClient)
+    assert client.instance == "https://test.service-now.com"
 
-# =============================================================================
-# Unit Tests - Timeout Scenarios (SNOW-36)
-# SNOW-47: Migrated to pytest fixtures
-# =============================================================================
 
-class TestTimeoutScenarios:
+def test_client_config_is_frozen_and_accepted_like_a_dict(basic_auth_config):
+    """ClientConfig should be immutable and give the same client as a dict."""
+    with pytest.raises(FrozenInstanceError):
+        basic_auth_config.password = "other"
+    client = ServiceNowClient(replace(basic_auth_config, timeout=45))
+    assert client.config["username"] == "admin"
+    assert client.timeout == 45
+
+
+def test_create_client_with_timeout(basic_auth_config):
+    """create_client should pass timeout to client."""
+    client = create_client(basic_auth_config, timeout=120)
+    assert client.timeout == 120
+
+
+def test_output_json(capsys):
+    """output_json should print formatted JSON to stdout."""
+    output_json({"key": "value"})
+    output = capsys.readouterr().out
+    assert '"key"' in output
+    assert '"value"' in output
+
+
+def test_output_json_round_trips_with_two_space_indent(capsys):
+    """output_json should emit indented JSON that parses back to the input."""
+    data = {"result": [{"short_description": "caf\u00e9", "priority": 1}]}
+    output_json(data)
+    output = capsys.readouterr().out
+    assert json.loads(output) == data
+    assert '\n  "result": [' in output
+
+
+def test_output_json_to_stream_without_buffer(monkeypatch):
+    """output_json should write text to a stdout that has no binary buffer, like StringIO."""
+    stdout = StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+    output_json({"key": "value"})
+    assert stdout.getvalue() == '{\n  "key": "value"\n}\n'
+
+
+def test_output_json_writes_stream_encoding_to_buffer(monkeypatch):
+    """output_json should write one encoded payload to stdout's binary buffer."""
+    raw = BytesIO()
+    stdout = TextIOWrapper(raw, encoding='utf-16-le')
+    stdout.write('before\n')
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    output_json({"key": "caf\u00e9"})
+
+    assert raw.getvalue().decode('utf-16-le') == 'before\n{\n  "key": "caf\\u00e9"\n}\n'
+
+
+# Run in a subprocess so servicenow_api is imported with orjson hidden
+_JSON_OUTPUT_SCRIPT = """
+import sys
+if sys.argv[1] == "without":
+    sys.modules["orjson"] = None
+sys.path.insert(0, sys.argv[2])
+import json, servicenow_api
+data = {"description": "caf\\u00e9", "size": 1e16, "big": 2 ** 70}
+servicenow_api.output_json(data)
+assert json.loads(servicenow_api._json_encode(data)) == data
+"""
+
+
+@pytest.mark.parametrize('orjson', ['with', 'without'])
+def test_output_json_is_identical_with_and_without_orjson(orjson):
+    """CLI output should match json.dumps byte for byte whichever JSON library is loaded."""
+    data = {"description": "caf\u00e9", "size": 1e16, "big": 2 ** 70}
+    scripts_dir = Path(__file__).parent.parent / 'scripts'
+
+    result = subprocess.run(
+        [sys.executable, '-c', _JSON_OUTPUT_SCRIPT, orjson, str(scripts_dir)],
+        capture_output=True, check=True,
+    )
+
+    assert result.stdout == (json.dumps(data, indent=2) + '\n').encode()
+
+
+def test_output_error_servicenow_error(capsys):
+    """output_error should output ServiceNowError as JSON."""
+    error = ServiceNowError("Test error", status_code=500)
+    with pytest.raises(SystemExit):
+        output_error(error)
+    output = capsys.readouterr().err
+    assert "Test error" in output
+    assert "500" in output
+
+
+def test_output_error_generic_exception(capsys):
+    """output_error should handle generic exceptions."""
+    error = Exception("Generic error")
+    with pytest.raises(SystemExit):
+        output_error(error)
+    output = capsys.readouterr().err
+    assert "Generic error" in output
+
+
+def test_read_json_input_empty(stdin):
+    """read_json_input should return empty dict for empty input."""
+    stdin('')
+    assert read_json_input() == {}
+
+
+def test_read_json_input_whitespace(stdin):
+    """read_json_input should return empty dict for whitespace input."""
+    stdin('   \n\t  ')
+    assert read_json_input() == {}
+
+
+def test_read_json_input_valid(stdin):
+    """read_json_input should parse valid JSON."""
+    stdin('{"key": "value", "number": 42}')
+    assert read_json_input() == {"key": "value", "number": 42}
+
+
+def test_read_json_input_invalid(stdin):
+    """read_json_input should raise ValidationError for invalid JSON."""
+    stdin('not valid json')
+    with pytest.raises(ValidationError, match="Invalid JSON"):
+        read_json_input()
+
+
+def test_read_json_input_bypasses_stdin_text_decoder(monkeypatch):
+    """read_json_input should parse the raw bytes, not stdin's decoded text."""
+    raw = '{"short_description": "caf\u00e9"}'.encode()
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(raw), encoding="ascii"))
+    assert read_json_input() == {"short_description": "caf\u00e9"}
+
+
+def test_read_json_input_from_text_only_stream(monkeypatch):
+    """read_json_input should fall back to text reads when stdin has no buffer."""
+    monkeypatch.setattr("sys.stdin", StringIO('{"key": "value"}'))
+    assert read_json_input() == {"key": "value"}
+
+
+# =============================================================================
+# Unit Tests - Timeout Scenarios (SNOW-36)
+# SNOW-47: Migrated to pytest fixtures
+# =============================================================================
+
+class TestTimeoutScenarios:
     """Test timeout handling scenarios.
 
     SNOW-47: Migrated from unittest.TestCase to use pytest fixtures.
     """
 
-    @patch('servicenow_api.urlopen')
-    def test_request_timeout_raises_servicenow_error(self, mock_urlopen, basic_auth_config):
+    def test_request_timeout_raises_servicenow_error(self, urlopen_mock, sleep_mock,
+                                                     basic_auth_config):
         """Request timeout should raise ServiceNowError."""
-        mock_urlopen.side_effect = URLError(socket.timeout("timed out"))
+        urlopen_mock.add(INCIDENT_PATH, URLError(socket.timeout("timed out")))
 
-        client = ServiceNowClient(basic_auth_config, timeout=5)
+        client = ServiceNowClient(basic_auth_config, timeout=5, max_retries=0)
 
         with pytest.raises(ServiceNowError) as exc_info:
             client.get("incident")
 
         assert "connect" in str(exc_info.value).lower()
 
-    @patch('servicenow_api.urlopen')
-    def test_oauth_timeout_raises_auth_error(self, mock_urlopen, oauth_config):
+    def test_oauth_timeout_raises_auth_error(self, urlopen_mock, oauth_config):
         """OAuth token request timeout should raise AuthenticationError."""
-        mock_urlopen.side_effect = URLError(socket.timeout("timed out"))
+        urlopen_mock.add(OAUTH_TOKEN_PATH, URLError(socket.timeout("timed out")))
 
         client = ServiceNowClient(oauth_config, timeout=5)
 
@@ -1683,29 +1799,25 @@ class TestTimeoutScenarios:
 
         assert "connect" in str(exc_info.value).lower()
 
-    @patch('servicenow_api.urlopen')
-    def test_custom_timeout_used_in_request(self, mock_urlopen, basic_auth_config, mock_empty_response):
+    def test_custom_timeout_used_in_request(self, urlopen_mock, client_with_custom_timeout,
+                                            mock_empty_response):
         """Custom timeout should be passed to urlopen."""
-        mock_urlopen.return_value = mock_empty_response
+        urlopen_mock.add(INCIDENT_PATH, mock_empty_response)
 
-        client = ServiceNowClient(basic_auth_config, timeout=120)
-        client.get("incident")
+        client_with_custom_timeout.get("incident")
 
         # Verify timeout was passed to urlopen
-        call_args = mock_urlopen.call_args
-        assert call_args[1]["timeout"] == 120
+        assert urlopen_mock.calls[-1][1] == 120
 
-    @patch('servicenow_api.urlopen')
-    def test_default_timeout_used_when_not_specified(self, mock_urlopen, basic_auth_config, mock_empty_response):
+    def test_default_timeout_used_when_not_specified(self, urlopen_mock, basic_auth_client,
+                                                     mock_empty_response):
         """Default timeout should be used when not specified."""
-        mock_urlopen.return_value = mock_empty_response
+        urlopen_mock.add(INCIDENT_PATH, mock_empty_response)
 
-        client = ServiceNowClient(basic_auth_config)  # No timeout specified
-        client.get("incident")
+        basic_auth_client.get("incident")  # No timeout specified
 
         # Verify default timeout (30) was passed to urlopen
-        call_args = mock_urlopen.call_args
-        assert call_args[1]["timeout"] == 30
+        assert urlopen_mock.calls[-1][1] == 30
 
 
 # =============================================================================
@@ -1714,108 +1826,119 @@ class TestTimeoutScenarios:
 # =============================================================================
 
 class TestRetryLogic:
-    """Test retry logic for OAuth 401 scenarios.
+    """Test retry logic for OAuth 401 and rate limit (429) scenarios.
 
     SNOW-47: Migrated from unittest.TestCase to use pytest fixtures.
     """
 
-    @patch('servicenow_api.urlopen')
-    def test_oauth_401_retry_clears_token(self, mock_urlopen, oauth_config):
+    def test_oauth_401_retry_clears_token(self, urlopen_mock, oauth_config, make_http_error):
         """OAuth 401 should clear cached token and retry."""
-        # First call - get initial token
-        token_response = MagicMock()
-        token_response.read.return_value = b'{"access_token": "old-token", "token_type": "Bearer"}'
-        token_response.__enter__ = Mock(return_value=token_response)
-        token_response.__exit__ = Mock(return_value=False)
+        # Initial token, then a new one after the 401
+        urlopen_mock.add(OAUTH_TOKEN_PATH, FakeResponse(OLD_TOKEN_BODY), FakeResponse(NEW_TOKEN_BODY))
+        # API request fails with 401, the retry succeeds
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(401, b'{"error": "Token expired"}'),
+                         FakeResponse(EMPTY_RESULT_BODY))
 
-        # Second call - API request fails with 401
-        mock_401_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": "Token expired"}')
-        )
+        client = ServiceNowClient(oauth_config)
+        client.get("incident")
 
-        # Third call - get new token
-        new_token_response = MagicMock()
-        new_token_response.read.return_value = b'{"access_token": "new-token", "token_type": "Bearer"}'
-        new_token_response.__enter__ = Mock(return_value=new_token_response)
-        new_token_response.__exit__ = Mock(return_value=False)
+        # Verify new token is used after retry
+        assert client._access_token == "new-token"
 
-        # Fourth call - retry succeeds
-        api_response = MagicMock()
-        api_response.read.return_value = b'{"result": []}'
-        api_response.__enter__ = Mock(return_value=api_response)
-        api_response.__exit__ = Mock(return_value=False)
+    def test_oauth_401_prefers_refresh_token_grant(self, urlopen_mock, oauth_config,
+                                                   make_http_error):
+        """A 401 should exchange the refresh token instead of re-authenticating."""
+        urlopen_mock.add(OAUTH_TOKEN_PATH,
+                         FakeResponse(b'{"access_token": "old-token", "refresh_token": "refresh-1"}'),
+                         FakeResponse(NEW_TOKEN_BODY))
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(401, b'{"error": "Token expired"}'),
+                         FakeResponse(EMPTY_RESULT_BODY))
 
-        mock_urlopen.side_effect = [token_response, mock_401_error, new_token_response, api_response]
+        client = ServiceNowClient(oauth_config)
+        client.get("incident")
+
+        grants = [parse_qs(request.data.decode())["grant_type"][0]
+                  for request, _ in urlopen_mock.calls if OAUTH_TOKEN_PATH in request.full_url]
+        assert grants == ["client_credentials", "refresh_token"]
+        assert client._access_token == "new-token"
+        # The refresh token is kept when the refresh response omits a new one
+        assert client._refresh_token == "refresh-1"
+
+    def test_oauth_rejected_refresh_falls_back_to_client_credentials(
+            self, urlopen_mock, oauth_config, make_http_error):
+        """A rejected refresh token should fall back to the client credentials grant."""
+        urlopen_mock.add(OAUTH_TOKEN_PATH,
+                         FakeResponse(b'{"access_token": "old-token", "refresh_token": "refresh-1"}'),
+                         make_http_error(401, b'{"error": "invalid_grant"}'),
+                         FakeResponse(NEW_TOKEN_BODY))
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(401, b'{"error": "Token expired"}'),
+                         FakeResponse(EMPTY_RESULT_BODY))
 
         client = ServiceNowClient(oauth_config)
         client.get("incident")
 
-        # Verify new token is used after retry
+        grants = [parse_qs(request.data.decode())["grant_type"][0]
+                  for request, _ in urlopen_mock.calls if OAUTH_TOKEN_PATH in request.full_url]
+        assert grants == ["client_credentials", "refresh_token", "client_credentials"]
         assert client._access_token == "new-token"
+        assert client._refresh_token is None
 
-    @patch('servicenow_api.urlopen')
-    def test_oauth_401_no_infinite_retry(self, mock_urlopen, oauth_config):
+    def test_oauth_401_no_infinite_retry(self, urlopen_mock, oauth_config, make_http_error):
         """OAuth should not retry infinitely on persistent 401."""
-        # First call - get initial token
-        token_response = MagicMock()
-        token_response.read.return_value = b'{"access_token": "bad-token", "token_type": "Bearer"}'
-        token_response.__enter__ = Mock(return_value=token_response)
-        token_response.__exit__ = Mock(return_value=False)
+        urlopen_mock.add(OAUTH_TOKEN_PATH,
+                         FakeResponse(b'{"access_token": "bad-token", "token_type": "Bearer"}'),
+                         FakeResponse(b'{"access_token": "still-bad-token", "token_type": "Bearer"}'))
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(401, b'{"error": "Invalid credentials"}'),
+                         make_http_error(401, b'{"error": "Still invalid"}'))
 
-        # Second call - API request fails with 401
-        mock_401_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": "Invalid credentials"}')
-        )
+        client = ServiceNowClient(oauth_config)
 
-        # Third call - get new token
-        new_token_response = MagicMock()
-        new_token_response.read.return_value = b'{"access_token": "still-bad-token", "token_type": "Bearer"}'
-        new_token_response.__enter__ = Mock(return_value=new_token_response)
-        new_token_response.__exit__ = Mock(return_value=False)
+        # Should raise AuthenticationError after retry fails
+        with pytest.raises(AuthenticationError):
+            client.get("incident")
 
-        # Fourth call - retry also fails with 401
-        mock_401_error_2 = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": "Still invalid"}')
-        )
+        # Should have made exactly 4 calls (no infinite loop)
+        assert len(urlopen_mock.calls) == 4
 
-        mock_urlopen.side_effect = [token_response, mock_401_error, new_token_response, mock_401_error_2]
+    def test_oauth_token_rate_limit_backs_off(self, urlopen_mock, sleep_mock, oauth_config,
+                                              make_http_error):
+        """A throttled token endpoint should be retried after the Retry-After delay."""
+        urlopen_mock.add(OAUTH_TOKEN_PATH,
+                         make_http_error(429, RATE_LIMIT_BODY, headers={"Retry-After": "2"}),
+                         FakeResponse(NEW_TOKEN_BODY))
+        urlopen_mock.add(INCIDENT_PATH, FakeResponse(EMPTY_RESULT_BODY))
 
         client = ServiceNowClient(oauth_config)
+        client.get("incident")
 
-        # Should raise AuthenticationError after retry fails
-        with pytest.raises(AuthenticationError):
+        assert client._access_token == "new-token"
+        sleep_mock.assert_called_once_with(2.0)
+
+    def test_oauth_token_server_error_retries_with_backoff(self, urlopen_mock, sleep_mock,
+                                                           oauth_config, make_http_error):
+        """5xx from the token endpoint should back off instead of failing as an auth error."""
+        urlopen_mock.add(OAUTH_TOKEN_PATH, make_http_error(503, b'{"error": "unavailable"}'))
+
+        client = ServiceNowClient(oauth_config, max_retries=2)
+
+        with pytest.raises(ServiceNowError) as exc_info:
             client.get("incident")
 
-        # Should have made exactly 4 calls (no infinite loop)
-        assert mock_urlopen.call_count == 4
+        assert not isinstance(exc_info.value, AuthenticationError)
+        assert exc_info.value.status_code == 503
+        assert sleep_mock.call_count == 2
+        assert len(urlopen_mock.calls) == 3
 
-    @patch('servicenow_api.urlopen')
-    def test_basic_auth_401_no_retry(self, mock_urlopen, basic_auth_config):
+    def test_basic_auth_401_no_retry(self, urlopen_mock, basic_auth_config, make_http_error):
         """Basic auth 401 should not trigger retry logic."""
         # Modify basic_auth_config to simulate wrong password
-        config = basic_auth_config.copy()
-        config["password"] = "wrong-password"
+        config = replace(basic_auth_config, password="wrong-password")
 
-        mock_401_error = HTTPError(
-            url="https://test.service-now.com/api/now/table/incident",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=BytesIO(b'{"error": "Invalid credentials"}')
-        )
-        mock_urlopen.side_effect = mock_401_error
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(401, b'{"error": "Invalid credentials"}'))
 
         client = ServiceNowClient(config)
 
@@ -1823,186 +1946,878 @@ class TestRetryLogic:
             client.get("incident")
 
         # Basic auth should only make one call (no retry)
-        assert mock_urlopen.call_count == 1
+        assert len(urlopen_mock.calls) == 1
+
+    def test_429_retries_until_success(self, urlopen_mock, sleep_mock,
+                                       basic_auth_client, mock_success_response, make_http_error):
+        """Rate-limited requests should back off exponentially and then succeed."""
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(429, RATE_LIMIT_BODY),
+                         make_http_error(429, RATE_LIMIT_BODY),
+                         mock_success_response)
+
+        with patch('servicenow_api.random.uniform', return_value=0.0):
+            result = basic_auth_client.get("incident")
+
+        assert "result" in result
+        assert len(urlopen_mock.calls) == 3
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [1.0, 2.0]
+
+    def test_429_backoff_applies_jitter_and_cap(self, urlopen_mock, sleep_mock, basic_auth_config,
+                                                make_http_error):
+        """Backoff delays should be capped and jittered by up to +/-50%."""
+        client = ServiceNowClient(basic_auth_config, max_retries=7)
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(429, RATE_LIMIT_BODY))
+
+        with pytest.raises(RateLimitError):
+            client.get("incident")
+
+        delays = [c.args[0] for c in sleep_mock.call_args_list]
+        assert len(delays) == 7
+        for attempt, delay in enumerate(delays):
+            nominal = min(30.0, 2 ** attempt)
+            assert nominal * 0.5 <= delay <= nominal * 1.5
+
+    def test_429_honors_retry_after_header(self, urlopen_mock, sleep_mock,
+                                           basic_auth_client, mock_success_response, make_http_error):
+        """A Retry-After header should be used as the delay instead of backoff."""
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(429, RATE_LIMIT_BODY, headers={"Retry-After": "5"}),
+                         mock_success_response)
+
+        basic_auth_client.get("incident")
+
+        sleep_mock.assert_called_once_with(5.0)
+
+    def test_429_with_zero_retry_after_retries_immediately(self, urlopen_mock, sleep_mock,
+                                                           basic_auth_client, mock_success_response,
+                                                           make_http_error):
+        """Retry-After: 0 should retry without falling back to exponential backoff."""
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(429, RATE_LIMIT_BODY, headers={"Retry-After": "0"}),
+                         mock_success_response)
+
+        result = basic_auth_client.get("incident")
+
+        assert result["result"][0]["number"] == "INC0001"
+        sleep_mock.assert_called_once_with(0.0)
+
+    def test_429_retry_after_beyond_cap_raises(self, urlopen_mock, sleep_mock, basic_auth_client,
+                                               make_http_error):
+        """A Retry-After longer than the backoff cap should not be waited out."""
+        urlopen_mock.add(INCIDENT_PATH,
+                         make_http_error(429, RATE_LIMIT_BODY, headers={"Retry-After": "3600"}))
+
+        with pytest.raises(RateLimitError) as exc_info:
+            basic_auth_client.get("incident")
+
+        assert exc_info.value.retry_after == 3600.0
+        assert len(urlopen_mock.calls) == 1
+        sleep_mock.assert_not_called()
+
+    def test_429_not_retried_when_max_retries_is_zero(self, urlopen_mock, sleep_mock,
+                                                      basic_auth_config, make_http_error):
+        """max_retries=0 should surface the first RateLimitError."""
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(429, RATE_LIMIT_BODY))
+        client = ServiceNowClient(basic_auth_config, max_retries=0)
+
+        with pytest.raises(RateLimitError):
+            client.get("incident")
+
+        assert len(urlopen_mock.calls) == 1
+        sleep_mock.assert_not_called()
+
+    def test_5xx_retried_for_get(self, urlopen_mock, sleep_mock,
+                                 basic_auth_client, mock_success_response, make_http_error):
+        """A transient 5xx on GET should be retried."""
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(503, SERVER_ERROR_BODY), mock_success_response)
+
+        result = basic_auth_client.get("incident")
+
+        assert "result" in result
+        assert len(urlopen_mock.calls) == 2
+
+    def test_5xx_not_retried_for_post(self, urlopen_mock, sleep_mock, basic_auth_client,
+                                      make_http_error):
+        """A 5xx on POST should not be resent, since the record may exist."""
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(500, SERVER_ERROR_BODY))
+
+        with pytest.raises(ServiceNowError):
+            basic_auth_client.post("incident", {"short_description": "x"})
+
+        assert len(urlopen_mock.calls) == 1
+
+    def test_network_error_retried_for_get(self, urlopen_mock, sleep_mock,
+                                           basic_auth_client, mock_success_response):
+        """A dropped connection on GET should be retried."""
+        urlopen_mock.add(INCIDENT_PATH, URLError(ConnectionResetError("reset")), mock_success_response)
+
+        basic_auth_client.get("incident")
+
+        assert len(urlopen_mock.calls) == 2
+
+    def test_certificate_error_not_retried(self, urlopen_mock, sleep_mock, basic_auth_client):
+        """TLS certificate failures are not transient and should fail fast."""
+        urlopen_mock.add(INCIDENT_PATH, URLError(ssl.SSLCertVerificationError("bad cert")))
+
+        with pytest.raises(ServiceNowError) as exc_info:
+            basic_auth_client.get("incident")
+
+        assert not isinstance(exc_info.value, NetworkError)
+        assert len(urlopen_mock.calls) == 1
+
+    @pytest.mark.parametrize("code,error_class", [
+        pytest.param(400, ValidationError, id="400"),
+        pytest.param(401, AuthenticationError, id="401"),
+        pytest.param(403, AuthenticationError, id="403"),
+        pytest.param(404, NotFoundError, id="404"),
+    ])
+    def test_client_errors_not_retried(self, urlopen_mock, sleep_mock, code, error_class,
+                                       basic_auth_client, make_http_error):
+        """4xx errors other than 429 should fail fast."""
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(code, SERVER_ERROR_BODY))
+
+        with pytest.raises(error_class):
+            basic_auth_client.get("incident")
+
+        assert len(urlopen_mock.calls) == 1
+        sleep_mock.assert_not_called()
+
+    def test_retry_policy_read_from_config(self, urlopen_mock, sleep_mock, basic_auth_config,
+                                           make_http_error):
+        """retry_max/retry_base/retry_cap config keys should shape the backoff."""
+        config = replace(basic_auth_config, retry_max=2, retry_base=0.5, retry_cap=0.75)
+        client = ServiceNowClient(config)
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(502, SERVER_ERROR_BODY))
+
+        with patch('servicenow_api.random.uniform', return_value=0.0):
+            with pytest.raises(ServiceNowError):
+                client.get("incident")
+
+        assert len(urlopen_mock.calls) == 3
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [0.5, 0.75]
+
+    def test_retry_policy_honors_zero_backoff(self, urlopen_mock, sleep_mock, basic_auth_config,
+                                              make_http_error):
+        """retry_base=0 should retry without waiting instead of using the default."""
+        config = replace(basic_auth_config, retry_max=2, retry_base=0, retry_cap=0)
+        client = ServiceNowClient(config)
+        urlopen_mock.add(INCIDENT_PATH, make_http_error(502, SERVER_ERROR_BODY))
+
+        with pytest.raises(ServiceNowError):
+            client.get("incident")
+
+        assert (client.retry_base, client.retry_cap) == (0.0, 0.0)
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [0.0, 0.0]
 
 
 # =============================================================================
-# Unit Tests - Malformed Env Files (SNOW-36)
-# SNOW-47: Migrated to pytest fixtures
+# Unit Tests - Batch API
 # =============================================================================
 
-class TestMalformedEnvFiles:
-    """Test handling of malformed env file content.
+BATCH_PATH = "/api/now/v1/batch"
 
-    SNOW-47: Migrated from unittest.TestCase to use pytest fixtures.
-    """
 
-    def test_load_env_file_line_without_equals(self, malformed_env_content):
-        """load_env_file should skip lines without '=' separator."""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=malformed_env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
-
-                # Valid lines should be parsed
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
-                assert result["SERVICENOW_USERNAME"] == "admin"
-                assert result["SERVICENOW_PASSWORD"] == "secret"
-                # Malformed lines should be skipped (not causing keys)
-                assert "MALFORMED_LINE_NO_EQUALS" not in result
-                assert "another bad line" not in result
-
-    def test_load_env_file_empty_key(self):
-        """load_env_file should skip lines with empty key before '='."""
-        env_content = """
-=value_without_key
-SERVICENOW_INSTANCE=https://test.service-now.com
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
+def _batch_response(*sub_responses):
+    """Batch API envelope for (id, status_code, body) sub-responses."""
+    return FakeResponse(json.dumps({
+        "batch_request_id": "x",
+        "serviced_requests": [
+            {"id": request_id, "status_code": status, "status_text": "Reason",
+             "body": base64.b64encode(body).decode()}
+            for request_id, status, body in sub_responses
+        ],
+        "unserviced_requests": [],
+    }).encode())
+
+
+def _page(*numbers):
+    """Return a Table API response holding one incident per number."""
+    return FakeResponse(json.dumps({"result": [{"number": n} for n in numbers]}).encode())
+
+
+class TestIterGet:
+    """Test page-by-page iteration with iter_get."""
+
+    def test_iter_get_pages_until_short_page(self, urlopen_mock, basic_auth_client):
+        """iter_get should advance the offset until a page comes back short."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1", "INC2"), _page("INC3", "INC4"), _page("INC5"))
+
+        records = list(basic_auth_client.iter_get("incident", query="active=true", page_size=2))
+
+        assert [r["number"] for r in records] == ["INC1", "INC2", "INC3", "INC4", "INC5"]
+        params = [parse_qs(urlsplit(request.full_url).query) for request, _ in urlopen_mock.calls]
+        assert [p.get("sysparm_offset") for p in params] == [["0"], ["2"], ["4"]]
+        assert all(p["sysparm_limit"] == ["2"] and p["sysparm_query"] == ["active=true"]
+                   for p in params)
+
+    def test_iter_get_fetches_pages_lazily(self, urlopen_mock, basic_auth_client):
+        """No request should be sent until the caller starts iterating."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1", "INC2"), _page())
+
+        records = basic_auth_client.iter_get("incident", page_size=2)
+        assert urlopen_mock.calls == []
+
+        assert next(records)["number"] == "INC1"
+        assert len(list(records)) == 1
+        assert len(urlopen_mock.calls) == 2
+
+    def test_iter_get_prefetches_only_the_next_page(self, urlopen_mock, basic_auth_client):
+        """Stopping early should leave at most one page fetched ahead."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1", "INC2"), _page("INC3", "INC4"), _page("INC5"))
+
+        records = basic_auth_client.iter_get("incident", page_size=2)
+        assert next(records)["number"] == "INC1"
+        records.close()
+
+        offsets = [parse_qs(urlsplit(request.full_url).query)["sysparm_offset"]
+                   for request, _ in urlopen_mock.calls]
+        assert offsets == [["0"], ["2"]]
+
+    def test_iter_get_uses_default_page_size(self, urlopen_mock, basic_auth_client):
+        """Without page_size the PAGE_SIZE class default should be requested."""
+        urlopen_mock.add(INCIDENT_PATH, FakeResponse(EMPTY_RESULT_BODY))
+
+        assert list(basic_auth_client.iter_get("incident")) == []
+        query = parse_qs(urlsplit(urlopen_mock.calls[0][0].full_url).query)
+        assert query["sysparm_limit"] == [str(ServiceNowClient.PAGE_SIZE)]
+
+
+class TestResponseCache:
+    """Test the opt-in get() response cache."""
+
+    @pytest.fixture
+    def cached_client(self, basic_auth_config):
+        return ServiceNowClient(basic_auth_config, cache_size=2, cache_ttl=30)
+
+    def test_repeated_get_served_from_cache(self, urlopen_mock, cached_client):
+        """An identical second get() should not reach the instance."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"))
 
-                # Empty key line should be skipped (SNOW-47: updated behavior)
-                assert "" not in result
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
+        first = cached_client.get("incident", query="active=true")
+        second = cached_client.get("incident", query="active=true")
 
-    def test_load_env_file_empty_value(self):
-        """load_env_file should handle lines with empty value after '='."""
-        env_content = """
+        assert first == second == {"result": [{"number": "INC1"}]}
+        assert len(urlopen_mock.calls) == 1
+
+    def test_cache_disabled_by_default(self, urlopen_mock, basic_auth_client):
+        """Without cache_size every get() should go to the instance."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"))
+
+        basic_auth_client.get("incident")
+        basic_auth_client.get("incident")
+
+        assert len(urlopen_mock.calls) == 2
+
+    def test_cached_response_expires_after_ttl(self, urlopen_mock, cached_client):
+        """Entries older than cache_ttl should be fetched again."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"), _page("INC2"))
+
+        with patch('servicenow_api.time.monotonic', side_effect=[100.0, 129.0, 131.0]):
+            cached_client.get("incident")
+            assert cached_client.get("incident")["result"][0]["number"] == "INC1"
+            assert cached_client.get("incident")["result"][0]["number"] == "INC2"
+
+    def test_write_invalidates_cached_reads_of_table(self, urlopen_mock, cached_client):
+        """A write to a table should drop its cached reads, and only those."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"))
+        urlopen_mock.add("/api/now/table/sys_user", FakeResponse(EMPTY_RESULT_BODY))
+
+        cached_client.get("incident")
+        cached_client.get("sys_user")
+        cached_client.patch("incident", "abc123", {"state": "2"})
+        cached_client.get("incident")
+        cached_client.get("sys_user")
+
+        paths = [urlsplit(request.full_url).path for request, _ in urlopen_mock.calls]
+        assert paths.count(INCIDENT_PATH) == 2
+        assert paths.count("/api/now/table/sys_user") == 1
+
+    def test_least_recently_used_entry_evicted(self, urlopen_mock, cached_client):
+        """Beyond cache_size entries the least recently used one is dropped."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"))
+
+        for query in ["a=1", "a=2", "a=1", "a=3", "a=1", "a=2"]:
+            cached_client.get("incident", query=query)
+
+        queries = [parse_qs(urlsplit(request.full_url).query)["sysparm_query"][0]
+                   for request, _ in urlopen_mock.calls]
+        assert queries == ["a=1", "a=2", "a=3", "a=2"]
+
+    def test_mutating_result_does_not_change_cache(self, urlopen_mock, cached_client):
+        """Callers get their own copy of a cached response."""
+        urlopen_mock.add(INCIDENT_PATH, _page("INC1"))
+
+        cached_client.get("incident")["result"].clear()
+        cached_client.get("incident")["result"].append({"number": "X"})
+
+        assert cached_client.get("incident") == {"result": [{"number": "INC1"}]}
+
+
+class TestBatch:
+    """Test batch and batch_get over the ServiceNow Batch API."""
+
+    def test_batch_get_sends_one_request_and_keeps_order(self, urlopen_mock, basic_auth_client):
+        """batch_get should send every query in one POST and return results in order."""
+        urlopen_mock.add(BATCH_PATH, _batch_response(
+            ("1", 200, b'{"result": [{"user_name": "admin"}]}'),
+            ("0", 200, b'{"result": [{"number": "INC0001"}]}'),
+        ))
+
+        results = basic_auth_client.batch_get([
+            {"table": "incident", "query": "active=true", "limit": 1},
+            {"table": "sys_user", "fields": "user_name", "limit": 1},
+        ])
+
+        assert results == [
+            {"result": [{"number": "INC0001"}]},
+            {"result": [{"user_name": "admin"}]},
+        ]
+        assert len(urlopen_mock.calls) == 1
+        request = urlopen_mock.calls[0][0]
+        assert request.get_method() == "POST"
+        sent = json.loads(request.data)
+        assert [r["url"] for r in sent["rest_requests"]] == [
+            "/api/now/table/incident?sysparm_limit=1&sysparm_query=active%3Dtrue",
+            "/api/now/table/sys_user?sysparm_fields=user_name&sysparm_limit=1",
+        ]
+        assert {r["method"] for r in sent["rest_requests"]} == {"GET"}
+
+    def test_batch_get_raises_error_of_failed_sub_request(self, urlopen_mock, basic_auth_client):
+        """A failed sub-request should raise the same error class as a single request."""
+        urlopen_mock.add(BATCH_PATH, _batch_response(
+            ("0", 200, EMPTY_RESULT_BODY),
+            ("1", 404, b'{"error": {"message": "No Record found"}}'),
+        ))
+
+        with pytest.raises(NotFoundError) as exc_info:
+            basic_auth_client.batch_get([
+                {"table": "incident"},
+                {"table": "incident", "sys_id": "missing"},
+            ])
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.to_dict()["details"]["error"]["message"] == "No Record found"
+
+    def test_batch_get_raises_for_unserviced_request(self, urlopen_mock, basic_auth_client):
+        """A sub-request missing from serviced_requests should raise ServiceNowError."""
+        urlopen_mock.add(BATCH_PATH, _batch_response(("0", 200, EMPTY_RESULT_BODY)))
+
+        with pytest.raises(ServiceNowError, match="Batch request 1 was not serviced"):
+            basic_auth_client.batch_get([{"table": "incident"}, {"table": "sys_user"}])
+
+    def test_batch_get_with_no_requests_makes_no_call(self, urlopen_mock, basic_auth_client):
+        """An empty request list should not hit the network."""
+        assert basic_auth_client.batch_get([]) == []
+        assert urlopen_mock.calls == []
+
+    def test_batch_sends_mixed_methods_with_encoded_bodies(self, urlopen_mock, basic_auth_client):
+        """batch should send each method as given, with JSON bodies base64-encoded."""
+        urlopen_mock.add(BATCH_PATH, _batch_response(
+            ("0", 201, b'{"result": {"number": "INC0002"}}'),
+            ("1", 200, b'{"result": {"state": "2"}}'),
+            ("2", 204, b""),
+        ))
+
+        results = basic_auth_client.batch([
+            {"method": "POST", "table": "incident", "data": {"short_description": "Disk full"}},
+            {"method": "patch", "table": "incident", "sys_id": "abc123", "data": {"state": "2"}},
+            {"method": "DELETE", "table": "incident", "sys_id": "def456"},
+        ])
+
+        assert results == [
+            {"result": {"number": "INC0002"}},
+            {"result": {"state": "2"}},
+            {},
+        ]
+        sent = json.loads(urlopen_mock.calls[0][0].data)["rest_requests"]
+        assert [(r["method"], r["url"]) for r in sent] == [
+            ("POST", "/api/now/table/incident"),
+            ("PATCH", "/api/now/table/incident/abc123"),
+            ("DELETE", "/api/now/table/incident/def456"),
+        ]
+        assert json.loads(base64.b64decode(sent[0]["body"])) == {"short_description": "Disk full"}
+        assert "body" not in sent[2]
+
+    def test_batch_with_writes_is_not_resent_after_server_error(self, urlopen_mock, sleep_mock,
+                                                                basic_auth_client, make_http_error):
+        """A batch containing a POST should not be retried after a 5xx."""
+        urlopen_mock.add(BATCH_PATH, make_http_error(503, b'{"error": "unavailable"}'))
+
+        with pytest.raises(ServiceNowError):
+            basic_auth_client.batch([
+                {"table": "incident"},
+                {"method": "POST", "table": "incident", "data": {"short_description": "x"}},
+            ])
+
+        assert len(urlopen_mock.calls) == 1
+        sleep_mock.assert_not_called()
+
+
+# =============================================================================
+# Unit Tests - Malformed Env Files (SNOW-36)
+# SNOW-47: Migrated to pytest fixtures
+# =============================================================================
+
+# Each case: (env file content, expected load_env_file result)
+ENV_FILE_CASES = [
+    pytest.param(
+        """
+# Valid lines
 SERVICENOW_INSTANCE=https://test.service-now.com
-EMPTY_VALUE=
 SERVICENOW_USERNAME=admin
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
 
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
-                assert result["EMPTY_VALUE"] == ""
-                assert result["SERVICENOW_USERNAME"] == "admin"
+# Malformed lines below
+MALFORMED_LINE_NO_EQUALS
+another bad line
 
-    def test_load_env_file_multiple_equals(self):
-        """load_env_file should handle lines with multiple '=' signs."""
-        env_content = """
+# More valid lines
+SERVICENOW_PASSWORD=secret
+""",
+        {
+            "SERVICENOW_INSTANCE": "https://test.service-now.com",
+            "SERVICENOW_USERNAME": "admin",
+            "SERVICENOW_PASSWORD": "secret",
+        },
+        id="line_without_equals",
+    ),
+    # SNOW-47: lines with an empty key are skipped
+    pytest.param(
+        "\n=value_without_key\nSERVICENOW_INSTANCE=https://test.service-now.com\n",
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com"},
+        id="empty_key",
+    ),
+    pytest.param(
+        "\nSERVICENOW_INSTANCE=https://test.service-now.com\nEMPTY_VALUE=\nSERVICENOW_USERNAME=admin\n",
+        {
+            "SERVICENOW_INSTANCE": "https://test.service-now.com",
+            "EMPTY_VALUE": "",
+            "SERVICENOW_USERNAME": "admin",
+        },
+        id="empty_value",
+    ),
+    # Only the first '=' separates key from value
+    pytest.param(
+        """
 SERVICENOW_INSTANCE=https://test.service-now.com
 URL_WITH_PARAMS=https://example.com?foo=bar&baz=qux
 KEY=value=with=equals
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
+""",
+        {
+            "SERVICENOW_INSTANCE": "https://test.service-now.com",
+            "URL_WITH_PARAMS": "https://example.com?foo=bar&baz=qux",
+            "KEY": "value=with=equals",
+        },
+        id="multiple_equals",
+    ),
+    pytest.param("\n# Only comments\n\n# No actual values\n\n", {}, id="only_comments"),
+    pytest.param("\n\n\n\n", {}, id="only_empty_lines"),
+    pytest.param(
+        "\n  SERVICENOW_INSTANCE  =https://test.service-now.com\nSERVICENOW_USERNAME = admin\n",
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com", "SERVICENOW_USERNAME": "admin"},
+        id="key_with_spaces",
+    ),
+    # Inline comments are not stripped in simple env file parsing
+    pytest.param(
+        "\nSERVICENOW_INSTANCE=https://test.service-now.com # production\n",
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com # production"},
+        id="inline_comment_not_stripped",
+    ),
+    pytest.param(
+        "\n    # SERVICENOW_INSTANCE=https://commented-out.service-now.com\n"
+        "SERVICENOW_INSTANCE=https://test.service-now.com\n",
+        {"SERVICENOW_INSTANCE": "https://test.service-now.com"},
+        id="indented_comment_with_equals",
+    ),
+]
+
+
+@pytest.mark.parametrize("content,expected", ENV_FILE_CASES)
+def test_load_env_file_content(env_loader, content, expected):
+    """load_env_file should skip malformed lines and parse the rest."""
+    assert env_loader(content) == expected
 
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
-                # Only first '=' should be used as separator
-                assert result["URL_WITH_PARAMS"] == "https://example.com?foo=bar&baz=qux"
-                assert result["KEY"] == "value=with=equals"
 
-    def test_load_env_file_only_comments(self, empty_env_content):
-        """load_env_file should return empty dict for file with only comments."""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=empty_env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
+# =============================================================================
+# Unit Tests - Connection Pooling
+# =============================================================================
 
-                assert result == {}
+class FakeConnection:
+    """Stand-in for http.client.HTTP(S)Connection that records requests."""
+
+    instances = []
+
+    def __init__(self, host, port=None, timeout=None, context=None):
+        self.host = host
+        self.timeout = timeout
+        self.sock = None
+        self.requests = []
+        self.closed = False
+        self.status = 200
+        self.body = b'{"result": []}'
+        self.headers = {}
+        self.will_close = False
+        self.fail_next = None
+        self.fail_response = None
+        FakeConnection.instances.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        """Record the request, or raise fail_next before it counts as sent."""
+        if self.fail_next:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.requests.append((method, path, body, headers))
+
+    def getresponse(self):
+        """Return the canned response, or raise fail_response after the request was sent."""
+        if self.fail_response:
+            error, self.fail_response = self.fail_response, None
+            raise error
+        # Only the http.client.HTTPResponse attributes the pool reads
+        body = self.body
+        return SimpleNamespace(status=self.status, reason='Reason', msg=self.headers,
+                               will_close=self.will_close, read=lambda: body)
+
+    def close(self):
+        """Mark the connection closed."""
+        self.closed = True
 
-    def test_load_env_file_only_empty_lines(self):
-        """load_env_file should return empty dict for file with only empty lines."""
-        env_content = """
 
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """A fresh _ConnectionPool whose connections are FakeConnection objects."""
+    FakeConnection.instances = []
+    monkeypatch.setattr('servicenow_api.getproxies', lambda: {})
+    monkeypatch.setattr('servicenow_api.http.client.HTTPSConnection', FakeConnection)
+    monkeypatch.setattr('servicenow_api.http.client.HTTPConnection', FakeConnection)
+    return _ConnectionPool()
 
 
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
+def _request(url, method='GET', data=None):
+    """Build a JSON request like the ones ServiceNowClient sends."""
+    return Request(url, data=data, headers={'Accept': 'application/json'}, method=method)
 
-                assert result == {}
 
-    def test_load_env_file_key_with_spaces(self):
-        """load_env_file should strip spaces from keys."""
-        env_content = """
-  SERVICENOW_INSTANCE  =https://test.service-now.com
-SERVICENOW_USERNAME = admin
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
+def test_pool_reuses_connection_for_same_host(fake_pool):
+    """Consecutive requests to one host should share a connection."""
+    url = 'https://test.service-now.com/api/now/table/incident?sysparm_limit=1'
+    first = fake_pool.urlopen(_request(url), timeout=30)
+    second = fake_pool.urlopen(_request(url), timeout=30)
 
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com"
-                assert result["SERVICENOW_USERNAME"] == "admin"
+    assert len(FakeConnection.instances) == 1
+    conn = FakeConnection.instances[0]
+    assert [r[1] for r in conn.requests] == ['/api/now/table/incident?sysparm_limit=1'] * 2
+    assert json.loads(first.read()) == {'result': []}
+    assert second.status == 200
 
-    def test_load_env_file_inline_comment_not_stripped(self):
-        """load_env_file should not strip inline comments (they become part of value)."""
-        env_content = """
-SERVICENOW_INSTANCE=https://test.service-now.com # production
-"""
-        with patch('builtins.open', unittest.mock.mock_open(read_data=env_content)):
-            with patch.object(Path, 'exists', return_value=True):
-                result = load_env_file(Path("/fake/.claude/env"))
 
-                # Inline comments are not stripped in simple env file parsing
-                assert result["SERVICENOW_INSTANCE"] == "https://test.service-now.com # production"
+def test_pool_keeps_separate_connections_per_host(fake_pool):
+    """Each host should get its own connection."""
+    fake_pool.urlopen(_request('https://one.service-now.com/api/now/table/incident'))
+    fake_pool.urlopen(_request('https://two.service-now.com/api/now/table/incident'))
+
+    assert [c.host for c in FakeConnection.instances] == [
+        'one.service-now.com', 'two.service-now.com'
+    ]
+
+
+def test_pool_raises_http_error_with_body(fake_pool):
+    """Error statuses should raise HTTPError carrying the response body."""
+    fake_pool.urlopen(_request('https://test.service-now.com/api/now/table/incident'))
+    conn = FakeConnection.instances[0]
+    conn.status = 404
+    conn.body = b'{"error": {"message": "No Record found"}}'
+
+    with pytest.raises(HTTPError) as exc_info:
+        fake_pool.urlopen(_request('https://test.service-now.com/api/now/table/incident/x'))
+
+    assert exc_info.value.code == 404
+    assert json.loads(exc_info.value.read())['error']['message'] == 'No Record found'
+    # Error responses still leave the connection usable
+    assert not conn.closed
+
+
+def test_pool_retries_once_when_idle_connection_was_dropped(fake_pool):
+    """A dropped idle connection should be replaced and the request resent once."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    stale = FakeConnection.instances[0]
+    stale.fail_next = http.client.RemoteDisconnected('closed')
+
+    response = fake_pool.urlopen(_request(url))
+
+    assert response.status == 200
+    assert stale.closed
+    assert len(FakeConnection.instances) == 2
+
+
+def test_pool_wraps_connection_errors_in_url_error(fake_pool, monkeypatch):
+    """Socket errors should surface as URLError, like urllib."""
+    def refuse(self, *args, **kwargs):
+        raise ConnectionRefusedError('refused')
+    monkeypatch.setattr(FakeConnection, 'request', refuse)
+
+    with pytest.raises(URLError) as exc_info:
+        fake_pool.urlopen(_request('https://test.service-now.com/api/now/table/incident'))
+
+    assert isinstance(exc_info.value.reason, ConnectionRefusedError)
+
+
+def test_pool_resends_post_when_dropped_before_it_was_written(fake_pool):
+    """A POST that never reached the server should be sent on a new connection."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    stale = FakeConnection.instances[0]
+    stale.fail_next = BrokenPipeError('broken pipe')
+
+    response = fake_pool.urlopen(_request(url, 'POST', b'{"a": 2}'))
+
+    assert response.status == 200
+    assert [r[0] for r in FakeConnection.instances[1].requests] == ['POST']
+
+
+def test_pool_does_not_resend_post_when_dropped_after_it_was_written(fake_pool):
+    """A POST the server may already have applied should not be sent twice."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    stale = FakeConnection.instances[0]
+    stale.fail_response = ConnectionResetError('reset')
+
+    with pytest.raises(URLError) as exc_info:
+        fake_pool.urlopen(_request(url, 'POST', b'{"a": 2}'))
+
+    assert isinstance(exc_info.value.reason, ConnectionResetError)
+    assert len(FakeConnection.instances) == 1
+    assert [r[0] for r in stale.requests] == ['GET', 'POST']
+
+
+def test_pool_resends_get_when_dropped_after_it_was_written(fake_pool):
+    """Idempotent requests may be resent even after reaching the server."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    FakeConnection.instances[0].fail_response = http.client.RemoteDisconnected('closed')
+
+    response = fake_pool.urlopen(_request(url))
+
+    assert response.status == 200
+    assert len(FakeConnection.instances) == 2
+
+
+def test_pool_sends_default_user_agent(fake_pool):
+    """Requests without a User-Agent should get urllib's default one."""
+    fake_pool.urlopen(_request('https://test.service-now.com/api/now/table/incident'))
+
+    headers = FakeConnection.instances[0].requests[0][3]
+    assert headers['User-agent'] == _ConnectionPool.USER_AGENT
+    assert headers['User-agent'].startswith('Python-urllib/')
+
+
+def test_pool_follows_redirects_for_get(fake_pool, monkeypatch):
+    """A GET should follow a redirect to its Location, as urllib does."""
+    responses = iter([
+        (302, {'Location': '/api/now/table/incident?sysparm_limit=1'}, b''),
+        (200, {}, b'{"result": []}'),
+    ])
+
+    def getresponse(self):
+        status, headers, body = next(responses)
+        return SimpleNamespace(status=status, reason='Reason', msg=headers,
+                               will_close=False, read=lambda: body)
+    monkeypatch.setattr(FakeConnection, 'getresponse', getresponse)
+
+    response = fake_pool.urlopen(_request('https://test.service-now.com/old'))
+
+    assert response.status == 200
+    assert response.url == 'https://test.service-now.com/api/now/table/incident?sysparm_limit=1'
+    assert [r[1] for r in FakeConnection.instances[0].requests] == [
+        '/old', '/api/now/table/incident?sysparm_limit=1'
+    ]
+
+
+def test_pool_raises_http_error_for_redirects_it_does_not_follow(fake_pool):
+    """A PATCH answered with a redirect should fail instead of being resent."""
+    url = 'https://test.service-now.com/api/now/table/incident/abc'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.status = 307
+    conn.headers = {'Location': 'https://other.service-now.com/'}
+
+    with pytest.raises(HTTPError) as exc_info:
+        fake_pool.urlopen(_request(url, 'PATCH', b'{"state": "2"}'))
+
+    assert exc_info.value.code == 307
+    assert len(conn.requests) == 2
+
+
+def test_pool_stops_following_redirect_loops(fake_pool):
+    """Redirect loops should end in HTTPError after MAX_REDIRECTIONS hops."""
+    url = 'https://test.service-now.com/loop'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.status = 301
+    conn.headers = {'Location': url}
+
+    with pytest.raises(HTTPError) as exc_info:
+        fake_pool.urlopen(_request(url))
+
+    assert exc_info.value.code == 301
+    assert len(conn.requests) == 1 + _ConnectionPool.MAX_REDIRECTIONS + 1
+
+
+def test_pool_does_not_keep_connections_the_server_closes(fake_pool):
+    """Connections the server marks to close should not go back to the pool."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    FakeConnection.instances[0].will_close = True
+    fake_pool.urlopen(_request(url))
+    fake_pool.urlopen(_request(url))
+
+    assert FakeConnection.instances[0].closed
+    assert len(FakeConnection.instances) == 2
+
+
+def test_pool_does_not_send_back_session_cookies(fake_pool):
+    """Set-Cookie responses should not turn into Cookie headers on later requests."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.headers = {'Set-Cookie': 'JSESSIONID=abc123; Path=/; Secure; HttpOnly'}
+    fake_pool.urlopen(_request(url))
+    fake_pool.urlopen(_request(url))
+
+    assert len(conn.requests) == 3
+    assert all('Cookie' not in headers for _, _, _, headers in conn.requests)
+
+
+def test_pool_requests_and_decompresses_gzip_bodies(fake_pool):
+    """The pool should ask for gzip and hand back the decompressed body."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.headers = {'Content-Encoding': 'gzip'}
+    conn.body = gzip.compress(b'{"result": [{"number": "INC0001"}]}')
+
+    response = fake_pool.urlopen(_request(url))
+
+    assert conn.requests[0][3]['Accept-encoding'] == 'gzip'
+    assert json.loads(response.read()) == {"result": [{"number": "INC0001"}]}
+
+
+def test_pool_decompresses_gzip_error_bodies(fake_pool):
+    """HTTPError bodies should be decompressed too."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.status = 404
+    conn.headers = {'Content-Encoding': 'gzip'}
+    conn.body = gzip.compress(b'{"error": {"message": "No Record found"}}')
+
+    with pytest.raises(HTTPError) as exc_info:
+        fake_pool.urlopen(_request(url))
+
+    assert exc_info.value.read() == b'{"error": {"message": "No Record found"}}'
+
+
+@pytest.mark.parametrize('body', [
+    gzip.compress(b'{"result": []}')[:-6],
+    b'not gzip at all',
+], ids=['truncated', 'corrupt'])
+def test_pool_wraps_undecodable_gzip_bodies_in_url_error(fake_pool, body):
+    """A gzip body that cannot be decompressed should raise URLError, not a gzip error."""
+    url = 'https://test.service-now.com/api/now/table/incident'
+    fake_pool.urlopen(_request(url))
+    conn = FakeConnection.instances[0]
+    conn.headers = {'Content-Encoding': 'gzip'}
+    conn.body = body
+
+    with pytest.raises(URLError):
+        fake_pool.urlopen(_request(url))
+
+
+def test_get_request_with_corrupt_gzip_body_raises_network_error(basic_auth_client, fake_pool, monkeypatch):
+    """The client should report an undecodable body as a NetworkError."""
+    monkeypatch.setattr('servicenow_api._CONNECTION_POOL', fake_pool)
+
+    def getresponse(self):
+        return SimpleNamespace(status=200, reason='OK', msg={'Content-Encoding': 'gzip'},
+                               will_close=False, read=lambda: b'not gzip at all')
+    monkeypatch.setattr(FakeConnection, 'getresponse', getresponse)
+
+    with patch('servicenow_api.time.sleep'), pytest.raises(NetworkError):
+        basic_auth_client.get('incident')
 
 
 # =============================================================================
 # Integration Tests (requires real ServiceNow instance)
 # =============================================================================
 
-@unittest.skipUnless(
-    os.environ.get('SERVICENOW_INSTANCE') and
-    (os.environ.get('SERVICENOW_API_KEY') or
-     (os.environ.get('SERVICENOW_USERNAME') and os.environ.get('SERVICENOW_PASSWORD')) or
-     (os.environ.get('SERVICENOW_CLIENT_ID') and os.environ.get('SERVICENOW_CLIENT_SECRET'))),
-    "ServiceNow credentials not configured - skipping integration tests"
-)
-class TestServiceNowIntegration(unittest.TestCase):
+@pytest.mark.integration
+class TestServiceNowIntegration:
     """Integration tests against real ServiceNow instance.
 
     These tests are skipped unless ServiceNow credentials are configured.
     Set the following environment variables to run:
         - SERVICENOW_INSTANCE
         - SERVICENOW_USERNAME / SERVICENOW_PASSWORD (or other auth method)
-    """
 
-    @classmethod
-    def setUpClass(cls):
-        """Create client for integration tests."""
-        cls.client = create_client()
+    All of them are independent reads, so they can run in parallel with
+    pytest-xdist, e.g. ``pytest -m integration -n 4``.
+    """
 
-    def test_integration_client_connection(self):
+    def test_integration_client_connection(self, integration_client):
         """Verify client can connect to ServiceNow instance."""
         # This test simply verifies the client is configured
-        self.assertIsNotNone(self.client.instance)
+        assert integration_client.instance is not None
 
-    def test_integration_get_incidents(self):
+    def test_integration_get_incidents(self, integration_client):
         """Verify GET request works for incident table."""
         try:
-            result = self.client.get("incident", limit=1)
-            self.assertIn("result", result)
+            result = integration_client.get("incident", limit=1)
+            assert "result" in result
         except (AuthenticationError, ServiceNowError) as e:
-            self.skipTest(f"Integration test skipped due to: {e}")
+            pytest.skip(f"Integration test skipped due to: {e}")
 
-    def test_integration_query_with_filters(self):
+    def test_integration_query_with_filters(self, integration_client):
         """Verify query with filters works."""
         try:
-            result = self.client.get(
+            result = integration_client.get(
                 "incident",
                 query="active=true",
                 fields="number,short_description,state",
                 limit=5
             )
-            self.assertIn("result", result)
+            assert "result" in result
         except (AuthenticationError, ServiceNowError) as e:
-            self.skipTest(f"Integration test skipped due to: {e}")
+            pytest.skip(f"Integration test skipped due to: {e}")
 
-    def test_integration_get_sys_user(self):
+    def test_integration_get_sys_user(self, integration_client):
         """Verify GET request works for sys_user table."""
         try:
-            result = self.client.get("sys_user", limit=1)
-            self.assertIn("result", result)
+            result = integration_client.get("sys_user", limit=1)
+            assert "result" in result
         except (AuthenticationError, ServiceNowError) as e:
-            self.skipTest(f"Integration test skipped due to: {e}")
+            pytest.skip(f"Integration test skipped due to: {e}")
 
+    def test_integration_get_many_runs_queries_concurrently(self, integration_client):
+        """Verify get_many fans independent queries out over pooled connections."""
+        try:
+            results = integration_client.get_many(
+                "incident", ["active=true", "active=false"], fields="number", limit=1
+            )
+            assert len(results) == 2
+            assert all("result" in result for result in results)
+        except (AuthenticationError, ServiceNowError) as e:
+            pytest.skip(f"Integration test skipped due to: {e}")
 
-if __name__ == "__main__":
-    # Run tests with verbosity
-    unittest.main(verbosity=2)
+    def test_integration_batch_get(self, integration_client):
+        """Verify batch_get fetches several tables in one Batch API call."""
+        try:
+            results = integration_client.batch_get([
+                {"table": "incident", "limit": 1},
+                {"table": "sys_user", "limit": 1},
+                {"table": "incident", "query": "active=true", "limit": 5},
+            ])
+            assert len(results) == 3
+            assert all("result" in result for result in results)
+        except (AuthenticationError, ServiceNowError) as e:
+            pytest.skip(f"Integration test skipped due to: {e}")
@@ -13,12 +13,14 @@ Test coverage:
 """
 
 import os
-import sys
+import re
 import ast
 import unittest
 import tempfile
 import shutil
+import functools
 from pathlib import Path
+from typing import Dict, Iterator, Optional
 
 
 # Get the project root directory (parent of tests/)
@@ -37,65 +39,126 @@ README_PATH = PROJECT_ROOT / "README.md"
 GITIGNORE_PATH = PROJECT_ROOT / ".gitignore"
 
 
+# VCS, virtualenv, cache and build directories; never part of the skill
+_SKIPPED_DIRS = frozenset({
+    ".git", ".venv", "venv", "node_modules", "__pycache__", ".tox",
+    "build", "dist", ".mypy_cache", ".pytest_cache",
+})
+
+
+def _iter_files(root: Path, suffix: str) -> Iterator[Path]:
+    """Yield files under root ending in suffix.
+
+    Works on the plain strings os.walk returns and only builds a Path for
+    matching files, instead of one per visited entry as Path.rglob does.
+    Directories in _SKIPPED_DIRS are pruned before os.walk descends into them.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIPPED_DIRS]
+        for filename in filenames:
+            if filename.endswith(suffix):
+                yield Path(dirpath, filename)
+
+
+@functools.lru_cache(maxsize=None)
+def _listing(directory: Path) -> frozenset:
+    """Names of the entries in directory, listed once per test run (empty if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _exists(path: Path) -> bool:
+    """Path.exists() answered from the cached parent listing instead of a stat per check."""
+    return path.name in _listing(path.parent)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bytes(path: Path) -> bytes:
+    """Read a project file once per test run; several tests inspect the same files."""
+    return path.read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: Path) -> str:
+    """Return a project file as text, for checks that need more than ASCII substrings."""
+    return _read_bytes(path).decode()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(path: Path) -> ast.AST:
+    """Parse a project Python file once per test run.
+
+    The syntax tests overlap (all scripts, every project file), so without
+    this each script would be parsed twice. A SyntaxError is
+    not cached and is raised again on every call.
+    """
+    return ast.parse(_read(path), filename=str(path))
+
+
+# The frontmatter block between the opening and closing "---" lines, and the
+# name/description fields inside it; lines may end in LF or CRLF
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)^[ \t]*---[ \t]*\r?$", re.DOTALL | re.MULTILINE)
+_FRONTMATTER_FIELD_RE = re.compile(r"^[ \t]*(name|description):[ \t]*(.*?)[ \t]*\r?$", re.MULTILINE)
+
+# Any of the ways a skill doc can show how to run its script, in one pass
+_SCRIPT_REF_RE = re.compile(rb"python scripts/|## script|```bash", re.IGNORECASE)
+
+
+def _parse_frontmatter(content: str) -> Optional[Dict[str, str]]:
+    """Return the name/description fields of a SKILL.md, or None without a closed block."""
+    match = _FRONTMATTER_RE.match(content)
+    if match is None:
+        return None
+    return dict(_FRONTMATTER_FIELD_RE.findall(match.group(1)))
+
+
+@functools.lru_cache(maxsize=None)
+def _skill_frontmatter() -> Optional[Dict[str, str]]:
+    """Frontmatter fields of the project's SKILL.md, parsed once per test run."""
+    return _parse_frontmatter(_read(SKILL_MD_PATH))
+
+
 class TestSkillDiscovery(unittest.TestCase):
     """Test that the ServiceNow skill can be discovered by Claude Code."""
 
     def test_skill_md_exists(self):
         """SKILL.md file must exist for Claude Code to discover the skill."""
         self.assertTrue(
-            SKILL_MD_PATH.exists(),
+            _exists(SKILL_MD_PATH),
             "SKILL.md file is required for skill discovery"
         )
 
     def test_skill_md_has_frontmatter(self):
         """SKILL.md must have valid YAML frontmatter with name and description."""
-        content = SKILL_MD_PATH.read_text()
-
-        # Check for frontmatter delimiters
         self.assertTrue(
-            content.startswith("---"),
+            _read(SKILL_MD_PATH).startswith("---"),
             "SKILL.md must start with YAML frontmatter (---)"
         )
 
-        # Find the closing frontmatter delimiter
-        lines = content.split("\n")
-        frontmatter_end = None
-        for i, line in enumerate(lines[1:], start=1):
-            if line.strip() == "---":
-                frontmatter_end = i
-                break
-
+        frontmatter = _skill_frontmatter()
         self.assertIsNotNone(
-            frontmatter_end,
+            frontmatter,
             "SKILL.md must have closing frontmatter delimiter (---)"
         )
 
-        # Extract and validate frontmatter
-        frontmatter_lines = lines[1:frontmatter_end]
-        frontmatter_content = "\n".join(frontmatter_lines)
-
         # Check for required fields
         self.assertIn(
-            "name:",
-            frontmatter_content,
+            "name",
+            frontmatter,
             "SKILL.md frontmatter must contain 'name' field"
         )
         self.assertIn(
-            "description:",
-            frontmatter_content,
+            "description",
+            frontmatter,
             "SKILL.md frontmatter must contain 'description' field"
         )
 
     def test_skill_md_has_name(self):
         """SKILL.md frontmatter name field must be non-empty."""
-        content = SKILL_MD_PATH.read_text()
-        lines = content.split("\n")
-
-        name_value = None
-        for line in lines:
-            if line.strip().startswith("name:"):
-                name_value = line.split(":", 1)[1].strip()
-                break
+        name_value = (_skill_frontmatter() or {}).get("name")
 
         self.assertIsNotNone(name_value, "name field not found in frontmatter")
         self.assertTrue(
@@ -105,14 +168,7 @@ class TestSkillDiscovery(unittest.TestCase):
 
     def test_skill_md_has_description(self):
         """SKILL.md frontmatter description field must be non-empty."""
-        content = SKILL_MD_PATH.read_text()
-        lines = content.split("\n")
-
-        description_value = None
-        for line in lines:
-            if line.strip().startswith("description:"):
-                description_value = line.split(":", 1)[1].strip()
-                break
+        description_value = (_skill_frontmatter() or {}).get("description")
 
         self.assertIsNotNone(
             description_value,
@@ -149,38 +205,6 @@ class TestSkillLoading(unittest.TestCase):
             "skills/ must be a directory"
         )
 
-    def test_servicenow_api_module_exists(self):
-        """Base API module must exist."""
-        self.assertTrue(
-            SERVICENOW_API_PATH.exists(),
-            "scripts/servicenow_api.py is required"
-        )
-
-    def test_servicenow_api_module_syntax(self):
-        """Base API module must have valid Python syntax."""
-        content = SERVICENOW_API_PATH.read_text()
-
-        try:
-            ast.parse(content)
-        except SyntaxError as e:
-            self.fail(f"servicenow_api.py has syntax error: {e}")
-
-    def test_incidents_module_exists(self):
-        """Incidents module must exist."""
-        self.assertTrue(
-            INCIDENTS_MODULE_PATH.exists(),
-            "scripts/incidents.py is required"
-        )
-
-    def test_incidents_module_syntax(self):
-        """Incidents module must have valid Python syntax."""
-        content = INCIDENTS_MODULE_PATH.read_text()
-
-        try:
-            ast.parse(content)
-        except SyntaxError as e:
-            self.fail(f"incidents.py has syntax error: {e}")
-
     def test_all_python_scripts_have_valid_syntax(self):
         """All Python scripts must have valid syntax."""
         python_files = list(SCRIPTS_DIR.glob("*.py"))
@@ -192,16 +216,21 @@ class TestSkillLoading(unittest.TestCase):
         )
 
         for py_file in python_files:
-            content = py_file.read_text()
-            try:
-                ast.parse(content)
-            except SyntaxError as e:
-                self.fail(f"{py_file.name} has syntax error: {e}")
+            with self.subTest(script=py_file.name):
+                try:
+                    _parse(py_file)
+                except SyntaxError as e:
+                    self.fail(f"{py_file.name} has syntax error: {e}")
 
 
 class TestSkillDocumentation(unittest.TestCase):
     """Test that all skill documentation files are accessible."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Walk skills/ once; several tests check every documentation file."""
+        cls.skills_md = list(_iter_files(SKILLS_DIR, ".md"))
+
     def test_skills_directory_has_subdirectories(self):
         """skills/ directory should contain operation subdirectories."""
         subdirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
@@ -215,7 +244,7 @@ class TestSkillDocumentation(unittest.TestCase):
     def test_incidents_skill_directory_exists(self):
         """Incidents skill documentation directory must exist."""
         self.assertTrue(
-            INCIDENTS_DIR.exists(),
+            _exists(INCIDENTS_DIR),
             "skills/incidents/ directory is required"
         )
 
@@ -229,24 +258,9 @@ class TestSkillDocumentation(unittest.TestCase):
             "skills/incidents/ should contain at least one .md file"
         )
 
-    def test_get_incident_documentation_exists(self):
-        """get-incident.md documentation must exist."""
-        self.assertTrue(
-            GET_INCIDENT_MD_PATH.exists(),
-            "skills/incidents/get-incident.md is required"
-        )
-
-    def test_query_incidents_documentation_exists(self):
-        """query-incidents.md documentation must exist."""
-        self.assertTrue(
-            QUERY_INCIDENTS_MD_PATH.exists(),
-            "skills/incidents/query-incidents.md is required"
-        )
-
     def test_all_documentation_files_readable(self):
         """All documentation files must be readable."""
-        # Find all .md files recursively
-        md_files = list(SKILLS_DIR.rglob("*.md"))
+        md_files = self.skills_md
 
         self.assertGreater(
             len(md_files),
@@ -256,7 +270,8 @@ class TestSkillDocumentation(unittest.TestCase):
 
         for md_file in md_files:
             try:
-                content = md_file.read_text()
+                # Shares the cached read with the script-reference check
+                content = _read_bytes(md_file)
                 self.assertGreater(
                     len(content),
                     0,
@@ -267,19 +282,11 @@ class TestSkillDocumentation(unittest.TestCase):
 
     def test_documentation_has_script_references(self):
         """Documentation files should reference the scripts to execute."""
-        md_files = list(SKILLS_DIR.rglob("*.md"))
-
-        for md_file in md_files:
-            content = md_file.read_text()
+        for md_file in self.skills_md:
             # Each doc file should mention how to run the operation
             # Either via "python scripts/" or "Script" section
-            has_script_ref = (
-                "python scripts/" in content.lower() or
-                "## script" in content.lower() or
-                "```bash" in content.lower()
-            )
             self.assertTrue(
-                has_script_ref,
+                _SCRIPT_REF_RE.search(_read_bytes(md_file)),
                 f"{md_file} should reference how to execute the operation"
             )
 
@@ -298,48 +305,49 @@ class TestSkillStructure(unittest.TestCase):
         ]
 
         for file_path in required_paths:
-            self.assertTrue(
-                file_path.exists(),
-                f"Required file missing: {file_path.relative_to(PROJECT_ROOT)}"
-            )
+            with self.subTest(path=file_path.relative_to(PROJECT_ROOT)):
+                self.assertTrue(
+                    _exists(file_path),
+                    f"Required file missing: {file_path.relative_to(PROJECT_ROOT)}"
+                )
 
     def test_no_syntax_errors_in_any_python_file(self):
         """No Python file in the project should have syntax errors."""
-        python_files = list(PROJECT_ROOT.rglob("*.py"))
+        python_files = list(_iter_files(PROJECT_ROOT, ".py"))
 
         # Exclude test files from this check (they may have intentional issues)
         python_files = [f for f in python_files if "test_" not in f.name]
 
         for py_file in python_files:
-            content = py_file.read_text()
-            try:
-                ast.parse(content)
-            except SyntaxError as e:
-                self.fail(f"{py_file.relative_to(PROJECT_ROOT)} has syntax error: {e}")
+            with self.subTest(path=py_file.relative_to(PROJECT_ROOT)):
+                try:
+                    _parse(py_file)
+                except SyntaxError as e:
+                    self.fail(f"{py_file.relative_to(PROJECT_ROOT)} has syntax error: {e}")
 
     def test_readme_exists(self):
         """README.md should exist for project documentation."""
         self.assertTrue(
-            README_PATH.exists(),
+            _exists(README_PATH),
             "README.md is recommended for project documentation"
         )
 
     def test_gitignore_exists(self):
         """.gitignore should exist to prevent committing sensitive files."""
         self.assertTrue(
-            GITIGNORE_PATH.exists(),
+            _exists(GITIGNORE_PATH),
             ".gitignore is recommended"
         )
 
     def test_gitignore_excludes_env_files(self):
         """.gitignore should exclude environment files with credentials."""
-        content = GITIGNORE_PATH.read_text()
+        content = _read_bytes(GITIGNORE_PATH)
 
         # Check for common patterns that exclude env files
         excludes_env = any([
-            ".env" in content,
-            "*.env" in content,
-            ".claude/env" in content,
+            b".env" in content,
+            b"*.env" in content,
+            b".claude/env" in content,
         ])
 
         self.assertTrue(
@@ -351,13 +359,15 @@ class TestSkillStructure(unittest.TestCase):
 class TestErrorHandling(unittest.TestCase):
     """Negative test cases for error handling scenarios."""
 
-    def setUp(self):
-        """Create a temporary directory for test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        """Create one empty directory standing in for a broken skill checkout."""
+        cls.temp_dir = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary directory after tests."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def test_missing_skill_md_detected(self):
         """Verify that a missing SKILL.md file is detected."""
@@ -369,10 +379,8 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_frontmatter_missing_opening_delimiter(self):
         """Detect SKILL.md without opening frontmatter delimiter."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("name: test\ndescription: test\n---\n# Content")
+        content = "name: test\ndescription: test\n---\n# Content"
 
-        content = invalid_skill_md.read_text()
         self.assertFalse(
             content.startswith("---"),
             "Content without opening delimiter should be detected"
@@ -380,36 +388,28 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_frontmatter_missing_closing_delimiter(self):
         """Detect SKILL.md without closing frontmatter delimiter."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("---\nname: test\ndescription: test\n# Content without closing")
-
-        content = invalid_skill_md.read_text()
-        lines = content.split("\n")
-
-        frontmatter_end = None
-        for i, line in enumerate(lines[1:], start=1):
-            if line.strip() == "---":
-                frontmatter_end = i
-                break
+        content = "---\nname: test\ndescription: test\n# Content without closing"
 
         self.assertIsNone(
-            frontmatter_end,
+            _parse_frontmatter(content),
             "Missing closing delimiter should be detected"
         )
 
+    def test_frontmatter_with_crlf_line_endings(self):
+        """Parse SKILL.md frontmatter saved with Windows line endings."""
+        content = "---\r\nname: test name\r\ndescription: test description\r\n---\r\n# Content"
+
+        self.assertEqual(
+            _parse_frontmatter(content),
+            {"name": "test name", "description": "test description"},
+            "CRLF line endings should not break frontmatter parsing"
+        )
+
     def test_invalid_frontmatter_missing_name_field(self):
         """Detect SKILL.md with missing name field."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("---\ndescription: test description\n---\n# Content")
+        content = "---\ndescription: test description\n---\n# Content"
 
-        content = invalid_skill_md.read_text()
-        lines = content.split("\n")
-
-        name_value = None
-        for line in lines:
-            if line.strip().startswith("name:"):
-                name_value = line.split(":", 1)[1].strip()
-                break
+        name_value = _parse_frontmatter(content).get("name")
 
         self.assertIsNone(
             name_value,
@@ -418,17 +418,9 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_frontmatter_missing_description_field(self):
         """Detect SKILL.md with missing description field."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("---\nname: test name\n---\n# Content")
-
-        content = invalid_skill_md.read_text()
-        lines = content.split("\n")
+        content = "---\nname: test name\n---\n# Content"
 
-        description_value = None
-        for line in lines:
-            if line.strip().startswith("description:"):
-                description_value = line.split(":", 1)[1].strip()
-                break
+        description_value = _parse_frontmatter(content).get("description")
 
         self.assertIsNone(
             description_value,
@@ -437,17 +429,9 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_frontmatter_empty_name_field(self):
         """Detect SKILL.md with empty name field."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("---\nname:\ndescription: test description\n---\n# Content")
+        content = "---\nname:\ndescription: test description\n---\n# Content"
 
-        content = invalid_skill_md.read_text()
-        lines = content.split("\n")
-
-        name_value = None
-        for line in lines:
-            if line.strip().startswith("name:"):
-                name_value = line.split(":", 1)[1].strip()
-                break
+        name_value = _parse_frontmatter(content).get("name")
 
         self.assertEqual(
             name_value,
@@ -457,17 +441,9 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_frontmatter_empty_description_field(self):
         """Detect SKILL.md with empty description field."""
-        invalid_skill_md = self.temp_dir / "SKILL.md"
-        invalid_skill_md.write_text("---\nname: test name\ndescription:\n---\n# Content")
-
-        content = invalid_skill_md.read_text()
-        lines = content.split("\n")
+        content = "---\nname: test name\ndescription:\n---\n# Content"
 
-        description_value = None
-        for line in lines:
-            if line.strip().startswith("description:"):
-                description_value = line.split(":", 1)[1].strip()
-                break
+        description_value = _parse_frontmatter(content).get("description")
 
         self.assertEqual(
             description_value,
@@ -477,10 +453,8 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_python_syntax_detected(self):
         """Detect Python files with syntax errors."""
-        invalid_py = self.temp_dir / "invalid.py"
-        invalid_py.write_text("def broken(\n    # missing closing paren")
+        content = "def broken(\n    # missing closing paren"
 
-        content = invalid_py.read_text()
         with self.assertRaises(SyntaxError):
             ast.parse(content)
 
@@ -502,9 +476,7 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_empty_documentation_file_detected(self):
         """Detect empty documentation files."""
-        docs_dir = self.temp_dir / "skills" / "incidents"
-        docs_dir.mkdir(parents=True)
-        empty_doc = docs_dir / "empty.md"
+        empty_doc = self.temp_dir / "empty.md"
         empty_doc.write_text("")
 
         content = empty_doc.read_text()